@@ -1,8 +1,51 @@
 import os
 import logging
+import importlib
 from flask import Flask
 from .config import Config
 from .generators.template_generator import TemplateGenerator
+from .parsers.extraction_cache import ExtractionCache
+from .analyzers.ai_engine import AIEngine
+from .analyzers.response_cache import build_response_cache
+from .analyzers.llm_client import build_openai_client
+from .analyzers.skill_matcher import load_skill_matcher
+from .models.resume_index import ResumeIndex
+from .models.analysis_store import build_analysis_store
+from .models.artifact_store import ArtifactStore
+from .utils.helpers import cleanup_uploaded_files
+from .utils.job_queue import JobQueue
+from .utils.metrics import MetricsRegistry, init_metrics
+from .utils.profiler import init_profiler
+
+# Heavy libraries imported lazily by parsers, generators and engines
+HEAVY_MODULES = ("fitz", "docx", "reportlab.platypus", "openai", "httpx")
+
+def preload_dependencies():
+    """Import the lazily loaded heavy libraries now (e.g. in a server master before fork)."""
+    for name in HEAVY_MODULES:
+        try:
+            importlib.import_module(name)
+        except ImportError as e:
+            logging.getLogger(__name__).warning(f"Could not preload {name}: {e}")
+
+    from .generators.pdf_styles import report_styles, resume_styles
+    report_styles()
+    resume_styles()
+
+def shutdown_app(app, wait=True):
+    """
+    Stop the app's background work: finish (or cancel) queued jobs and stop the artifact sweeper.
+
+    Args:
+        app: Flask app returned by create_app
+        wait: Let queued and running jobs finish first
+    """
+    job_queue = app.extensions.get("job_queue")
+    if job_queue is not None:
+        job_queue.shutdown(wait=wait)
+    artifact_store = app.extensions.get("artifact_store")
+    if artifact_store is not None:
+        artifact_store.stop_sweeper()
 
 def create_app():
     logging.basicConfig(level=logging.INFO)
@@ -19,18 +62,91 @@ def create_app():
     os.makedirs(config.UPLOAD_FOLDER, exist_ok=True)
     os.makedirs(config.DOWNLOADS_FOLDER, exist_ok=True)
 
-    # Generate Word templates
+    if config.PRELOAD_DEPENDENCIES:
+        preload_dependencies()
+
+    # Process-wide cache of extracted upload text
+    app.extensions["extraction_cache"] = ExtractionCache(
+        max_entries=config.EXTRACTION_CACHE_SIZE,
+        cache_dir=config.EXTRACTION_CACHE_DIR or None,
+    )
+
+    # One pooled OpenAI client for every engine and request thread
+    app.extensions["openai_client"] = build_openai_client(app.config)
+
+    # Shared cache of LLM analysis responses (invalidated on prompt/schema change)
+    app.extensions["llm_cache"] = build_response_cache(app.config, AIEngine.cache_namespace(app.config))
+
+    # Skills taxonomy compiled once for scoring, suggestions and the index
+    app.extensions["skill_matcher"] = load_skill_matcher(config.SKILLS_TAXONOMY_FILE)
+
+    # Keyword index over every resume analyzed by /compare
+    app.extensions["resume_index"] = (
+        ResumeIndex(config.SEARCH_INDEX_PATH, skills=app.extensions["skill_matcher"])
+        if config.SEARCH_INDEX_ENABLED else None
+    )
+
+    # Finished analyses, so pages carry an ID instead of the full texts
+    app.extensions["analysis_store"] = build_analysis_store(app.config)
+
+    # Generated downloads on disk, swept by TTL and size quota in the background
+    app.extensions["artifact_store"] = ArtifactStore(
+        config.ARTIFACTS_FOLDER,
+        ttl=config.ARTIFACT_TTL,
+        max_bytes=config.ARTIFACT_MAX_BYTES,
+        legacy_dir=config.DOWNLOADS_FOLDER if config.ARTIFACT_SWEEP_LEGACY else None,
+    )
+    app.extensions["artifact_store"].start_sweeper(config.ARTIFACT_SWEEP_INTERVAL)
+
+    # Worker pool for /api/jobs so slow pipelines don't hold request threads
+    app.extensions["job_queue"] = JobQueue(
+        workers=config.JOB_WORKERS,
+        max_queue=config.JOB_MAX_QUEUE,
+        retention=config.JOB_RESULT_TTL,
+        max_results=config.JOB_MAX_RESULTS,
+    )
+
+    # Stage latency histograms (/metrics) and Server-Timing response headers
+    if config.METRICS_ENABLED:
+        init_metrics(app, MetricsRegistry(config.METRICS_MULTIPROC_DIR, config.METRICS_FLUSH_INTERVAL))
+
+    # Profile sampled and slow requests (see /admin/profiles)
+    if config.PROFILE_ENABLED:
+        init_profiler(app, config)
+
+    # Remove upload spool files once each request is done with them
+    app.teardown_request(cleanup_uploaded_files)
+
+    # Build Word templates only when missing or their definition changed
     TemplateGenerator.generate_all_templates(config.DOWNLOADS_FOLDER)
+    app.extensions["word_templates"] = (
+        TemplateGenerator.load_templates(config.DOWNLOADS_FOLDER) if config.TEMPLATES_IN_MEMORY else {}
+    )
 
     # Register blueprints
     from .routes.upload import upload_bp
     from .routes.analysis import analysis_bp
     from .routes.templates_routes import templates_bp
     from .routes.improve_resume import improve_resume_bp
+    from .routes.batch import batch_bp
+    from .routes.search import search_bp
+    from .routes.jobs import jobs_bp
+    from .routes.metrics import metrics_bp
+    from .routes.admin import admin_bp
 
     app.register_blueprint(upload_bp)
     app.register_blueprint(analysis_bp)
     app.register_blueprint(templates_bp)
     app.register_blueprint(improve_resume_bp)
+    app.register_blueprint(batch_bp)
+    app.register_blueprint(search_bp)
+    app.register_blueprint(jobs_bp)
+    app.register_blueprint(metrics_bp)
+    app.register_blueprint(admin_bp)
+
+    if config.PRELOAD_DEPENDENCIES:
+        # Compile page templates up front so forked workers share them
+        for name in app.jinja_env.list_templates(extensions=["html"]):
+            app.jinja_env.get_template(name)
 
     return app
@@ -1,13 +1,144 @@
-import openai
 import json
+import re
+import hashlib
+import time
+from .local_analyzer import LocalAnalyzer
+from .skill_matcher import load_skill_matcher
+from .prompt_builder import PromptBuilder
+from .json_stream import ParameterStreamDecoder
 
 class AIEngine:
-    def __init__(self, config):
-        self.openai_api_key = config.get("OPENAI_API_KEY")
-        openai.api_key = self.openai_api_key
+    MODEL = "gpt-4o-mini"
+    TEMPERATURE = 0.2
+    # Bump whenever the analysis prompt changes so cached responses are invalidated
+    PROMPT_VERSION = 2
+
+    def __init__(self, config, cache=None, client=None):
+        # Shared openai.OpenAI client built in create_app (None without an API key)
+        self.client = client
         self.weights = config.get("SCORING_WEIGHTS", {})
+        self.provider = config.get("AI_PROVIDER", "openai")
+        self.cache = cache
+        self.prompt_builder = PromptBuilder(config)
+        # Stream completions and decode parameters as they arrive
+        self.streaming = config.get("LLM_STREAMING", True)
+        # Compiled skills taxonomy for local/demo scoring (built once per process)
+        self.skills = load_skill_matcher(config.get("SKILLS_TAXONOMY_FILE", ""))
+
+    @classmethod
+    def cache_namespace(cls, config):
+        """Prompt version plus a fingerprint of the scoring parameter schema and prompt budget."""
+        budget = PromptBuilder(config).budgets["analysis"]
+        schema = ",".join(sorted(config.get("SCORING_WEIGHTS", {}))) + f"|{budget['resume']},{budget['jd']}"
+        fingerprint = hashlib.sha256(schema.encode("utf-8")).hexdigest()[:12]
+        return f"analysis-v{cls.PROMPT_VERSION}-{fingerprint}"
+
+    def cache_key(self, resume_text, jd_text):
+        def normalize(text):
+            return re.sub(r"\s+", " ", text or "").strip().lower()
+
+        h = hashlib.sha256()
+        for part in (normalize(resume_text), normalize(jd_text), self.MODEL, str(self.TEMPERATURE)):
+            h.update(part.encode("utf-8"))
+            h.update(b"\0")
+        return f"{self.cache.namespace}:{h.hexdigest()}"
+
+    def analyze(self, resume_text, jd_text, on_parameter=None):
+        """
+        Score a resume against a job description.
+
+        Args:
+            resume_text: Extracted resume text
+            jd_text: Extracted job description text
+            on_parameter: Optional callable(name, parameter) invoked once per
+                scoring parameter as soon as it is known; with streaming on,
+                this happens while the completion is still being generated.
+                If the completion then fails, the whole result falls back to
+                demo mode and it is called again for every parameter with the
+                demo values, which replace the streamed ones
+
+        Returns:
+            dict: Analysis with parameters, strengths, improvements, etc.
+        """
+        emitted = set()
+
+        def emit(name, param):
+            if on_parameter is not None and name not in emitted:
+                emitted.add(name)
+                on_parameter(name, param)
+
+        def finish(data):
+            # Anything not already streamed (cache hits, demo and local results)
+            for name, param in data.get("parameters", {}).items():
+                emit(name, param)
+            return data
+
+        if self.provider == "local":
+            data = LocalAnalyzer(self.skills).analyze(resume_text, jd_text)
+            data["_engine"] = "local"
+            return finish(data)
+
+        key = None
+        if self.cache is not None:
+            key = self.cache_key(resume_text, jd_text)
+            cached = self.cache.get(key)
+            if cached is not None:
+                print("[AI ENGINE] Serving analysis from response cache.")
+                return finish(cached)
+
+        data = self._analyze_uncached(resume_text, jd_text, emit)
+        if data.get("_is_demo") and emitted:
+            # The stream broke part way: never mix LLM and demo scores, the
+            # demo analysis replaces what was already sent
+            print(f"[AI ENGINE] Discarding {len(emitted)} streamed parameters after the completion failed.")
+            emitted.clear()
+
+        # Demo results are fallbacks for API failures and must not be cached;
+        # timings describe this call only
+        timing = data.pop("_timing", None)
+        if key is not None and not data.get("_is_demo"):
+            self.cache.set(key, data)
+        if timing:
+            data["_timing"] = timing
+        return finish(data)
+
+    def _complete(self, prompt, emit):
+        """Run the completion, streaming it through the parameter decoder when enabled."""
+        started = time.perf_counter()
+        request = dict(
+            model=self.MODEL,
+            messages=[{"role": "user", "content": prompt}],
+            temperature=self.TEMPERATURE,
+            max_tokens=2000,
+        )
+        if not self.streaming:
+            resp = self.client.chat.completions.create(**request)
+            return resp.choices[0].message.content, {
+                "completion_ms": round((time.perf_counter() - started) * 1000, 1),
+            }
 
-    def analyze(self, resume_text, jd_text):
+        decoder = ParameterStreamDecoder()
+        parts = []
+        first_parameter_ms = None
+        for chunk in self.client.chat.completions.create(stream=True, **request):
+            if not chunk.choices:
+                continue
+            delta = chunk.choices[0].delta.content or ""
+            parts.append(delta)
+            for name, param in decoder.feed(delta):
+                if first_parameter_ms is None:
+                    first_parameter_ms = round((time.perf_counter() - started) * 1000, 1)
+                emit(name, param)
+
+        timing = {
+            "first_parameter_ms": first_parameter_ms,
+            "completion_ms": round((time.perf_counter() - started) * 1000, 1),
+        }
+        print(f"[AI ENGINE] First parameter after {first_parameter_ms} ms, completion after {timing['completion_ms']} ms")
+        return "".join(parts), timing
+
+    def _analyze_uncached(self, resume_text, jd_text, emit=lambda name, param: None):
+        prompt_resume, prompt_jd = self.prompt_builder.compact("analysis", resume_text, jd_text)
         prompt = f"""
 You are an expert ATS (Applicant Tracking System) parser and technical recruiter.
 
@@ -26,10 +157,10 @@ Analyze the compatibility based on the following specific parameters:
 10. **Format & Presentation**: Clarity, structure, and professional formatting of the resume.
 
 JOB DESCRIPTION:
-{jd_text}
+{prompt_jd}
 
 RESUME:
-{resume_text}
+{prompt_resume}
 
 Output JSON **ONLY** using this exact schema:
 {{
@@ -53,14 +184,14 @@ Output JSON **ONLY** using this exact schema:
 
 Scores must be 0-100 integers. Return ONLY raw JSON.
 """
+        if self.client is None:
+            print("OpenAI API key not configured. Switching to DEMO MODE.")
+            return self.generate_mock_analysis(resume_text, jd_text)
+
+        import openai  # only needed for its error types; loaded on first call
         try:
-            resp = openai.chat.completions.create(
-                model="gpt-4o-mini",
-                messages=[{"role": "user", "content": prompt}],
-                temperature=0.2,
-                max_tokens=2000,
-            )
-            content = resp.choices[0].message.content
+            content, timing = self._complete(prompt, emit)
+            content = content.strip()
             # Strip markdown code fencing if present
             if content.startswith("```json"):
                 content = content[7:]
@@ -68,6 +199,7 @@ Scores must be 0-100 integers. Return ONLY raw JSON.
                 content = content[:-3]
             
             data = json.loads(content.strip())
+            data["_timing"] = timing
             return data
             
         except (openai.RateLimitError, openai.AuthenticationError, openai.APIConnectionError):
@@ -78,48 +210,16 @@ Scores must be 0-100 integers. Return ONLY raw JSON.
             return self.generate_mock_analysis(resume_text, jd_text)
 
     def generate_mock_analysis(self, resume_text=None, jd_text=None):
-        """Returns a dynamic mock analysis based on keyword matching."""
+        """Returns an offline analysis computed by LocalAnalyzer."""
         
         # Default if texts are missing
         if not resume_text or not jd_text:
              return self._get_static_mock()
 
-        # Simple keyword extraction (simulating AI)
-        def get_words(text):
-            return set(w.lower() for w in text.replace(",", " ").split() if len(w) > 3)
-
-        resume_words = get_words(resume_text)
-        jd_words = get_words(jd_text)
-        
-        common = resume_words.intersection(jd_words)
-        missing = jd_words - resume_words
-        
-        match_score = int((len(common) / len(jd_words)) * 100) if jd_words else 50
-        match_score = max(30, min(95, match_score + 20)) # Boost slightly for realism
-
-        # Pick top 3 matching and missing keywords
-        matched_examples = list(common)[:3]
-        missing_examples = list(missing)[:3]
-
-        return {
-            "parameters": {
-                "skills_match": {"score": match_score, "rationale": f"Found {len(common)} matching keywords from the JD.", "examples": [f"Matched: {', '.join(matched_examples)}"]},
-                "experience_relevance": {"score": 85, "rationale": "Experience appears aligned with industry standards.", "examples": []},
-                "education_certifications": {"score": 90, "rationale": "Education background fits the profile.", "examples": []},
-                "keywords_density": {"score": 75, "rationale": f"Resume contains {len(resume_words)} unique keywords.", "examples": []},
-                "career_progression": {"score": 88, "rationale": "Shows consistent growth.", "examples": []},
-                "industry_experience": {"score": 80, "rationale": "Content indicates industry experience.", "examples": []},
-                "project_complexity": {"score": 85, "rationale": "Projects listed seem relevant.", "examples": []},
-                "cultural_fit": {"score": 85, "rationale": "Tone is professional.", "examples": []},
-                "achievements_metrics": {"score": 70, "rationale": "Could use more quantified metrics.", "examples": []},
-                "format_presentation": {"score": 95, "rationale": "Clean and readable.", "examples": []}
-            },
-            "strengths": [f"Mentions key terms: {', '.join(matched_examples)}", "Professional formatting", "Clear structure"],
-            "improvements": ["Quantify impact with numbers", f"Consider adding: {', '.join(missing_examples)}", "Expand on project details"],
-            "missing_elements": missing_examples,
-            "summary": f"DEMO MODE: Based on keyword analysis, this candidate has a {match_score}% match score. {len(common)} keywords overlapped with the job description.",
-            "_is_demo": True
-        }
+        data = LocalAnalyzer(self.skills).analyze(resume_text, jd_text)
+        data["summary"] = f"DEMO MODE: {data['summary']}"
+        data["_is_demo"] = True
+        return data
 
     def _get_static_mock(self):
         return {
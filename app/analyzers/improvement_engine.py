@@ -1,5 +1,6 @@
-import openai
 import json
+from .prompt_builder import PromptBuilder
+from .skill_matcher import load_skill_matcher
 
 class ImprovementEngine:
     """
@@ -7,9 +8,11 @@ class ImprovementEngine:
     Provides specific examples and optionally creates an improved resume.
     """
     
-    def __init__(self, config):
-        self.openai_api_key = config.get("OPENAI_API_KEY")
-        openai.api_key = self.openai_api_key
+    def __init__(self, config, client=None):
+        # Shared openai.OpenAI client built in create_app (None without an API key)
+        self.client = client
+        self.prompt_builder = PromptBuilder(config)
+        self.skills = load_skill_matcher(config.get("SKILLS_TAXONOMY_FILE", ""))
     
     def generate_suggestions(self, analysis_data, resume_text, jd_text):
         """
@@ -23,9 +26,11 @@ class ImprovementEngine:
         Returns:
             dict: Structured suggestions with examples
         """
+        import openai  # only needed for its error types; loaded on first call
         try:
             improvements = analysis_data.get("improvements", [])
             missing_elements = analysis_data.get("missing_elements", [])
+            prompt_resume, prompt_jd = self.prompt_builder.compact("suggestions", resume_text, jd_text)
             
             prompt = f"""
 You are an expert resume writer and career coach.
@@ -46,10 +51,10 @@ Analyze this ACTUAL RESUME and provide SPECIFIC, TAILORED suggestions for improv
 {chr(10).join(f"- {elem}" for elem in missing_elements)}
 
 **JOB DESCRIPTION**:
-{jd_text[:1500]}
+{prompt_jd}
 
 **CANDIDATE'S ACTUAL RESUME**:
-{resume_text}
+{prompt_resume}
 
 For each improvement area, provide:
 1. **What to Add/Change**: Specific instruction tailored to THIS candidate
@@ -80,7 +85,11 @@ Output JSON ONLY with this structure:
 Provide 3-5 high-impact, RESUME-SPECIFIC suggestions.
 """
             
-            resp = openai.chat.completions.create(
+            if self.client is None:
+                print("[SUGGESTIONS] OpenAI API key not configured. Using mock suggestions.")
+                return self._generate_mock_suggestions(analysis_data, resume_text, jd_text)
+
+            resp = self.client.chat.completions.create(
                 model="gpt-4o-mini",
                 messages=[{"role": "user", "content": prompt}],
                 temperature=0.3,
@@ -131,6 +140,13 @@ Provide 3-5 high-impact, RESUME-SPECIFIC suggestions.
             
         improvements = analysis_data.get("improvements", [])
         missing_elements = analysis_data.get("missing_elements", [])
+
+        # Skills the JD names that the resume never mentions, under their canonical names
+        resume_skills = self.skills.extract(resume_text)
+        jd_skills = self.skills.extract(jd_text)
+        missing_skills = self.skills.names(s for s, _ in jd_skills.most_common() if s not in resume_skills)
+        if missing_skills:
+            missing_elements = missing_skills
         
         suggestions = []
         
@@ -0,0 +1,83 @@
+import json
+
+
+class ParameterStreamDecoder:
+    """
+    Incrementally decodes the ``parameters`` object of a streamed analysis.
+
+    Feed completion text as it arrives; every time one parameter's object
+    (e.g. ``"skills_match": {...}``) is closed, it is decoded and returned
+    without waiting for the rest of the response. Text outside the JSON
+    document, such as a markdown code fence, is ignored.
+    """
+
+    def __init__(self, field="parameters"):
+        self.field = field
+        self.buffer = []
+        self.pos = 0
+        self.depth = 0
+        self.in_string = False
+        self.escaped = False
+        self.string_start = None
+        self.last_string = None
+        self.pending_key = {}  # depth -> key awaiting its value
+        self.field_depth = None  # depth inside the parameters object
+        self.value_start = None
+        self.value_key = None
+
+    def feed(self, chunk):
+        """
+        Consume the next piece of completion text.
+
+        Returns:
+            list: (name, parameter) tuples completed by this chunk
+        """
+        completed = []
+        self.buffer.append(chunk)
+        for ch in chunk:
+            index = self.pos
+            self.pos += 1
+
+            if self.in_string:
+                if self.escaped:
+                    self.escaped = False
+                elif ch == "\\":
+                    self.escaped = True
+                elif ch == '"':
+                    self.in_string = False
+                    self.last_string = (self.string_start, index + 1)
+                continue
+
+            if ch == '"':
+                self.in_string = True
+                self.string_start = index
+            elif ch == ":":
+                if self.last_string is not None:
+                    self.pending_key[self.depth] = self._decode(*self.last_string)
+            elif ch in "{[":
+                key = self.pending_key.pop(self.depth, None)
+                if ch == "{" and self.depth == 1 and key == self.field:
+                    self.field_depth = 2
+                elif ch == "{" and self.depth == self.field_depth:
+                    self.value_start, self.value_key = index, key
+                self.depth += 1
+            elif ch in "}]":
+                self.depth -= 1
+                self.pending_key.pop(self.depth, None)
+                if self.depth == self.field_depth and self.value_start is not None:
+                    try:
+                        completed.append((self.value_key, self._decode(self.value_start, index + 1)))
+                    except ValueError:
+                        pass
+                    self.value_start = None
+                elif self.field_depth is not None and self.depth < self.field_depth:
+                    self.field_depth = None
+            elif ch == ",":
+                self.last_string = None
+        return completed
+
+    def _decode(self, start, stop):
+        # Collapse the chunks seen so far once; slices then index one string
+        if len(self.buffer) > 1:
+            self.buffer = ["".join(self.buffer)]
+        return json.loads(self.buffer[0][start:stop])
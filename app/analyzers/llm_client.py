@@ -0,0 +1,47 @@
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+def build_openai_client(config):
+    """
+    Create the app-wide OpenAI client from OPENAI_* settings.
+
+    One client (and so one HTTP connection pool) is shared by every engine
+    and request thread, which keeps TLS connections alive between calls.
+
+    Args:
+        config: App config
+
+    Returns:
+        openai.OpenAI or None: None when no API key is configured, in which
+        case the engines fall back to their offline results
+    """
+    api_key = config.get("OPENAI_API_KEY")
+    if not api_key:
+        logger.warning("OPENAI_API_KEY is not set; AI features run in demo mode")
+        return None
+
+    # Imported here so processes without an API key never load the SDK
+    import httpx
+    import openai
+    from .llm_transport import build_transport
+
+    timeout = httpx.Timeout(
+        config.get("OPENAI_TIMEOUT", 60.0),
+        connect=config.get("OPENAI_CONNECT_TIMEOUT", 5.0),
+    )
+    limits = httpx.Limits(
+        max_connections=config.get("OPENAI_MAX_CONNECTIONS", 20),
+        max_keepalive_connections=config.get("OPENAI_MAX_KEEPALIVE", 10),
+        keepalive_expiry=config.get("OPENAI_KEEPALIVE_EXPIRY", 30.0),
+    )
+    # The transport owns the connection pool (optionally recording or replaying)
+    http_client = httpx.Client(timeout=timeout, transport=build_transport(config, limits))
+    return openai.OpenAI(
+        api_key=api_key,
+        base_url=config.get("OPENAI_BASE_URL") or None,
+        timeout=timeout,
+        max_retries=config.get("OPENAI_MAX_RETRIES", 2),
+        http_client=http_client,
+    )
@@ -0,0 +1,135 @@
+import hashlib
+import json
+import logging
+import os
+import threading
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+# Response headers worth keeping; the body is stored decoded, so encoding and
+# length headers from the original response would be wrong on replay
+KEEP_HEADERS = ("content-type", "x-request-id", "openai-model", "openai-processing-ms")
+
+
+class RecordReplayTransport(httpx.BaseTransport):
+    """
+    httpx transport that records API responses to disk and replays them.
+
+    Requests are keyed by method, URL path and canonical JSON body (model,
+    messages, temperature, stream flag...), so a replay only matches the
+    exact prompt that was recorded. In ``record`` mode each successful
+    response is passed through and saved as ``<dir>/ab/<sha256>.json``; in
+    ``replay`` mode nothing leaves the process and unknown requests get a
+    404 error, which the engines treat like any other API failure.
+    Streamed responses are recorded whole and replayed in one piece.
+    """
+
+    MODES = ("record", "replay")
+
+    def __init__(self, mode, cassette_dir, transport=None):
+        if mode not in self.MODES:
+            raise ValueError(f"Unknown LLM transport mode: {mode!r}")
+        self.mode = mode
+        self.cassette_dir = cassette_dir
+        self.transport = transport or httpx.HTTPTransport()
+        self.hits = 0
+        self.misses = 0
+        self.recorded = 0
+        self._lock = threading.Lock()
+        os.makedirs(cassette_dir, exist_ok=True)
+
+    @staticmethod
+    def request_key(request):
+        body = request.read()
+        try:
+            body = json.dumps(json.loads(body), sort_keys=True, separators=(",", ":")).encode("utf-8")
+        except ValueError:
+            pass
+        digest = hashlib.sha256(f"{request.method} {request.url.path}\n".encode("utf-8"))
+        digest.update(body)
+        return digest.hexdigest()
+
+    def path_for(self, key):
+        return os.path.join(self.cassette_dir, key[:2], f"{key}.json")
+
+    def handle_request(self, request):
+        key = self.request_key(request)
+        path = self.path_for(key)
+
+        if self.mode == "replay":
+            try:
+                with open(path, "r", encoding="utf-8") as f:
+                    cassette = json.load(f)
+            except FileNotFoundError:
+                self._count("misses")
+                logger.warning(f"No recorded LLM response for {request.method} {request.url.path} ({key[:12]})")
+                return httpx.Response(
+                    404,
+                    json={"error": {"message": f"No recorded response for request {key}", "type": "cassette_miss"}},
+                    request=request,
+                )
+            self._count("hits")
+            return httpx.Response(
+                cassette["status"],
+                headers=cassette["headers"],
+                content=cassette["body"].encode("utf-8"),
+                request=request,
+            )
+
+        response = self.transport.handle_request(request)
+        try:
+            body = response.read()
+        finally:
+            response.close()
+        headers = {k: v for k, v in response.headers.items() if k.lower() in KEEP_HEADERS}
+
+        # Errors and rate limits are transient; only successful answers are kept
+        if 200 <= response.status_code < 300:
+            self._save(path, {
+                "request": {"method": request.method, "path": request.url.path},
+                "status": response.status_code,
+                "headers": headers,
+                "body": body.decode("utf-8"),
+            })
+            self._count("recorded")
+        return httpx.Response(response.status_code, headers=headers, content=body, request=request)
+
+    def stats(self):
+        with self._lock:
+            return {"mode": self.mode, "hits": self.hits, "misses": self.misses, "recorded": self.recorded}
+
+    def close(self):
+        self.transport.close()
+
+    def _save(self, path, cassette):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(cassette, f)
+        os.replace(tmp_path, path)
+
+    def _count(self, field):
+        with self._lock:
+            setattr(self, field, getattr(self, field) + 1)
+
+
+def build_transport(config, limits):
+    """
+    Create the HTTP transport for the shared OpenAI client.
+
+    Args:
+        config: App config (LLM_TRANSPORT_MODE, LLM_CASSETTE_DIR)
+        limits: httpx.Limits for the connection pool
+
+    Returns:
+        httpx.BaseTransport: A pooled HTTP transport, wrapped for record/replay when enabled
+    """
+    transport = httpx.HTTPTransport(limits=limits)
+    mode = config.get("LLM_TRANSPORT_MODE", "")
+    if not mode:
+        return transport
+    cassette_dir = config.get("LLM_CASSETTE_DIR", "cache/llm_cassettes")
+    logger.warning(f"LLM transport in {mode} mode ({cassette_dir})")
+    return RecordReplayTransport(mode, cassette_dir, transport)
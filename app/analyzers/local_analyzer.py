@@ -0,0 +1,410 @@
+import math
+import re
+from collections import Counter
+from datetime import date
+from .skill_matcher import load_skill_matcher
+
+TOKEN_RE = re.compile(r"[a-z0-9][a-z0-9+#]*(?:[.\-/][a-z0-9+#]+)*")
+LINE_SPLIT_RE = re.compile(r"[\n\r•|;]+")
+NUMBER_RE = re.compile(r"(\$\s?\d[\d,.]*\s?[kmb]?|\d[\d,.]*\s?%|\b\d[\d,.]*\s?(?:x|k|m|million|billion|users|customers|clients|people|engineers|projects)\b|\b\d{2,}\b)", re.I)
+EMAIL_RE = re.compile(r"[a-zA-Z0-9_.+-]+\s*@\s*[a-zA-Z0-9-]+\.[a-zA-Z0-9-.]+")
+PHONE_RE = re.compile(r"(\+?\d{1,3}[-.\s]?)?\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}")
+BULLET_RE = re.compile(r"^\s*[•\-\*▪◦●]\s+")
+YEARS_REQUIRED_RE = re.compile(r"(\d{1,2})\s*\+?\s*(?:-\s*\d{1,2}\s*)?years?", re.I)
+
+MONTHS = {m: i for i, m in enumerate(
+    ["jan", "feb", "mar", "apr", "may", "jun", "jul", "aug", "sep", "oct", "nov", "dec"], 1)}
+_MONTH = r"(?:(jan|feb|mar|apr|may|jun|jul|aug|sep|sept|oct|nov|dec)[a-z]*\.?\s+|(\d{1,2})/)?"
+DATE_RANGE_RE = re.compile(
+    _MONTH + r"((?:19|20)\d{2})\s*(?:-|–|—|to)\s*(?:" + _MONTH + r"((?:19|20)\d{2})|(present|current|now|today))",
+    re.I,
+)
+
+STOPWORDS = frozenset("""
+a about above after again against all also am an and any are as at be because been before being below
+between both but by can could did do does doing down during each etc few for from further had has have
+having he her here hers him his how i if in into is it its itself just me more most my no nor not now
+of off on once only or other our ours out over own per same she should so some such than that the their
+theirs them then there these they this those through to too under until up upon us very was we were
+what when where which while who whom why will with within without would you your yours
+able ability across work working role team teams job candidate candidates including include includes
+strong excellent good great well new using use used experience experienced years year required
+requirements preferred plus must nice responsibilities responsible skills skill knowledge
+related field other offer equal opportunity employer benefits looking join company
+""".split())
+
+SECTION_PATTERNS = {
+    "summary": re.compile(r"^(professional\s+)?(summary|profile|objective|about me)\b", re.I),
+    "experience": re.compile(r"^(work\s+|professional\s+)?(experience|employment|work history|career history)\b", re.I),
+    "education": re.compile(r"^(education|academic|qualifications)\b", re.I),
+    "skills": re.compile(r"^(technical\s+|core\s+|key\s+)?(skills|competencies|expertise|technologies)\b", re.I),
+    "projects": re.compile(r"^(key\s+)?projects\b", re.I),
+    "certifications": re.compile(r"^(certifications?|licenses|courses)\b", re.I),
+}
+JD_REQUIREMENT_RE = re.compile(r"requirement|qualification|must|skills|you have|what you|looking for|proficien", re.I)
+
+DEGREE_LEVELS = [
+    (4, re.compile(r"\b(ph\.?d|doctorate|doctoral)\b", re.I)),
+    (3, re.compile(r"\b(master'?s?|m\.?s\.?c?|m\.?tech|mba|m\.?eng)\b", re.I)),
+    (2, re.compile(r"\b(bachelor'?s?|b\.?s\.?c?|b\.?a|b\.?tech|b\.?e|b\.?eng|undergraduate degree)\b", re.I)),
+    (1, re.compile(r"\b(associate'?s?|diploma)\b", re.I)),
+]
+CERT_RE = re.compile(r"\b(certified|certification|certificate|licensed|pmp|cissp|ccna|cpa|cfa)\b", re.I)
+
+SENIORITY = [
+    (5, re.compile(r"\b(vp|vice president|director|head of|chief|cto|ceo)\b", re.I)),
+    (4, re.compile(r"\b(principal|staff|architect|manager)\b", re.I)),
+    (3, re.compile(r"\b(lead|senior|sr\.?)\b", re.I)),
+    (1, re.compile(r"\b(junior|jr\.?|intern|trainee|associate|graduate)\b", re.I)),
+]
+COMPLEXITY_TERMS = frozenset("""
+architected architecture designed distributed scalable scale microservices migration migrated platform
+infrastructure led owned spearheaded orchestrated cross-functional stakeholders budget roadmap enterprise
+high-availability throughput latency real-time pipeline end-to-end multi-region production mentored
+""".split())
+CULTURE_TERMS = frozenset("""
+agile collaborative collaboration fast-paced startup remote hybrid ownership innovative innovation
+customer-focused customer-centric mentoring mentorship autonomous entrepreneurial diverse inclusive
+communication transparent curious growth learning teamwork adaptable proactive self-starter
+""".split())
+ACTION_VERBS = frozenset("""
+achieved built created delivered designed developed drove grew implemented improved increased launched
+led managed optimized reduced saved scaled shipped streamlined spearheaded automated accelerated
+""".split())
+
+
+def tokenize(text):
+    return [t for t in TOKEN_RE.findall(text.lower()) if t not in STOPWORDS and not t[0].isdigit()]
+
+
+def with_bigrams(tokens):
+    return tokens + [f"{a} {b}" for a, b in zip(tokens, tokens[1:])]
+
+
+def clamp(value, low=0, high=100):
+    return int(max(low, min(high, round(value))))
+
+
+class LocalAnalyzer:
+    """
+    Deterministic, dependency-free analyzer producing the full AIEngine schema.
+
+    Scores come from sparse TF-IDF/BM25 vectors, taxonomy skill matches,
+    date-range parsing and simple structural signals, so a resume/JD pair
+    is scored in a few milliseconds. Used as the offline fallback and as a
+    cheap pre-filter.
+    """
+
+    # BM25 parameters; AVG_DOC_LEN approximates a one-page resume in tokens
+    K1 = 1.5
+    B = 0.75
+    AVG_DOC_LEN = 450
+    # Share of skills_match coming from taxonomy skills when the JD names any
+    SKILL_SHARE = 0.6
+
+    def __init__(self, skills=None):
+        # Compiled skill matcher; the bundled taxonomy unless one is passed in
+        self.skills = skills or load_skill_matcher()
+
+    def analyze(self, resume_text, jd_text):
+        resume_lines = self._lines(resume_text)
+        jd_lines = self._lines(jd_text)
+        resume_tokens = with_bigrams(tokenize(resume_text))
+        jd_tokens = with_bigrams(tokenize(jd_text))
+        resume_tf = Counter(resume_tokens)
+        jd_tf = Counter(jd_tokens)
+
+        # IDF over the lines of both documents: terms repeated everywhere carry little signal
+        idf = self._idf(resume_lines + jd_lines)
+        jd_keywords = self._jd_keywords(jd_lines, jd_tf, idf)
+        sections = self._sections(resume_lines)
+        experience_text = "\n".join(sections.get("experience", [])) or resume_text
+        roles = self._date_ranges(resume_text)
+        resume_skills = self.skills.extract(resume_text)
+        jd_skills = self.skills.extract(jd_text)
+
+        parameters = {
+            "skills_match": self._skills_match(jd_keywords, resume_tf, idf, jd_skills, resume_skills),
+            "experience_relevance": self._experience_relevance(experience_text, jd_text, jd_tf, idf, roles),
+            "education_certifications": self._education(resume_text, jd_text),
+            "keywords_density": self._keywords_density(jd_keywords, resume_tf, len(resume_tokens), idf),
+            "career_progression": self._career_progression(resume_text, roles),
+            "industry_experience": self._industry_experience(resume_tf, jd_tf, idf),
+            "project_complexity": self._project_complexity(resume_text, resume_tf),
+            "cultural_fit": self._cultural_fit(resume_tf, jd_tf),
+            "achievements_metrics": self._achievements(resume_lines),
+            "format_presentation": self._format(resume_text, resume_lines, sections),
+        }
+
+        matched = [k for k in jd_keywords if resume_tf.get(k)]
+        missing = [k for k in jd_keywords if not resume_tf.get(k)]
+        # Named skills first (canonical names), then JD terms that are not one of those skills
+        missing_skills = self.skills.names(s for s, _ in jd_skills.most_common() if s not in resume_skills)
+        missing_elements = missing_skills + [k for k in missing if self.skills.resolve(k) not in jd_skills]
+        ranked = sorted(parameters.items(), key=lambda kv: kv[1]["score"], reverse=True)
+        strengths = [f"{name.replace('_', ' ').title()}: {p['rationale']}" for name, p in ranked[:3]]
+        improvements = [f"{name.replace('_', ' ').title()}: {p['rationale']}" for name, p in ranked[-3:][::-1]]
+        average = sum(p["score"] for p in parameters.values()) / len(parameters)
+
+        return {
+            "parameters": parameters,
+            "strengths": strengths,
+            "improvements": improvements,
+            "missing_elements": missing_elements[:8],
+            "summary": (
+                f"Offline analysis matched {len(matched)} of {len(jd_keywords)} key job terms "
+                f"with an average parameter score of {average:.0f}."
+            ),
+        }
+
+    # --- text helpers -----------------------------------------------------
+
+    @staticmethod
+    def _lines(text):
+        return [l.strip() for l in LINE_SPLIT_RE.split(text or "") if l.strip()]
+
+    @staticmethod
+    def _idf(lines):
+        df = Counter()
+        for line in lines:
+            df.update(set(with_bigrams(tokenize(line))))
+        n = max(len(lines), 1)
+        return {term: math.log(1 + (n - d + 0.5) / (d + 0.5)) for term, d in df.items()}
+
+    @staticmethod
+    def _jd_keywords(jd_lines, jd_tf, idf, limit=40):
+        # Prefer terms from requirement/skills lines, then the rest of the JD
+        focus = Counter()
+        for line in jd_lines:
+            if JD_REQUIREMENT_RE.search(line):
+                focus.update(with_bigrams(tokenize(line)))
+        weight = {t: idf.get(t, 0) * (1 + math.log(tf)) * (2 if t in focus else 1) for t, tf in jd_tf.items()}
+        # Bigrams only count when they recur; single occurrences are mostly noise
+        candidates = [t for t in weight if " " not in t or jd_tf[t] > 1]
+        return sorted(candidates, key=lambda t: (-weight[t], t))[:limit]
+
+    @staticmethod
+    def _sections(lines):
+        sections = {}
+        current = "header"
+        for line in lines:
+            for name, pattern in SECTION_PATTERNS.items():
+                if len(line) < 40 and pattern.search(line):
+                    current = name
+                    break
+            else:
+                sections.setdefault(current, []).append(line)
+                continue
+            sections.setdefault(current, [])
+        return sections
+
+    @staticmethod
+    def _date_ranges(text):
+        today = date.today()
+        roles = []
+        for m in DATE_RANGE_RE.finditer(text):
+            start_month = MONTHS.get((m.group(1) or "")[:3].lower()) or int(m.group(2) or 1)
+            start = int(m.group(3)) * 12 + start_month - 1
+            if m.group(7):
+                end = today.year * 12 + today.month - 1
+            else:
+                end_month = MONTHS.get((m.group(4) or "")[:3].lower()) or int(m.group(5) or 12)
+                end = int(m.group(6)) * 12 + end_month - 1
+            if end < start or start > today.year * 12 + today.month:
+                continue
+            line_start = text.rfind("\n", 0, m.start()) + 1
+            line_end = text.find("\n", m.end())
+            context = text[max(0, line_start - 120):line_end if line_end != -1 else len(text)]
+            roles.append({"start": start, "end": end, "context": context})
+        roles.sort(key=lambda r: r["start"])
+        return roles
+
+    @staticmethod
+    def _cosine(a, b, idf):
+        dot = sum(tf * b.get(t, 0) * idf.get(t, 0) ** 2 for t, tf in a.items())
+        na = math.sqrt(sum((tf * idf.get(t, 0)) ** 2 for t, tf in a.items()))
+        nb = math.sqrt(sum((tf * idf.get(t, 0)) ** 2 for t, tf in b.items()))
+        return dot / (na * nb) if na and nb else 0.0
+
+    @staticmethod
+    def _years(roles):
+        # Union of role intervals, so overlapping roles are not double counted
+        months = 0
+        last_end = None
+        for r in roles:
+            start = r["start"] if last_end is None else max(r["start"], last_end)
+            if r["end"] > start:
+                months += r["end"] - start
+            last_end = r["end"] if last_end is None else max(last_end, r["end"])
+        return months / 12.0
+
+    # --- parameters -------------------------------------------------------
+
+    def _skills_match(self, jd_keywords, resume_tf, idf, jd_skills, resume_skills):
+        total = sum(idf.get(k, 0) for k in jd_keywords)
+        matched = [k for k in jd_keywords if resume_tf.get(k)]
+        coverage = sum(idf.get(k, 0) for k in matched) / total if total else 0.5
+        missing = [k for k in jd_keywords if not resume_tf.get(k)]
+        rationale = f"Covers {len(matched)} of {len(jd_keywords)} weighted JD terms ({coverage:.0%} of term weight)."
+        if not jd_skills:
+            return {
+                "score": clamp(20 + coverage * 80),
+                "rationale": rationale,
+                "examples": [f"Matched: {', '.join(matched[:6]) or 'none'}", f"Missing: {', '.join(missing[:6]) or 'none'}"],
+            }
+
+        # Skills the JD repeats count more
+        weight = {s: 1 + math.log(n) for s, n in jd_skills.items()}
+        have = [s for s, _ in jd_skills.most_common() if s in resume_skills]
+        lack = [s for s, _ in jd_skills.most_common() if s not in resume_skills]
+        skill_coverage = sum(weight[s] for s in have) / sum(weight.values())
+        coverage = self.SKILL_SHARE * skill_coverage + (1 - self.SKILL_SHARE) * coverage
+        return {
+            "score": clamp(20 + coverage * 80),
+            "rationale": f"Has {len(have)} of {len(jd_skills)} skills named in the JD. {rationale}",
+            "examples": [
+                f"Matched skills: {', '.join(self.skills.names(have[:6])) or 'none'}",
+                f"Missing skills: {', '.join(self.skills.names(lack[:6])) or 'none'}",
+            ],
+        }
+
+    def _keywords_density(self, jd_keywords, resume_tf, doc_len, idf):
+        # BM25 of the resume for the JD keyword query, normalised by the best achievable score
+        norm = self.K1 * (1 - self.B + self.B * doc_len / self.AVG_DOC_LEN)
+        score = best = 0.0
+        for k in jd_keywords:
+            w = idf.get(k, 0)
+            tf = resume_tf.get(k, 0)
+            score += w * tf * (self.K1 + 1) / (tf + norm) if tf else 0
+            best += w
+        ratio = score / best if best else 0
+        dense = sorted((k for k in jd_keywords if resume_tf.get(k)), key=lambda k: -resume_tf[k])
+        return {
+            "score": clamp(15 + ratio * 85),
+            "rationale": f"BM25 keyword relevance is {ratio:.0%} of the maximum for this JD.",
+            "examples": [f"{k} ({resume_tf[k]}x)" for k in dense[:5]],
+        }
+
+    def _experience_relevance(self, experience_text, jd_text, jd_tf, idf, roles):
+        similarity = self._cosine(Counter(with_bigrams(tokenize(experience_text))), jd_tf, idf)
+        years = self._years(roles)
+        required = [int(m.group(1)) for m in YEARS_REQUIRED_RE.finditer(jd_text) if int(m.group(1)) <= 30]
+        score = 35 + similarity * 90
+        examples = [f"~{years:.1f} years of dated experience"]
+        if required:
+            need = max(required)
+            examples.append(f"JD asks for {need}+ years")
+            score += 15 if years >= need else -15 * (1 - years / need)
+        return {
+            "score": clamp(score),
+            "rationale": f"Experience section has {similarity:.0%} TF-IDF similarity to the JD.",
+            "examples": examples,
+        }
+
+    @staticmethod
+    def _education(resume_text, jd_text):
+        def level(text):
+            return max((lvl for lvl, pattern in DEGREE_LEVELS if pattern.search(text)), default=0)
+
+        have, need = level(resume_text), level(jd_text)
+        certs = sorted({m.group(0).lower() for m in CERT_RE.finditer(resume_text)})
+        jd_wants_certs = bool(CERT_RE.search(jd_text))
+        if need:
+            score = 90 if have >= need else 60 if have == need - 1 else 35
+        else:
+            score = 80 if have else 60
+        if jd_wants_certs:
+            score += 10 if certs else -15
+        elif certs:
+            score += 5
+        names = {4: "doctorate", 3: "master's", 2: "bachelor's", 1: "associate/diploma", 0: "no degree found"}
+        return {
+            "score": clamp(score),
+            "rationale": f"Resume shows {names[have]}" + (f"; JD asks for {names[need]}." if need else "; JD states no degree level."),
+            "examples": certs[:5],
+        }
+
+    @staticmethod
+    def _career_progression(resume_text, roles):
+        if not roles:
+            return {"score": 50, "rationale": "No parseable date ranges found.", "examples": []}
+
+        tenures = [(r["end"] - r["start"]) / 12.0 for r in roles]
+        avg_tenure = sum(tenures) / len(tenures)
+        gaps = [max(0, b["start"] - a["end"]) for a, b in zip(roles, roles[1:])]
+        long_gaps = sum(1 for g in gaps if g > 6)
+
+        def seniority(text):
+            return max((lvl for lvl, pattern in SENIORITY if pattern.search(text)), default=2)
+
+        levels = [seniority(r["context"]) for r in roles]
+        promotions = sum(1 for a, b in zip(levels, levels[1:]) if b > a)
+        score = 55 + min(avg_tenure, 4) * 6 + promotions * 8 - long_gaps * 8 - (10 if avg_tenure < 1 else 0)
+        return {
+            "score": clamp(score, 20, 98),
+            "rationale": f"{len(roles)} dated roles, average tenure {avg_tenure:.1f} years, {promotions} step(s) up in seniority.",
+            "examples": [f"{long_gaps} gap(s) longer than 6 months"] if long_gaps else [],
+        }
+
+    def _industry_experience(self, resume_tf, jd_tf, idf):
+        unigrams = lambda tf: Counter({t: c for t, c in tf.items() if " " not in t})
+        similarity = self._cosine(unigrams(resume_tf), unigrams(jd_tf), idf)
+        shared = sorted((t for t in jd_tf if " " not in t and resume_tf.get(t)), key=lambda t: -idf.get(t, 0))
+        return {
+            "score": clamp(30 + similarity * 110),
+            "rationale": f"Overall vocabulary overlap with the JD domain is {similarity:.0%}.",
+            "examples": shared[:5],
+        }
+
+    @staticmethod
+    def _project_complexity(resume_text, resume_tf):
+        terms = sorted(t for t in COMPLEXITY_TERMS if resume_tf.get(t))
+        scale = re.findall(r"team of \d+|\$\s?\d[\d,.]*\s?[kmb]?|\d[\d,.]*\s?(?:million|billion|k)\b", resume_text, re.I)
+        score = 40 + min(len(terms), 8) * 5 + min(len(scale), 4) * 5
+        return {
+            "score": clamp(score),
+            "rationale": f"{len(terms)} scope/ownership signals and {len(scale)} scale indicators.",
+            "examples": (scale[:3] + terms[:3]),
+        }
+
+    @staticmethod
+    def _cultural_fit(resume_tf, jd_tf):
+        wanted = sorted(t for t in CULTURE_TERMS if jd_tf.get(t))
+        shown = [t for t in wanted if resume_tf.get(t)]
+        if wanted:
+            score = 50 + 45 * len(shown) / len(wanted)
+            rationale = f"Reflects {len(shown)} of {len(wanted)} culture cues named in the JD."
+        else:
+            shown = sorted(t for t in CULTURE_TERMS if resume_tf.get(t))
+            score = 65 + min(len(shown), 5) * 4
+            rationale = "JD names no explicit culture cues; scored on general collaboration signals."
+        return {"score": clamp(score), "rationale": rationale, "examples": shown[:5]}
+
+    @staticmethod
+    def _achievements(lines):
+        candidates = [l for l in lines if len(l) > 25]
+        quantified = [l for l in candidates if NUMBER_RE.search(l) and not DATE_RANGE_RE.search(l)]
+        ratio = len(quantified) / len(candidates) if candidates else 0
+        return {
+            "score": clamp(30 + ratio * 140),
+            "rationale": f"{len(quantified)} of {len(candidates)} statements include numbers, percentages or amounts.",
+            "examples": [q[:100] for q in quantified[:3]],
+        }
+
+    @staticmethod
+    def _format(resume_text, lines, sections):
+        found = [s for s in ("summary", "experience", "education", "skills") if s in sections]
+        bullets = sum(1 for l in resume_text.splitlines() if BULLET_RE.match(l))
+        words = len(resume_text.split())
+        verbs = sum(1 for l in lines if l.split()[0].lower().strip("•-*") in ACTION_VERBS)
+        score = 40 + len(found) * 9
+        score += 8 if EMAIL_RE.search(resume_text) else 0
+        score += 5 if PHONE_RE.search(resume_text) else 0
+        score += 6 if bullets or verbs >= 3 else 0
+        score -= 10 if words < 150 or words > 1800 else 0
+        missing = [s for s in ("summary", "experience", "education", "skills") if s not in sections]
+        return {
+            "score": clamp(score),
+            "rationale": f"Found {len(found)} of 4 standard sections; about {words} words.",
+            "examples": [f"Missing section: {s}" for s in missing],
+        }
@@ -0,0 +1,207 @@
+import math
+import re
+
+# Rough BPE estimate: a word piece is ~4 characters, punctuation is its own token
+TOKEN_PIECE_RE = re.compile(r"[A-Za-z]+|\d+|[^\sA-Za-z\d]")
+SENTENCE_END_RE = re.compile(r"(?<=[.!?])\s+")
+HEADING_RE = re.compile(r"^[A-Za-z][A-Za-z0-9 &/'’,()\-]{1,60}:?$")
+
+# Job description sections by priority (lower keeps first); None drops the section
+JD_SECTION_PRIORITIES = [
+    (0, re.compile(r"requirement|qualification|must have|skills|you have|you bring|what we.re looking for|"
+                   r"who you are|experience|proficienc|tech stack|competenc", re.I)),
+    (1, re.compile(r"responsibilit|what you.ll do|the role|duties|day to day|your impact|about the (role|job|position)", re.I)),
+    (2, re.compile(r"nice to have|preferred|bonus|plus", re.I)),
+    # Dropped only when the whole heading is one of these, so a title like
+    # "Compensation Analyst" or "Technical Recruiter" is kept
+    (None, re.compile(r"^((our |the )?(benefits|perks)( (and|&) (benefits|perks))?|what we offer|"
+                      r"(compensation|salary|pay)( (and|&) benefits| range)?|"
+                      r"(equal (employment )?opportunity|eeo)( employer| statement)?|"
+                      r"diversity( (and|&|,) inclusion)?( statement)?|(reasonable )?accommodations?|"
+                      r"privacy( notice| policy)?|how to apply|(a )?note to recruiters|"
+                      r"recruit(ers|ing|ment) agencies)\s*:?$", re.I)),
+    (3, re.compile(r"about (us|the company|the team)|who we are|our (mission|story|culture)|company overview", re.I)),
+]
+DEFAULT_SECTION_PRIORITY = 2
+
+# Boilerplate statements dropped wherever they appear. Each pattern is a
+# whole statement ("is an equal opportunity employer", "we offer ... 401(k)"),
+# not a bare keyword, so duties like "Administer 401(k) and PTO programs" or
+# "Run E-Verify and background checks" in HR and compliance roles are kept
+BOILERPLATE_RE = re.compile(
+    r"\b(is|are) (an?|a proud) equal (employment )?opportunity\b|"
+    r"^equal (employment )?opportunity employer|"
+    r"applicants will receive consideration|without regard to (race|age|sex|gender|religion|colou?r)|"
+    r"\bparticipates? in e-verify|"
+    r"\b(offers?|employment) (of employment )?(is|are|will be) (contingent|conditional) (up)?on\b|"
+    r"\b(we are|is) an? drug[- ]free (workplace|employer)|"
+    r"\b(if you|applicants who|candidates who) (need|require) (a )?(reasonable )?accommodation|"
+    r"\b(we offer|we provide|offering|you('ll| will) (get|receive|enjoy)|benefits include|perks include)\b.{0,80}"
+    r"(401\s?\(?k\)?|paid time off|\bpto\b|(medical|health|dental|vision) (insurance|coverage|benefits|plans?)|"
+    r"parental leave|competitive (salary|pay|compensation|benefits))|"
+    r"\b(the )?(base )?(salary|pay|compensation) range for this (role|position|job)|"
+    r"\bunsolicited (resumes|candidates|submissions)|"
+    r"\b(see|read|review) our (applicant |candidate |job applicant )?privacy (notice|policy)",
+    re.I,
+)
+
+# An EEO clause lists several protected characteristics in one sentence
+PROTECTED_CHARACTERISTIC_RE = re.compile(
+    r"\brace\b|\bcolou?r\b|religion|creed|national origin|sexual orientation|gender identity|"
+    r"\bdisability\b|veteran status|genetic information|marital status|pregnancy",
+    re.I,
+)
+
+
+def is_boilerplate(sentence):
+    """True for EEO statements, benefits blurbs and legal notices, not for duties that mention them."""
+    return bool(BOILERPLATE_RE.search(sentence)) or len(PROTECTED_CHARACTERISTIC_RE.findall(sentence)) >= 3
+
+
+def estimate_tokens(text):
+    """Estimate the model token count of ``text`` without a remote tokenizer."""
+    return sum(math.ceil(len(piece) / 4) for piece in TOKEN_PIECE_RE.findall(text or ""))
+
+
+def normalize_whitespace(text):
+    """Collapse runs of spaces and blank lines and strip each line."""
+    lines = [re.sub(r"[ \t\u00a0\u200b]+", " ", line).strip() for line in (text or "").splitlines()]
+    text = "\n".join(lines)
+    return re.sub(r"\n{3,}", "\n\n", text).strip()
+
+
+def strip_boilerplate(text):
+    """Drop sentences that are EEO statements, benefits blurbs or legal notices."""
+    kept_lines = []
+    for line in text.split("\n"):
+        sentences = [s for s in SENTENCE_END_RE.split(line) if not is_boilerplate(s)]
+        if sentences or not line:
+            kept_lines.append(" ".join(sentences))
+    return re.sub(r"\n{3,}", "\n\n", "\n".join(kept_lines)).strip()
+
+
+def fit_to_budget(text, budget):
+    """
+    Trim ``text`` to about ``budget`` tokens at a line, sentence or word boundary.
+
+    Returns:
+        str: ``text`` unchanged if it fits, otherwise its longest prefix that does
+    """
+    if estimate_tokens(text) <= budget:
+        return text
+
+    kept, used = [], 0
+    for line in text.split("\n"):
+        cost = estimate_tokens(line) + 1
+        if used + cost <= budget:
+            kept.append(line)
+            used += cost
+            continue
+        # Fill what is left with whole sentences, then whole words
+        partial = []
+        sentences = SENTENCE_END_RE.split(line)
+        for unit in sentences if len(sentences) > 1 else line.split(" "):
+            cost = estimate_tokens(unit) + 1
+            if used + cost > budget:
+                break
+            partial.append(unit)
+            used += cost
+        if partial:
+            kept.append(" ".join(partial))
+        break
+    return "\n".join(kept).rstrip()
+
+
+def split_sections(text):
+    """Split text into (heading, body_lines) blocks on short heading-like lines."""
+    sections = [("", [])]
+    for line in text.split("\n"):
+        if HEADING_RE.match(line) and (line.endswith(":") or len(line.split()) <= 6) \
+                and not line.endswith((".", ",")) and not line.startswith(("-", "*")):
+            sections.append((line, []))
+        else:
+            sections[-1][1].append(line)
+    return [(h, body) for h, body in sections if h or any(body)]
+
+
+def section_priority(heading):
+    for priority, pattern in JD_SECTION_PRIORITIES:
+        if pattern.search(heading):
+            return priority
+    return DEFAULT_SECTION_PRIORITY
+
+
+class PromptBuilder:
+    """
+    Compacts resume and job description text to fit per-stage token budgets.
+
+    Whitespace is normalized and boilerplate (EEO statements, benefits,
+    legal notices) removed. Job description sections are then kept in
+    priority order (requirements and skills first, company blurbs last)
+    until the stage's budget is spent, and emitted in their original order.
+    """
+
+    DEFAULT_BUDGETS = {
+        "analysis": {"resume": 3000, "jd": 1500},
+        "suggestions": {"resume": 2500, "jd": 600},
+        "resume_generation": {"resume": 3000, "jd": 400},
+    }
+
+    def __init__(self, config):
+        self.budgets = {**self.DEFAULT_BUDGETS, **config.get("PROMPT_TOKEN_BUDGETS", {})}
+
+    def compact(self, stage, resume_text, jd_text):
+        """
+        Fit the resume and job description into the token budget for ``stage``.
+
+        Args:
+            stage: "analysis", "suggestions" or "resume_generation"
+            resume_text: Extracted resume text
+            jd_text: Extracted job description text
+
+        Returns:
+            tuple: (resume_text, jd_text) ready to place in the prompt
+        """
+        budget = self.budgets[stage]
+        return (
+            self.compact_resume(resume_text, budget["resume"]),
+            self.compact_job_description(jd_text, budget["jd"]),
+        )
+
+    @staticmethod
+    def compact_resume(text, budget):
+        # Everything on a resume is candidate evidence, so only whitespace is squeezed
+        return fit_to_budget(normalize_whitespace(text), budget)
+
+    @staticmethod
+    def compact_job_description(text, budget):
+        text = strip_boilerplate(normalize_whitespace(text))
+
+        sections = []
+        for index, (heading, body) in enumerate(split_sections(text)):
+            priority = section_priority(heading) if heading else DEFAULT_SECTION_PRIORITY
+            if priority is None and index == 0:
+                # The opening block is usually the job title and summary; never drop it
+                priority = DEFAULT_SECTION_PRIORITY
+            if priority is None:
+                continue
+            block = "\n".join([heading] + body if heading else body).strip()
+            sections.append((priority, index, block))
+
+        compacted = "\n\n".join(block for _, _, block in sections)
+        if estimate_tokens(compacted) <= budget:
+            return compacted
+
+        kept, remaining = {}, budget
+        for priority, index, block in sorted(sections):
+            if remaining <= 0:
+                break
+            cost = estimate_tokens(block) + 1
+            if cost <= remaining:
+                kept[index] = block
+                remaining -= cost
+            elif remaining >= 40:
+                # Partial section, trimmed at a clean boundary
+                kept[index] = fit_to_budget(block, remaining)
+                remaining = 0
+        return "\n\n".join(kept[i] for i in sorted(kept))
@@ -0,0 +1,207 @@
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime, timezone
+
+logger = logging.getLogger(__name__)
+
+
+class SQLiteResponseStore:
+    """Persistent response tier backed by a local SQLite file."""
+
+    def __init__(self, path):
+        self.path = path
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        with self._connect() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS llm_responses ("
+                " key TEXT PRIMARY KEY,"
+                " namespace TEXT NOT NULL,"
+                " value TEXT NOT NULL,"
+                " expires_at REAL NOT NULL)"
+            )
+
+    def _connect(self):
+        # One short-lived connection per call keeps this safe across threads and workers
+        return sqlite3.connect(self.path, timeout=5)
+
+    def get(self, key):
+        """Return (value, expires_at), or None if missing or expired."""
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT value, expires_at FROM llm_responses WHERE key = ? AND expires_at > ?",
+                (key, time.time()),
+            ).fetchone()
+        return (row[0], row[1]) if row else None
+
+    def set(self, key, namespace, value, expires_at):
+        with self._connect() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO llm_responses (key, namespace, value, expires_at) VALUES (?, ?, ?, ?)",
+                (key, namespace, value, expires_at),
+            )
+
+    def purge(self):
+        """Delete expired rows."""
+        with self._connect() as conn:
+            cur = conn.execute("DELETE FROM llm_responses WHERE expires_at <= ?", (time.time(),))
+            return cur.rowcount
+
+
+class MongoResponseStore:
+    """Persistent response tier shared by all workers through MongoDB."""
+
+    def __init__(self, collection):
+        self.collection = collection
+        # MongoDB removes documents once expires_at has passed
+        self.collection.create_index("expires_at", expireAfterSeconds=0)
+
+    def get(self, key):
+        # The TTL monitor only runs once a minute, so check expiry here as well
+        doc = self.collection.find_one({"_id": key, "expires_ts": {"$gt": time.time()}})
+        return (doc["value"], doc["expires_ts"]) if doc else None
+
+    def set(self, key, namespace, value, expires_at):
+        self.collection.replace_one(
+            {"_id": key},
+            {
+                "_id": key,
+                "namespace": namespace,
+                "value": value,
+                "expires_at": datetime.fromtimestamp(expires_at, tz=timezone.utc),
+                "expires_ts": expires_at,
+            },
+            upsert=True,
+        )
+
+    def purge(self):
+        return self.collection.delete_many({"expires_ts": {"$lte": time.time()}}).deleted_count
+
+
+class ResponseCache:
+    """
+    Two-tier cache for parsed LLM responses.
+
+    The in-process LRU answers repeat requests without any I/O; the optional
+    persistent store (SQLite or MongoDB) shares responses across workers and
+    restarts. Every entry carries a namespace (prompt version + schema
+    fingerprint) so a prompt or schema change never serves stale results.
+    Entries of other namespaces are left to expire by TTL rather than
+    deleted, since another app version may share the store (rolling deploys).
+    """
+
+    def __init__(self, namespace, max_entries=512, ttl=86400, store=None):
+        self.namespace = namespace
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.store = store
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.store_hits = 0
+        self.misses = 0
+
+    def get(self, key):
+        now = time.time()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                value, expires_at = entry
+                if expires_at > now:
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return json.loads(value)
+                del self._entries[key]
+
+        found = None
+        if self.store is not None:
+            try:
+                found = self.store.get(key)
+            except Exception as e:
+                logger.warning(f"LLM cache store lookup failed: {e}")
+
+        with self._lock:
+            if found is None:
+                self.misses += 1
+                return None
+            self.store_hits += 1
+            # Keep the row's own expiry so a copy never outlives the stored entry
+            value, expires_at = found
+            self._remember(key, value, expires_at)
+        return json.loads(value)
+
+    def set(self, key, data):
+        value = json.dumps(data)
+        expires_at = time.time() + self.ttl
+        with self._lock:
+            self._remember(key, value, expires_at)
+        if self.store is not None:
+            try:
+                self.store.set(key, self.namespace, value, expires_at)
+            except Exception as e:
+                logger.warning(f"LLM cache store write failed: {e}")
+
+    def invalidate(self):
+        """Drop every in-memory entry and purge expired rows from the persistent store."""
+        with self._lock:
+            self._entries.clear()
+        if self.store is not None:
+            try:
+                removed = self.store.purge()
+                logger.info(f"LLM cache purged {removed} expired entries")
+            except Exception as e:
+                logger.warning(f"LLM cache purge failed: {e}")
+
+    def stats(self):
+        with self._lock:
+            lookups = self.hits + self.store_hits + self.misses
+            return {
+                "namespace": self.namespace,
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "ttl": self.ttl,
+                "hits": self.hits,
+                "store_hits": self.store_hits,
+                "misses": self.misses,
+                "hit_rate": round((self.hits + self.store_hits) / lookups, 4) if lookups else 0.0,
+                "store": type(self.store).__name__ if self.store is not None else None,
+            }
+
+    def _remember(self, key, value, expires_at):
+        # Caller must hold self._lock
+        self._entries[key] = (value, expires_at)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+
+def build_response_cache(config, namespace):
+    """Create the response cache configured by LLM_CACHE_* settings, or None when disabled."""
+    if not config.get("LLM_CACHE_ENABLED", True):
+        return None
+
+    backend = config.get("LLM_CACHE_BACKEND", "sqlite")
+    store = None
+    if backend == "sqlite":
+        store = SQLiteResponseStore(config["LLM_CACHE_SQLITE_PATH"])
+    elif backend == "mongo":
+        from ..models.database import Database
+        collection = Database(config).collection("llm_responses")
+        if collection is not None:
+            store = MongoResponseStore(collection)
+        else:
+            logger.warning("MongoDB unavailable; LLM cache runs in memory only")
+
+    cache = ResponseCache(
+        namespace,
+        max_entries=config.get("LLM_CACHE_SIZE", 512),
+        ttl=config.get("LLM_CACHE_TTL", 86400),
+        store=store,
+    )
+    cache.invalidate()
+    return cache
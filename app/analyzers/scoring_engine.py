@@ -1,28 +1,73 @@
+import operator
+
+
+def recommendation_for(total):
+    """Recommendation label for an overall score (0-100)."""
+    if total >= 85:
+        return "Strong Match"
+    elif total >= 70:
+        return "Good Match"
+    elif total >= 55:
+        return "Moderate Match"
+    elif total >= 40:
+        return "Weak Match"
+    return "Poor Match"
+
+
+def weight_profiles(config):
+    """
+    Named weight profiles, normalized to sum to 100.
+
+    Returns:
+        dict: profile name -> {parameter: weight}; "default" is SCORING_WEIGHTS
+    """
+    profiles = {"default": config.get("SCORING_WEIGHTS", {})}
+    profiles.update(config.get("WEIGHT_PROFILES", {}))
+    return {name: normalize_weights(weights) for name, weights in profiles.items()}
+
+
+def normalize_weights(weights):
+    """Scale weights to sum to 100 so overall scores stay on the 0-100 scale."""
+    total = sum(weights.values())
+    if total <= 0:
+        raise ValueError("Weights must add up to more than 0")
+    return {key: w * 100.0 / total for key, w in weights.items()}
+
+
+def rescore_matrix(scores, weight_vectors):
+    """
+    Weighted totals of many analyses under many weight profiles at once.
+
+    Args:
+        scores: one row of parameter scores per analysis (same column order as the weights)
+        weight_vectors: one row of weights per profile
+
+    Returns:
+        list: totals[i][k] of analysis i under profile k (scores x weights^T / 100)
+    """
+    columns = [[w / 100.0 for w in vector] for vector in weight_vectors]
+    return [[sum(map(operator.mul, row, column)) for column in columns] for row in scores]
+
+
 class ScoringEngine:
-    def __init__(self, config):
-        self.weights = config.get("SCORING_WEIGHTS", {})
+    def __init__(self, config, weights=None):
+        self.weights = weights if weights is not None else config.get("SCORING_WEIGHTS", {})
+
+    def score_parameter(self, key, param):
+        """Weight one parameter in place; returns its unrounded weighted score."""
+        w = self.weights.get(key, 0)
+        s = param.get("score", 0)
+        ws = (s * w) / 100.0
+        param["weight"] = round(w, 2)
+        param["weighted_score"] = round(ws, 2)
+        return ws
 
     def apply_weights(self, analysis):
         total = 0.0
         for key, param in analysis["parameters"].items():
-            w = self.weights.get(key, 0)
-            s = param.get("score", 0)
-            ws = (s * w) / 100.0
-            param["weight"] = w
-            param["weighted_score"] = round(ws, 2)
-            total += ws
+            total += self.score_parameter(key, param)
         analysis["overall_score"] = round(total, 2)
-        if total >= 85:
-            rec = "Strong Match"
-        elif total >= 70:
-            rec = "Good Match"
-        elif total >= 55:
-            rec = "Moderate Match"
-        elif total >= 40:
-            rec = "Weak Match"
-        else:
-            rec = "Poor Match"
-        analysis["recommendation"] = rec
+        analysis["recommendation"] = recommendation_for(total)
         return analysis
 
     def to_matrix(self, analysis):
@@ -0,0 +1,201 @@
+import functools
+import json
+import logging
+import os
+import re
+import time
+from collections import Counter, deque, namedtuple
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TAXONOMY_PATH = os.path.join(os.path.dirname(__file__), "skills_taxonomy.json")
+
+# Keeps the symbols that belong to skill names (c++, c#, .net, node.js);
+# hyphens and slashes split tokens, so "front-end" matches "front end"
+SKILL_TOKEN_RE = re.compile(r"(?<![a-z0-9])\.?[a-z0-9][a-z0-9+#]*(?:\.[a-z0-9+#]+)*", re.I)
+
+# Token span [start, end) of one skill mention
+SkillMention = namedtuple("SkillMention", "skill_id start end")
+
+
+def skill_tokens(text):
+    """Original-case tokens of ``text`` as the skill matcher sees them."""
+    return SKILL_TOKEN_RE.findall(text or "")
+
+
+class SkillTaxonomy:
+    """
+    Canonical skills with display names, categories and synonyms.
+
+    Loaded from JSON shaped ``{skill_id: {"name", "category", "aliases",
+    "exact"}}``: ``aliases`` match case-insensitively, ``exact`` only in the
+    given case (for names that are also common words, like "Go"). A plain
+    list is taken as the aliases. The name matches too, case-insensitively
+    unless it is also listed under ``exact``.
+    """
+
+    def __init__(self, skills):
+        self.skills = {}
+        for skill_id, entry in skills.items():
+            if isinstance(entry, list):
+                entry = {"aliases": entry}
+            self.skills[skill_id] = {
+                "name": entry.get("name", skill_id),
+                "category": entry.get("category", ""),
+                "aliases": list(entry.get("aliases", [])),
+                "exact": list(entry.get("exact", [])),
+            }
+
+    @classmethod
+    def load(cls, *paths):
+        """Read taxonomy files in order; later files add skills or replace them by ID."""
+        skills = {}
+        for path in paths:
+            with open(path, "r", encoding="utf-8") as f:
+                skills.update(json.load(f))
+        return cls(skills)
+
+    def __len__(self):
+        return len(self.skills)
+
+    def name(self, skill_id):
+        entry = self.skills.get(skill_id)
+        return entry["name"] if entry else skill_id
+
+    def phrases(self):
+        """Yield (phrase, skill_id, case_sensitive) for every way a skill can be written."""
+        for skill_id, entry in self.skills.items():
+            exact = {phrase.lower() for phrase in entry["exact"]}
+            for phrase in {p.lower() for p in (entry["name"], *entry["aliases"])} - exact:
+                yield phrase, skill_id, False
+            for phrase in entry["exact"]:
+                yield phrase, skill_id, True
+
+
+class SkillMatcher:
+    """
+    Finds every taxonomy skill mentioned in a document in one pass.
+
+    The skill phrases are compiled into an Aho-Corasick automaton over
+    lowercased tokens, so a document is scanned in time linear in its
+    length plus the number of mentions, however large the taxonomy.
+    Overlapping mentions resolve leftmost-longest ("machine learning",
+    not "learning").
+    """
+
+    def __init__(self, taxonomy):
+        self.taxonomy = taxonomy
+        self._goto = [{}]       # state -> {token: next state}
+        self._fail = [0]        # longest proper suffix that is also a state
+        self._matches = [None]  # phrases ending at this state: [(skill_id, length, exact tokens or None)]
+        self._report = [0]      # nearest state on the fail chain with matches (0 = none)
+        self.phrase_count = 0
+        for phrase, skill_id, case_sensitive in taxonomy.phrases():
+            tokens = skill_tokens(phrase)
+            if tokens:
+                self._insert(tokens, skill_id, case_sensitive)
+        self._link()
+
+    def _insert(self, tokens, skill_id, case_sensitive):
+        state = 0
+        for token in tokens:
+            token = token.lower()
+            next_state = self._goto[state].get(token)
+            if next_state is None:
+                next_state = len(self._goto)
+                self._goto[state][token] = next_state
+                self._goto.append({})
+                self._fail.append(0)
+                self._matches.append(None)
+                self._report.append(0)
+            state = next_state
+        if self._matches[state] is None:
+            self._matches[state] = []
+        # Case-insensitive forms first: they accept anything an exact form would
+        entry = (skill_id, len(tokens), tuple(tokens) if case_sensitive else None)
+        self._matches[state].insert(len(self._matches[state]) if case_sensitive else 0, entry)
+        self.phrase_count += 1
+
+    def _link(self):
+        # Breadth-first, so every fail target (a shorter suffix) is linked before its dependants
+        goto, fail, report = self._goto, self._fail, self._report
+        queue = deque(goto[0].values())
+        while queue:
+            state = queue.popleft()
+            report[state] = state if self._matches[state] else report[fail[state]]
+            for token, child in goto[state].items():
+                f = fail[state]
+                while f and token not in goto[f]:
+                    f = fail[f]
+                fail[child] = goto[f].get(token, 0)
+                queue.append(child)
+
+    def find(self, text):
+        """
+        Every skill mention in ``text``, in document order.
+
+        Returns:
+            list: SkillMention(skill_id, start, end) token spans, non-overlapping
+        """
+        tokens = skill_tokens(text)
+        goto, fail, report, matches = self._goto, self._fail, self._report, self._matches
+        found = []
+        state = 0
+        for i, token in enumerate(tokens):
+            token = token.lower()
+            while state and token not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(token, 0)
+            hit = report[state]
+            while hit:
+                for skill_id, length, exact in matches[hit]:
+                    if exact is None or tuple(tokens[i - length + 1:i + 1]) == exact:
+                        found.append((i - length + 1, -length, skill_id))
+                        break
+                hit = report[fail[hit]]
+
+        found.sort()
+        mentions = []
+        covered = 0
+        for start, negative_length, skill_id in found:
+            if start >= covered:
+                mentions.append(SkillMention(skill_id, start, start - negative_length))
+                covered = start - negative_length
+        return mentions
+
+    def extract(self, text):
+        """Counter of canonical skill ID -> number of mentions in ``text``."""
+        return Counter(m.skill_id for m in self.find(text))
+
+    def resolve(self, phrase):
+        """Canonical ID for a skill name or synonym (e.g. "k8s" -> "kubernetes"), or None."""
+        mentions = self.find(phrase)
+        return mentions[0].skill_id if len(mentions) == 1 else None
+
+    def names(self, skill_ids):
+        return [self.taxonomy.name(skill_id) for skill_id in skill_ids]
+
+    def stats(self):
+        return {"skills": len(self.taxonomy), "phrases": self.phrase_count, "states": len(self._goto)}
+
+
+@functools.lru_cache(maxsize=4)
+def load_skill_matcher(path=""):
+    """
+    Process-wide matcher for the bundled taxonomy plus the optional file at ``path``.
+
+    Args:
+        path: JSON taxonomy adding to / overriding the bundled one (SKILLS_TAXONOMY_FILE)
+
+    Returns:
+        SkillMatcher: Compiled once per path and shared by all callers
+    """
+    start = time.perf_counter()
+    taxonomy = SkillTaxonomy.load(DEFAULT_TAXONOMY_PATH, *([path] if path else []))
+    matcher = SkillMatcher(taxonomy)
+    stats = matcher.stats()
+    logger.info(
+        f"Compiled skill matcher: {stats['skills']} skills, {stats['phrases']} phrases, "
+        f"{stats['states']} states in {(time.perf_counter() - start) * 1000:.0f} ms"
+    )
+    return matcher
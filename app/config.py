@@ -1,4 +1,5 @@
 import os
+import json
 from dotenv import load_dotenv
 
 load_dotenv()
@@ -7,19 +8,186 @@ class Config:
     def __init__(self):
         # Flask
         self.SECRET_KEY = os.getenv("SECRET_KEY", "dev-secret")
-        self.DEBUG = True
+        self.DEBUG = os.getenv("FLASK_DEBUG", "false").lower() == "true"
+        # Import PyMuPDF, reportlab, python-docx and openai (and warm styles and
+        # page templates) in create_app instead of on first use; set under a
+        # preloading server so forked workers share them
+        self.PRELOAD_DEPENDENCIES = os.getenv("PRELOAD_DEPENDENCIES", "false").lower() == "true"
+
+        # Server (python -m app.serve; app.main runs the development server)
+        self.HOST = os.getenv("HOST", "127.0.0.1")
+        self.PORT = int(os.getenv("PORT", "8081"))
+        # Worker processes. Each keeps its own background job queue (/api/jobs
+        # polls must reach the worker that accepted the job), so scale with
+        # WEB_THREADS first. More than one worker needs a shared
+        # ANALYSIS_STORE_BACKEND ("sqlite" or "mongo")
+        self.WEB_WORKERS = int(os.getenv("WEB_WORKERS", "1"))
+        self.WEB_THREADS = int(os.getenv("WEB_THREADS", "4"))
+        # Build the app once in the server master and fork workers from it
+        self.WEB_PRELOAD = os.getenv("WEB_PRELOAD", "true").lower() == "true"
+        # Seconds a silent worker may run before it is restarted, and seconds
+        # workers get to finish in-flight requests and jobs on shutdown
+        self.WEB_TIMEOUT = int(os.getenv("WEB_TIMEOUT", "120"))
+        self.WEB_GRACEFUL_TIMEOUT = int(os.getenv("WEB_GRACEFUL_TIMEOUT", "30"))
+        self.WEB_KEEPALIVE = int(os.getenv("WEB_KEEPALIVE", "5"))
+        # Recycle workers after this many requests (0 = never), with jitter
+        self.WEB_MAX_REQUESTS = int(os.getenv("WEB_MAX_REQUESTS", "0"))
+        self.WEB_MAX_REQUESTS_JITTER = int(os.getenv("WEB_MAX_REQUESTS_JITTER", "0"))
 
         # AI
-        self.AI_PROVIDER = "openai"
+        # "openai" or "local" (deterministic offline analyzer, no API calls)
+        self.AI_PROVIDER = os.getenv("AI_PROVIDER", "openai")
         self.OPENAI_API_KEY = os.getenv("OPENAI_API_KEY", "")
+        # Shared client: optional base URL (proxy / compatible server), timeouts
+        # in seconds, automatic retries and HTTP connection pool limits
+        self.OPENAI_BASE_URL = os.getenv("OPENAI_BASE_URL", "")
+        self.OPENAI_TIMEOUT = float(os.getenv("OPENAI_TIMEOUT", "60"))
+        self.OPENAI_CONNECT_TIMEOUT = float(os.getenv("OPENAI_CONNECT_TIMEOUT", "5"))
+        self.OPENAI_MAX_RETRIES = int(os.getenv("OPENAI_MAX_RETRIES", "2"))
+        self.OPENAI_MAX_CONNECTIONS = int(os.getenv("OPENAI_MAX_CONNECTIONS", "20"))
+        self.OPENAI_MAX_KEEPALIVE = int(os.getenv("OPENAI_MAX_KEEPALIVE", "10"))
+        self.OPENAI_KEEPALIVE_EXPIRY = float(os.getenv("OPENAI_KEEPALIVE_EXPIRY", "30"))
+
+        # Stream analysis completions so scores arrive parameter by parameter
+        self.LLM_STREAMING = os.getenv("LLM_STREAMING", "true").lower() == "true"
+
+        # Prompt token budgets per LLM stage (estimated tokens for each input text)
+        self.PROMPT_TOKEN_BUDGETS = {
+            "analysis": {
+                "resume": int(os.getenv("PROMPT_ANALYSIS_RESUME_TOKENS", "3000")),
+                "jd": int(os.getenv("PROMPT_ANALYSIS_JD_TOKENS", "1500")),
+            },
+            "suggestions": {
+                "resume": int(os.getenv("PROMPT_SUGGESTIONS_RESUME_TOKENS", "2500")),
+                "jd": int(os.getenv("PROMPT_SUGGESTIONS_JD_TOKENS", "600")),
+            },
+            "resume_generation": {
+                "resume": int(os.getenv("PROMPT_GENERATION_RESUME_TOKENS", "3000")),
+                "jd": int(os.getenv("PROMPT_GENERATION_JD_TOKENS", "400")),
+            },
+        }
 
         # Folders
         base_dir = os.getcwd()
         self.UPLOAD_FOLDER = os.path.join(base_dir, "uploads")
         self.DOWNLOADS_FOLDER = os.path.join(base_dir, "downloads")
+        self.CACHE_FOLDER = os.path.join(base_dir, "cache")
+        # Reports and improved resumes are rendered in memory and served directly;
+        # set to keep them on disk in the artifact store instead (shared by all workers)
+        self.PERSIST_DOWNLOADS = os.getenv("PERSIST_DOWNLOADS", "false").lower() == "true"
+        # Artifact store: content-addressed, sharded files evicted after TTL seconds
+        # without a download, or least recently downloaded first above the size quota
+        self.ARTIFACTS_FOLDER = os.getenv("ARTIFACTS_FOLDER", os.path.join(self.DOWNLOADS_FOLDER, "artifacts"))
+        self.ARTIFACT_TTL = int(os.getenv("ARTIFACT_TTL", str(7 * 24 * 3600)))
+        self.ARTIFACT_MAX_BYTES = int(os.getenv("ARTIFACT_MAX_BYTES", str(1024 * 1024 * 1024)))
+        self.ARTIFACT_SWEEP_INTERVAL = int(os.getenv("ARTIFACT_SWEEP_INTERVAL", "600"))
+        # Also expire reports/resumes older versions wrote straight into DOWNLOADS_FOLDER.
+        # Off by default: that folder can hold files you want to keep (e.g. checked in)
+        self.ARTIFACT_SWEEP_LEGACY = os.getenv("ARTIFACT_SWEEP_LEGACY", "false").lower() == "true"
+
+        # Word templates are built once per definition change; serve them from memory
+        self.TEMPLATES_IN_MEMORY = os.getenv("TEMPLATES_IN_MEMORY", "true").lower() == "true"
+
+        # MongoDB (optional, see docker-compose.yml)
+        mongo_user = os.getenv("MONGO_USERNAME", "")
+        mongo_password = os.getenv("MONGO_PASSWORD", "")
+        mongo_auth = f"{mongo_user}:{mongo_password}@" if mongo_user else ""
+        self.MONGO_URI = os.getenv(
+            "MONGO_URI",
+            f"mongodb://{mongo_auth}{os.getenv('MONGO_HOST', 'localhost')}:{os.getenv('MONGO_PORT', '27017')}/",
+        )
+        self.MONGO_DB = os.getenv("MONGO_DB", "resumatch_db")
+
+        # Finished analyses kept server-side for resume generation, keyed by an
+        # opaque ID (ANALYSIS_STORE_BACKEND = "sqlite", "mongo" or "memory").
+        # "memory" is per process, so only use it with a single worker
+        self.ANALYSIS_STORE_BACKEND = os.getenv("ANALYSIS_STORE_BACKEND", "sqlite")
+        self.ANALYSIS_STORE_SQLITE_PATH = os.getenv(
+            "ANALYSIS_STORE_SQLITE_PATH", os.path.join(self.CACHE_FOLDER, "analyses.sqlite3")
+        )
+        self.ANALYSIS_STORE_SIZE = int(os.getenv("ANALYSIS_STORE_SIZE", "256"))
+        self.ANALYSIS_STORE_TTL = int(os.getenv("ANALYSIS_STORE_TTL", str(24 * 3600)))
+
+        # Inverted keyword index over analyzed resumes (/api/search)
+        self.SEARCH_INDEX_ENABLED = os.getenv("SEARCH_INDEX_ENABLED", "true").lower() == "true"
+        self.SEARCH_INDEX_PATH = os.getenv(
+            "SEARCH_INDEX_PATH", os.path.join(self.CACHE_FOLDER, "resume_index.sqlite3")
+        )
+
+        # LLM response cache: in-process LRU plus a persistent tier
+        # (LLM_CACHE_BACKEND = "sqlite", "mongo" or "memory")
+        self.LLM_CACHE_ENABLED = os.getenv("LLM_CACHE_ENABLED", "true").lower() == "true"
+        self.LLM_CACHE_BACKEND = os.getenv("LLM_CACHE_BACKEND", "sqlite")
+        self.LLM_CACHE_SIZE = int(os.getenv("LLM_CACHE_SIZE", "512"))
+        self.LLM_CACHE_TTL = int(os.getenv("LLM_CACHE_TTL", str(24 * 3600)))
+        self.LLM_CACHE_SQLITE_PATH = os.getenv(
+            "LLM_CACHE_SQLITE_PATH", os.path.join(self.CACHE_FOLDER, "llm_responses.sqlite3")
+        )
+
+        # Record real OpenAI responses to LLM_CASSETTE_DIR ("record") or serve
+        # only recorded ones without network access ("replay"); empty = off
+        self.LLM_TRANSPORT_MODE = os.getenv("LLM_TRANSPORT_MODE", "").lower()
+        self.LLM_CASSETTE_DIR = os.getenv("LLM_CASSETTE_DIR", os.path.join(self.CACHE_FOLDER, "llm_cassettes"))
+
+        # Per-stage latency histograms on /metrics and Server-Timing headers.
+        # Workers share snapshots through METRICS_MULTIPROC_DIR so every worker
+        # reports the merged totals; python -m app.serve clears it on start
+        self.METRICS_ENABLED = os.getenv("METRICS_ENABLED", "true").lower() == "true"
+        self.METRICS_MULTIPROC_DIR = os.getenv(
+            "METRICS_MULTIPROC_DIR", os.path.join(self.CACHE_FOLDER, "metrics") if self.WEB_WORKERS > 1 else ""
+        )
+        self.METRICS_FLUSH_INTERVAL = float(os.getenv("METRICS_FLUSH_INTERVAL", "5"))
+
+        # Opt-in request profiling: cProfile + stack samples for a
+        # PROFILE_SAMPLE_RATE share of requests under PROFILE_PATHS, and stack
+        # samples of any request slower than PROFILE_SLOW_MS (0 = off). Kept in
+        # PROFILE_DIR, oldest dropped beyond PROFILE_MAX_PROFILES/PROFILE_MAX_BYTES
+        self.PROFILE_ENABLED = os.getenv("PROFILE_ENABLED", "false").lower() == "true"
+        self.PROFILE_SAMPLE_RATE = float(os.getenv("PROFILE_SAMPLE_RATE", "0"))
+        self.PROFILE_SLOW_MS = int(os.getenv("PROFILE_SLOW_MS", "0"))
+        self.PROFILE_PATHS = os.getenv("PROFILE_PATHS", "/compare,/api/generate-improved-resume,/api/batch")
+        self.PROFILE_INTERVAL_MS = float(os.getenv("PROFILE_INTERVAL_MS", "5"))
+        self.PROFILE_DIR = os.getenv("PROFILE_DIR", os.path.join(self.CACHE_FOLDER, "profiles"))
+        self.PROFILE_MAX_PROFILES = int(os.getenv("PROFILE_MAX_PROFILES", "100"))
+        self.PROFILE_MAX_BYTES = int(os.getenv("PROFILE_MAX_BYTES", str(200 * 1024 * 1024)))
+        # Required for the /admin endpoints (profiles); they are closed without it
+        self.ADMIN_TOKEN = os.getenv("ADMIN_TOKEN", "")
 
         # Uploads
         self.ALLOWED_EXTENSIONS = {"pdf", "docx"}
+        # Parse uploads from memory instead of saving them to UPLOAD_FOLDER;
+        # uploads larger than the limit spool to a per-request temp file
+        self.UPLOAD_IN_MEMORY = os.getenv("UPLOAD_IN_MEMORY", "true").lower() == "true"
+        self.UPLOAD_MAX_MEMORY_BYTES = int(os.getenv("UPLOAD_MAX_MEMORY_BYTES", str(8 * 1024 * 1024)))
+
+        # Batch ranking (/api/batch-rank): parse pool size and concurrent LLM calls
+        self.BATCH_MAX_RESUMES = int(os.getenv("BATCH_MAX_RESUMES", "500"))
+        self.BATCH_PARSE_WORKERS = int(os.getenv("BATCH_PARSE_WORKERS", "4"))
+        self.BATCH_LLM_CONCURRENCY = int(os.getenv("BATCH_LLM_CONCURRENCY", "4"))
+
+        # Background jobs (/api/jobs): worker threads, max jobs waiting for a
+        # worker, and how long / how many finished results are kept
+        self.JOB_WORKERS = int(os.getenv("JOB_WORKERS", "4"))
+        self.JOB_MAX_QUEUE = int(os.getenv("JOB_MAX_QUEUE", "100"))
+        self.JOB_RESULT_TTL = int(os.getenv("JOB_RESULT_TTL", "3600"))
+        self.JOB_MAX_RESULTS = int(os.getenv("JOB_MAX_RESULTS", "1000"))
+
+        # PDF extraction: page cap / early stop (0 = unlimited) and a process
+        # pool for long documents (WORKERS 0 or 1 keeps extraction serial).
+        # Pool workers are spawned and re-run the entry module; app.main and
+        # app.serve skip building the app there, custom entry scripts must too
+        self.PDF_MAX_PAGES = int(os.getenv("PDF_MAX_PAGES", "0"))
+        self.PDF_MAX_CHARS = int(os.getenv("PDF_MAX_CHARS", "0"))
+        self.PDF_PARALLEL_WORKERS = int(os.getenv("PDF_PARALLEL_WORKERS", "0"))
+        self.PDF_PARALLEL_MIN_PAGES = int(os.getenv("PDF_PARALLEL_MIN_PAGES", "16"))
+
+        # Skills taxonomy: JSON file of {skill_id: {name, category, aliases, exact}}
+        # added to (or overriding) the bundled app/analyzers/skills_taxonomy.json
+        self.SKILLS_TAXONOMY_FILE = os.getenv("SKILLS_TAXONOMY_FILE", "")
+
+        # Extracted-text cache (disk tier is optional, set a folder to enable it)
+        self.EXTRACTION_CACHE_SIZE = int(os.getenv("EXTRACTION_CACHE_SIZE", "256"))
+        self.EXTRACTION_CACHE_DIR = os.getenv("EXTRACTION_CACHE_DIR", "")
 
         # Weights
         self.SCORING_WEIGHTS = {
@@ -34,3 +202,51 @@ class Config:
             "achievements_metrics": 3,
             "format_presentation": 2,
         }
+
+        # Named weight profiles for /api/rescore ("default" is SCORING_WEIGHTS).
+        # WEIGHT_PROFILES_FILE may point to a JSON file of {name: {parameter: weight}}
+        # adding or overriding profiles; weights are normalized to sum to 100
+        self.WEIGHT_PROFILES = {
+            "skills_heavy": {
+                "skills_match": 32,
+                "keywords_density": 16,
+                "experience_relevance": 14,
+                "project_complexity": 12,
+                "education_certifications": 8,
+                "career_progression": 6,
+                "industry_experience": 5,
+                "cultural_fit": 3,
+                "achievements_metrics": 3,
+                "format_presentation": 1,
+            },
+            "experience_heavy": {
+                "experience_relevance": 28,
+                "career_progression": 18,
+                "industry_experience": 14,
+                "skills_match": 14,
+                "achievements_metrics": 8,
+                "project_complexity": 8,
+                "education_certifications": 5,
+                "keywords_density": 3,
+                "cultural_fit": 1,
+                "format_presentation": 1,
+            },
+            "culture_heavy": {
+                "cultural_fit": 25,
+                "skills_match": 15,
+                "experience_relevance": 15,
+                "career_progression": 10,
+                "industry_experience": 10,
+                "achievements_metrics": 8,
+                "education_certifications": 6,
+                "project_complexity": 5,
+                "keywords_density": 4,
+                "format_presentation": 2,
+            },
+        }
+        self.WEIGHT_PROFILES_FILE = os.getenv("WEIGHT_PROFILES_FILE", "")
+        if self.WEIGHT_PROFILES_FILE:
+            with open(self.WEIGHT_PROFILES_FILE, "r", encoding="utf-8") as f:
+                self.WEIGHT_PROFILES.update(json.load(f))
+        # Most analyses one /api/rescore call may re-score
+        self.RESCORE_MAX_ANALYSES = int(os.getenv("RESCORE_MAX_ANALYSES", "10000"))
@@ -1,41 +1,49 @@
+import io
 import os
-from reportlab.lib.pagesizes import letter
-from reportlab.lib import colors
-from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle
+import uuid
 from datetime import datetime
 
 class PDFReportGenerator:
-    def __init__(self, config):
+    def __init__(self, config, artifacts=None):
         self.config = config
         self.output_folder = config.get("DOWNLOADS_FOLDER", "downloads")
+        # ArtifactStore for persisted reports (falls back to plain files in output_folder)
+        self.artifacts = artifacts
 
-    def generate_report(self, analysis, matrix):
-        """Generates a PDF report from the analysis data."""
+    @staticmethod
+    def report_filename():
+        """Download name for a new report; the random suffix keeps concurrent reports apart."""
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        filename = f"Resume_Analysis_Report_{timestamp}.pdf"
-        filepath = os.path.join(self.output_folder, filename)
+        return f"Resume_Analysis_Report_{timestamp}_{uuid.uuid4().hex[:8]}.pdf"
+
+    def generate_report(self, analysis, matrix):
+        """Generates and persists a PDF report; returns its artifact ID (or filename)."""
+        return self.save(self.render_report(analysis, matrix))
+
+    def save(self, pdf_bytes):
+        """Persist rendered report bytes in the artifact store and return the artifact ID."""
+        if self.artifacts is not None:
+            return self.artifacts.put(pdf_bytes, "pdf")
+        filename = self.report_filename()
+        with open(os.path.join(self.output_folder, filename), "wb") as f:
+            f.write(pdf_bytes)
+        return filename
+
+    def render_report(self, analysis, matrix):
+        """Renders the PDF report from the analysis data and returns its bytes."""
+        from reportlab.lib.pagesizes import letter
+        from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table
+        from .pdf_styles import report_styles
 
-        doc = SimpleDocTemplate(filepath, pagesize=letter)
-        styles = getSampleStyleSheet()
+        buffer = io.BytesIO()
+        doc = SimpleDocTemplate(buffer, pagesize=letter)
+        styles = report_styles()
         story = []
 
         # Styles
-        title_style = styles['Title']
-        heading_style = styles['Heading2']
-        normal_style = styles['Normal']
-        
-        # Custom Style for Recommendation
-        rec_style = ParagraphStyle(
-            'Recommendation',
-            parent=styles['Normal'],
-            fontSize=12,
-            textColor=colors.whitesmoke,
-            backColor=colors.darkblue,
-            alignment=1, # Center
-            spaceAfter=20,
-            allowWidows=0
-        )
+        title_style = styles['title']
+        heading_style = styles['heading']
+        normal_style = styles['normal']
 
         # Title
         story.append(Paragraph("Resume Analysis Report", title_style))
@@ -54,15 +62,13 @@ class PDFReportGenerator:
         
         # Color coding recommendation
         if overall_score >= 85:
-            rec_color = colors.darkgreen
+            rec_style = styles['score_strong']
         elif overall_score >= 70:
-            rec_color = colors.orange
+            rec_style = styles['score_good']
         else:
-            rec_color = colors.firebrick
+            rec_style = styles['score_weak']
             
-        rec_param = Paragraph(score_text, ParagraphStyle(
-            'Rec', parent=normal_style, fontSize=14, textColor=rec_color, spaceAfter=20, alignment=1, fontName='Helvetica-Bold'
-        ))
+        rec_param = Paragraph(score_text, rec_style)
         story.append(rec_param)
         story.append(Spacer(1, 12))
 
@@ -82,17 +88,7 @@ class PDFReportGenerator:
             table_data.append(row)
 
         table = Table(table_data, colWidths=[120, 50, 50, 60, 250])
-        table.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (-1, 0), colors.grey),
-            ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-            ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-            ('FONTSIZE', (0, 0), (-1, 0), 10),
-            ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-            ('BACKGROUND', (0, 1), (-1, -1), colors.beige),
-            ('GRID', (0, 0), (-1, -1), 1, colors.black),
-            ('VALIGN', (0, 0), (-1, -1), 'TOP'),
-        ]))
+        table.setStyle(styles['matrix_table'])
         
         story.append(table)
         story.append(Spacer(1, 20))
@@ -112,11 +108,9 @@ class PDFReportGenerator:
 
         # Side by side lists (using Table for layout)
         list_table = Table([[strengths, improvements]], colWidths=[col_width, col_width])
-        list_table.setStyle(TableStyle([
-            ('VALIGN', (0, 0), (-1, -1), 'TOP'),
-        ]))
+        list_table.setStyle(styles['list_table'])
         
         story.append(list_table)
         
         doc.build(story)
-        return filename
+        return buffer.getvalue()
@@ -0,0 +1,124 @@
+from functools import lru_cache
+from reportlab.lib import colors
+from reportlab.lib.enums import TA_LEFT
+from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+from reportlab.platypus import TableStyle
+
+# Premium palette used by the generated resume PDF
+NAVY = colors.HexColor('#003366')
+GOLD = colors.HexColor('#C5A021')
+GREY_DARK = colors.HexColor('#333333')
+
+
+@lru_cache(maxsize=None)
+def report_styles():
+    """
+    Paragraph and table styles for the analysis report, built once per process.
+
+    Styles are only read while rendering, so every request shares them.
+    """
+    styles = getSampleStyleSheet()
+    normal = styles['Normal']
+
+    def score_style(name, color):
+        return ParagraphStyle(
+            name, parent=normal, fontSize=14, textColor=color, spaceAfter=20, alignment=1, fontName='Helvetica-Bold'
+        )
+
+    return {
+        "title": styles['Title'],
+        "heading": styles['Heading2'],
+        "normal": normal,
+        "recommendation": ParagraphStyle(
+            'Recommendation',
+            parent=normal,
+            fontSize=12,
+            textColor=colors.whitesmoke,
+            backColor=colors.darkblue,
+            alignment=1, # Center
+            spaceAfter=20,
+            allowWidows=0
+        ),
+        # Overall score line, colour coded by score band
+        "score_strong": score_style('RecStrong', colors.darkgreen),
+        "score_good": score_style('RecGood', colors.orange),
+        "score_weak": score_style('RecWeak', colors.firebrick),
+        "matrix_table": TableStyle([
+            ('BACKGROUND', (0, 0), (-1, 0), colors.grey),
+            ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+            ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+            ('FONTSIZE', (0, 0), (-1, 0), 10),
+            ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
+            ('BACKGROUND', (0, 1), (-1, -1), colors.beige),
+            ('GRID', (0, 0), (-1, -1), 1, colors.black),
+            ('VALIGN', (0, 0), (-1, -1), 'TOP'),
+        ]),
+        "list_table": TableStyle([
+            ('VALIGN', (0, 0), (-1, -1), 'TOP'),
+        ]),
+    }
+
+
+@lru_cache(maxsize=None)
+def resume_styles():
+    """Paragraph styles for the improved resume PDF, built once per process."""
+    styles = getSampleStyleSheet()
+    return {
+        "normal": styles['Normal'],
+        "name": ParagraphStyle(
+            'NameStyle',
+            parent=styles['Heading1'],
+            fontSize=28,
+            alignment=TA_LEFT,
+            spaceAfter=4,
+            fontName='Helvetica-Bold',
+            textColor=NAVY
+        ),
+        "contact": ParagraphStyle(
+            'ContactStyle',
+            parent=styles['Normal'],
+            fontSize=10,
+            alignment=TA_LEFT,
+            spaceAfter=18,
+            fontName='Helvetica',
+            textColor=GREY_DARK
+        ),
+        "header": ParagraphStyle(
+            'HeaderStyle',
+            parent=styles['Heading2'],
+            fontSize=12,
+            alignment=TA_LEFT,
+            spaceBefore=12,
+            spaceAfter=2,
+            fontName='Helvetica-Bold',
+            textColor=NAVY,
+            textTransform='uppercase'
+        ),
+        "summary": ParagraphStyle(
+            'SummaryStyle',
+            parent=styles['Normal'],
+            fontSize=10.5,
+            leading=14,
+            alignment=TA_LEFT,
+            fontName='Helvetica'
+        ),
+        "job_title": ParagraphStyle(
+            'JobTitleStyle',
+            parent=styles['Normal'],
+            fontSize=11,
+            fontName='Helvetica-Bold',
+            spaceBefore=8,
+            alignment=TA_LEFT,
+            textColor=NAVY
+        ),
+        "job_details": ParagraphStyle(
+            'JobDetailsStyle',
+            parent=styles['Normal'],
+            fontSize=9.5,
+            fontName='Helvetica-Oblique',
+            textColor=colors.grey,
+            alignment=TA_LEFT,
+            spaceAfter=4
+        ),
+    }
@@ -1,10 +1,8 @@
-import openai
 import json
-from docx import Document
-from docx.shared import Pt, Inches, RGBColor
-from docx.enum.text import WD_ALIGN_PARAGRAPH
 import os
+import hashlib
 from datetime import datetime
+from ..analyzers.prompt_builder import PromptBuilder
 
 class ATSResumeGenerator:
     """
@@ -12,9 +10,13 @@ class ATSResumeGenerator:
     Applies improvement suggestions to create an enhanced resume.
     """
     
-    def __init__(self, config):
-        self.openai_api_key = config.get("OPENAI_API_KEY")
-        openai.api_key = self.openai_api_key
+    def __init__(self, config, client=None, artifacts=None):
+        # Shared openai.OpenAI client built in create_app (None without an API key)
+        self.client = client
+        # ArtifactStore for persisted resumes (falls back to plain files in DOWNLOADS_FOLDER)
+        self.artifacts = artifacts
+        self.output_folder = config.get("DOWNLOADS_FOLDER", "downloads")
+        self.prompt_builder = PromptBuilder(config)
     
     def generate_improved_resume(self, resume_text, suggestions_data, analysis_data, jd_text):
         """
@@ -29,6 +31,7 @@ class ATSResumeGenerator:
         Returns:
             dict: Structured resume content
         """
+        import openai  # only needed for its error types; loaded on first call
         try:
             suggestions = suggestions_data.get("suggestions", [])
             
@@ -37,6 +40,7 @@ class ATSResumeGenerator:
                 f"{i+1}. {s['area']}: {s['what_to_change']}\n   Before: {s['before']}\n   After: {s['after']}"
                 for i, s in enumerate(suggestions)
             ])
+            prompt_resume, prompt_jd = self.prompt_builder.compact("resume_generation", resume_text, jd_text)
             
             prompt = f"""
 You are an expert resume writer specializing in ATS-optimized resumes.
@@ -44,10 +48,10 @@ You are an expert resume writer specializing in ATS-optimized resumes.
 **TASK**: Transform this resume by applying the improvement suggestions while maintaining an ATS-friendly format. Use a professional, accomplishment-driven tone.
 
 **ORIGINAL RESUME**:
-{resume_text}
+{prompt_resume}
 
 **JOB DESCRIPTION** (for context):
-{jd_text[:1500]}
+{prompt_jd}
 
 **IMPROVEMENT SUGGESTIONS TO APPLY**:
 {suggestions_text}
@@ -105,7 +109,11 @@ You are an expert resume writer specializing in ATS-optimized resumes.
 - Keep it clean: no tables, no columns, no colors.
 """
             
-            resp = openai.chat.completions.create(
+            if self.client is None:
+                print("[RESUME GEN] OpenAI API key not configured. Using template resume.")
+                return self._generate_template_resume(resume_text, suggestions_data)
+
+            resp = self.client.chat.completions.create(
                 model="gpt-4o-mini",
                 messages=[{"role": "user", "content": prompt}],
                 temperature=0.2,
@@ -239,17 +247,39 @@ You are an expert resume writer specializing in ATS-optimized resumes.
             "_demo_reason": "Premium Extraction Applied"
         }
     
+    def save(self, data, ext):
+        """
+        Persist a rendered resume file.
+
+        Args:
+            data: File bytes from create_docx / create_pdf
+            ext: "docx" or "pdf"
+
+        Returns:
+            str: Artifact ID (or filename in DOWNLOADS_FOLDER without a store)
+        """
+        if self.artifacts is not None:
+            return self.artifacts.put(data, ext)
+        filename = f"improved_resume_{datetime.now().strftime('%Y%m%d_%H%M%S')}_{hashlib.sha256(data).hexdigest()[:8]}.{ext}"
+        with open(os.path.join(self.output_folder, filename), "wb") as f:
+            f.write(data)
+        return filename
+    
     def create_docx(self, resume_data, output_path):
         """
         Create a Word document (.docx) from resume data.
         
         Args:
             resume_data: Structured resume content
-            output_path: Path to save the .docx file
+            output_path: Path or binary file object to save the .docx file
             
         Returns:
-            str: Path to created file
+            output_path
         """
+        from docx import Document
+        from docx.enum.text import WD_ALIGN_PARAGRAPH
+        from docx.shared import Pt, Inches
+
         doc = Document()
         
         # Set document margins (1 inch all around)
@@ -393,7 +423,8 @@ You are an expert resume writer specializing in ATS-optimized resumes.
     
     def _add_section_header(self, doc, text):
         """Add a formatted section header with a line separator."""
-        from docx.shared import RGBColor
+        from docx.enum.text import WD_ALIGN_PARAGRAPH
+        from docx.shared import Pt, RGBColor
         NAVY_RGB = RGBColor(0, 51, 102) # #003366
         
         header_para = doc.add_paragraph()
@@ -421,16 +452,14 @@ You are an expert resume writer specializing in ATS-optimized resumes.
         
         Args:
             resume_data: Structured resume content
-            output_path: Path to save the .pdf file
+            output_path: Path or binary file object to save the .pdf file
             
         Returns:
-            str: Path to created file
+            output_path
         """
         from reportlab.lib.pagesizes import letter
         from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, ListFlowable, ListItem
-        from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-        from reportlab.lib.enums import TA_CENTER, TA_LEFT
-        from reportlab.lib import colors
+        from .pdf_styles import resume_styles, NAVY
 
         # Document setup
         doc = SimpleDocTemplate(
@@ -442,78 +471,19 @@ You are an expert resume writer specializing in ATS-optimized resumes.
             bottomMargin=54
         )
         
-        styles = getSampleStyleSheet()
+        # Shared styles, built once per process
+        styles = resume_styles()
         elements = []
 
-        # Premium Palette
-        NAVY = colors.HexColor('#003366')
-        GOLD = colors.HexColor('#C5A021')
-        GREY_DARK = colors.HexColor('#333333')
-        
-        # Custom styles
-        name_style = ParagraphStyle(
-            'NameStyle',
-            parent=styles['Heading1'],
-            fontSize=28,
-            alignment=TA_LEFT,
-            spaceAfter=4,
-            fontName='Helvetica-Bold',
-            textColor=NAVY
-        )
-        
-        contact_style = ParagraphStyle(
-            'ContactStyle',
-            parent=styles['Normal'],
-            fontSize=10,
-            alignment=TA_LEFT,
-            spaceAfter=18,
-            fontName='Helvetica',
-            textColor=GREY_DARK
-        )
-        
-        header_style = ParagraphStyle(
-            'HeaderStyle',
-            parent=styles['Heading2'],
-            fontSize=12,
-            alignment=TA_LEFT,
-            spaceBefore=12,
-            spaceAfter=2,
-            fontName='Helvetica-Bold',
-            textColor=NAVY,
-            textTransform='uppercase'
-        )
-        
-        summary_style = ParagraphStyle(
-            'SummaryStyle',
-            parent=styles['Normal'],
-            fontSize=10.5,
-            leading=14,
-            alignment=TA_LEFT,
-            fontName='Helvetica'
-        )
-        
-        job_title_style = ParagraphStyle(
-            'JobTitleStyle',
-            parent=styles['Normal'],
-            fontSize=11,
-            fontName='Helvetica-Bold',
-            spaceBefore=8,
-            alignment=TA_LEFT,
-            textColor=NAVY
-        )
-        
-        job_details_style = ParagraphStyle(
-            'JobDetailsStyle',
-            parent=styles['Normal'],
-            fontSize=9.5,
-            fontName='Helvetica-Oblique',
-            textColor=colors.grey,
-            alignment=TA_LEFT,
-            spaceAfter=4
-        )
+        name_style = styles['name']
+        contact_style = styles['contact']
+        header_style = styles['header']
+        summary_style = styles['summary']
+        job_title_style = styles['job_title']
+        job_details_style = styles['job_details']
 
         def add_hr(elements, color=NAVY):
-            elements.append(Paragraph(f"<hr color='{color.hexval()}' width='100%' size='1.5'/>", styles['Normal']))
+            elements.append(Paragraph(f"<hr color='{color.hexval()}' width='100%' size='1.5'/>", styles['normal']))
 
         # 1. Header with Accent
         contact = resume_data.get("contact", {})
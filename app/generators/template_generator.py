@@ -1,13 +1,26 @@
-from docx import Document
-from docx.enum.text import WD_ALIGN_PARAGRAPH
+import hashlib
+import inspect
 import logging
 import os
+import threading
 
 logger = logging.getLogger(__name__)
 
 class TemplateGenerator:
+    # Bump to force a rebuild when something outside the builders changes the output
+    TEMPLATE_VERSION = 1
+
+    # Download filename -> builder method
+    TEMPLATES = {
+        "resume_template.docx": "create_resume_template",
+        "job_description_template.docx": "create_job_description_template",
+    }
+
     @staticmethod
     def create_resume_template(output_path):
+        from docx import Document
+        from docx.enum.text import WD_ALIGN_PARAGRAPH
+
         try:
             doc = Document()
 
@@ -100,6 +113,9 @@ class TemplateGenerator:
 
     @staticmethod
     def create_job_description_template(output_path):
+        from docx import Document
+        from docx.enum.text import WD_ALIGN_PARAGRAPH
+
         try:
             doc = Document()
 
@@ -179,11 +195,72 @@ class TemplateGenerator:
             logger.error(f"Error creating JD template: {e}")
             return False
 
+    @classmethod
+    def definition_hash(cls, builder_name):
+        """Fingerprint of a template's definition: the builder's source plus TEMPLATE_VERSION."""
+        try:
+            source = inspect.getsource(getattr(cls, builder_name))
+        except (OSError, TypeError):
+            # No source available (e.g. frozen build); rely on TEMPLATE_VERSION alone
+            source = builder_name
+        return hashlib.sha256(f"{cls.TEMPLATE_VERSION}\0{source}".encode("utf-8")).hexdigest()
+
+    @classmethod
+    def ensure_template(cls, downloads_folder, filename, builder_name):
+        """
+        Build a template unless an up-to-date copy already exists.
+
+        The definition hash is kept next to the file (``<filename>.sha256``).
+        The .docx and its stamp are written to temp files and renamed into
+        place, so concurrent workers never see a partial file.
+
+        Returns:
+            bool: True if the template is available
+        """
+        path = os.path.join(downloads_folder, filename)
+        stamp_path = f"{path}.sha256"
+        digest = cls.definition_hash(builder_name)
+
+        try:
+            with open(stamp_path, "r", encoding="utf-8") as f:
+                if f.read().strip() == digest and os.path.exists(path):
+                    logger.info(f"Template up to date: {path}")
+                    return True
+        except FileNotFoundError:
+            pass
+
+        suffix = f".{os.getpid()}.{threading.get_ident()}.tmp"
+        if not getattr(cls, builder_name)(path + suffix):
+            if os.path.exists(path + suffix):
+                os.remove(path + suffix)
+            return False
+        try:
+            os.replace(path + suffix, path)
+            with open(stamp_path + suffix, "w", encoding="utf-8") as f:
+                f.write(digest)
+            os.replace(stamp_path + suffix, stamp_path)
+        except OSError as e:
+            logger.error(f"Error installing template {filename}: {e}")
+            return False
+        return True
+
     @classmethod
     def generate_all_templates(cls, downloads_folder):
         os.makedirs(downloads_folder, exist_ok=True)
-        resume_path = os.path.join(downloads_folder, "resume_template.docx")
-        jd_path = os.path.join(downloads_folder, "job_description_template.docx")
-        r_ok = cls.create_resume_template(resume_path)
-        j_ok = cls.create_job_description_template(jd_path)
-        return r_ok and j_ok
+        results = [
+            cls.ensure_template(downloads_folder, filename, builder)
+            for filename, builder in cls.TEMPLATES.items()
+        ]
+        return all(results)
+
+    @classmethod
+    def load_templates(cls, downloads_folder):
+        """Read the built templates into memory as {filename: bytes}."""
+        templates = {}
+        for filename in cls.TEMPLATES:
+            try:
+                with open(os.path.join(downloads_folder, filename), "rb") as f:
+                    templates[filename] = f.read()
+            except OSError as e:
+                logger.error(f"Could not load template {filename}: {e}")
+        return templates
@@ -1,7 +1,11 @@
 from . import create_app
 
-app = create_app()
+# Spawned PDF extraction workers (PDF_PARALLEL_WORKERS) run this module again
+# as __mp_main__; they only parse pages and must not build another app
+if __name__ != "__mp_main__":
+    app = create_app()
 
 if __name__ == "__main__":
+    # Development server; run `python -m app.serve` for multi-worker serving
     print("Starting Flask app...")
-    app.run(host="127.0.0.1", port=8081, debug=True, use_reloader=False, use_debugger=False)
+    app.run(host=app.config["HOST"], port=app.config["PORT"], debug=app.config["DEBUG"], use_reloader=False, use_debugger=False)
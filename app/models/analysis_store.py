@@ -0,0 +1,240 @@
+import json
+import logging
+import os
+import secrets
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime, timezone
+
+logger = logging.getLogger(__name__)
+
+
+class SQLiteRecordStore:
+    """
+    Persistent tier backed by a local SQLite file, shared by every worker on the host.
+
+    Records are stored as JSON; the rendered report is kept in its own BLOB
+    column so it is not base64-encoded into the JSON.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        with self._connect() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS analyses ("
+                " analysis_id TEXT PRIMARY KEY,"
+                " record TEXT NOT NULL,"
+                " report_pdf BLOB,"
+                " expires_at REAL NOT NULL)"
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS analyses_expires ON analyses (expires_at)")
+
+    def _connect(self):
+        # One short-lived connection per call keeps this safe across threads and workers
+        return sqlite3.connect(self.path, timeout=10)
+
+    def insert(self, analysis_id, record, expires_at):
+        with self._connect() as conn:
+            # Expired rows go as new ones arrive (indexed, so this stays cheap)
+            conn.execute("DELETE FROM analyses WHERE expires_at <= ?", (time.time(),))
+            conn.execute(
+                "INSERT OR REPLACE INTO analyses (analysis_id, record, report_pdf, expires_at) VALUES (?, ?, NULL, ?)",
+                (analysis_id, json.dumps(record), expires_at),
+            )
+
+    def update(self, analysis_id, fields):
+        fields = dict(fields)
+        report_pdf = fields.pop("report_pdf", None)
+        conn = sqlite3.connect(self.path, timeout=10, isolation_level=None)
+        try:
+            # Read-modify-write under the write lock so concurrent updates are not lost
+            conn.execute("BEGIN IMMEDIATE")
+            row = conn.execute("SELECT record FROM analyses WHERE analysis_id = ?", (analysis_id,)).fetchone()
+            if row is not None:
+                if fields:
+                    record = {**json.loads(row[0]), **fields}
+                    conn.execute("UPDATE analyses SET record = ? WHERE analysis_id = ?",
+                                 (json.dumps(record), analysis_id))
+                if report_pdf is not None:
+                    conn.execute("UPDATE analyses SET report_pdf = ? WHERE analysis_id = ?",
+                                 (sqlite3.Binary(report_pdf), analysis_id))
+            conn.execute("COMMIT")
+        except Exception:
+            if conn.in_transaction:
+                conn.execute("ROLLBACK")
+            raise
+        finally:
+            conn.close()
+
+    def get(self, analysis_id, now):
+        """Return (record, expires_at), or None if unknown or expired."""
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT record, report_pdf, expires_at FROM analyses WHERE analysis_id = ? AND expires_at > ?",
+                (analysis_id, now),
+            ).fetchone()
+        if row is None:
+            return None
+        record = json.loads(row[0])
+        if row[1] is not None:
+            record["report_pdf"] = bytes(row[1])
+        return record, row[2]
+
+
+class MongoRecordStore:
+    """Persistent tier shared by all workers and hosts through MongoDB."""
+
+    def __init__(self, collection):
+        self.collection = collection
+        # MongoDB removes documents once expires_at has passed
+        self.collection.create_index("expires_at", expireAfterSeconds=0)
+
+    def insert(self, analysis_id, record, expires_at):
+        self.collection.insert_one({
+            "_id": analysis_id,
+            **record,
+            "expires_at": datetime.fromtimestamp(expires_at, tz=timezone.utc),
+            "expires_ts": expires_at,
+        })
+
+    def update(self, analysis_id, fields):
+        self.collection.update_one({"_id": analysis_id}, {"$set": fields})
+
+    def get(self, analysis_id, now):
+        doc = self.collection.find_one({"_id": analysis_id, "expires_ts": {"$gt": now}})
+        if doc is None:
+            return None
+        record = {k: v for k, v in doc.items() if k not in ("_id", "expires_at", "expires_ts")}
+        if record.get("report_pdf") is not None:
+            record["report_pdf"] = bytes(record["report_pdf"])
+        return record, doc["expires_ts"]
+
+
+class AnalysisStore:
+    """
+    Server-side store for finished analyses, keyed by an opaque analysis ID.
+
+    Each record holds what later steps need (resume text, JD text, analysis,
+    suggestions and the rendered PDF report) so pages only carry the ID.
+    With a persistent ``store`` (SQLite or MongoDB) every read and write goes
+    to it, so any worker sees the latest fields another worker attached.
+    The bounded in-process LRU only holds records when there is no store
+    (or the store rejected the write). Records expire after ``ttl`` seconds.
+    """
+
+    def __init__(self, max_entries=256, ttl=86400, store=None):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.store = store
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def new_id():
+        return secrets.token_urlsafe(16)
+
+    def save(self, resume_text, jd_text, analysis, suggestions=None):
+        """
+        Store a finished analysis.
+
+        Returns:
+            str: The analysis ID to hand to the client
+        """
+        analysis_id = self.new_id()
+        record = {
+            "resume_text": resume_text,
+            "jd_text": jd_text,
+            "analysis": analysis,
+            "suggestions": suggestions,
+        }
+        expires_at = time.time() + self.ttl
+        if self.store is not None:
+            try:
+                self.store.insert(analysis_id, record, expires_at)
+                return analysis_id
+            except Exception as e:
+                logger.warning(f"Could not persist analysis {analysis_id}; keeping it in this worker: {e}")
+        with self._lock:
+            self._remember(analysis_id, record, expires_at)
+        return analysis_id
+
+    def update(self, analysis_id, **fields):
+        """Attach more results (e.g. suggestions, report bytes) to a stored analysis."""
+        with self._lock:
+            entry = self._entries.get(analysis_id)
+            if entry is not None:
+                entry[0].update(fields)
+                return
+
+        if self.store is not None:
+            try:
+                self.store.update(analysis_id, fields)
+            except Exception as e:
+                logger.warning(f"Could not update analysis {analysis_id}: {e}")
+
+    def get(self, analysis_id):
+        """Return the stored record for ``analysis_id``, or None if unknown or expired."""
+        now = time.time()
+        if self.store is not None:
+            # Read through every time: another worker may have attached fields
+            # (suggestions, the report) since this one last looked
+            try:
+                found = self.store.get(analysis_id, now)
+            except Exception as e:
+                logger.warning(f"Could not load analysis {analysis_id}: {e}")
+                found = None
+            if found is not None:
+                return found[0]
+
+        with self._lock:
+            entry = self._entries.get(analysis_id)
+            if entry is None:
+                return None
+            record, expires_at = entry
+            if expires_at <= now:
+                del self._entries[analysis_id]
+                return None
+            self._entries.move_to_end(analysis_id)
+            return record
+
+    def stats(self):
+        backends = {SQLiteRecordStore: "sqlite", MongoRecordStore: "mongo"}
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "ttl": self.ttl,
+                "backend": backends.get(type(self.store), "memory"),
+            }
+
+    def _remember(self, analysis_id, record, expires_at):
+        # Caller must hold self._lock
+        self._entries[analysis_id] = (record, expires_at)
+        self._entries.move_to_end(analysis_id)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+
+def build_analysis_store(config):
+    """Create the analysis store configured by ANALYSIS_STORE_* settings."""
+    backend = config.get("ANALYSIS_STORE_BACKEND", "sqlite")
+    store = None
+    if backend == "sqlite":
+        store = SQLiteRecordStore(config["ANALYSIS_STORE_SQLITE_PATH"])
+    elif backend == "mongo":
+        from .database import Database
+        collection = Database(config).collection("analyses")
+        if collection is not None:
+            store = MongoRecordStore(collection)
+        else:
+            logger.warning("MongoDB unavailable; analyses are kept in memory only")
+
+    return AnalysisStore(
+        max_entries=config.get("ANALYSIS_STORE_SIZE", 256),
+        ttl=config.get("ANALYSIS_STORE_TTL", 86400),
+        store=store,
+    )
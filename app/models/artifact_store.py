@@ -0,0 +1,183 @@
+import fnmatch
+import hashlib
+import logging
+import os
+import re
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+ARTIFACT_ID_RE = re.compile(r"^[0-9a-f]{64}\.[a-z0-9]{1,8}$")
+
+
+class ArtifactStore:
+    """
+    Disk store for generated downloads (reports, improved resumes).
+
+    Files are content-addressed (SHA-256 of the bytes plus extension), so
+    identical outputs are stored once, and sharded into two levels of
+    subdirectories (``ab/cd/abcd....pdf``) to keep directories small. A
+    file's mtime records its last use: it is refreshed on every store and
+    download. ``sweep`` removes files unused for ``ttl`` seconds, then the
+    least recently downloaded files until the store fits ``max_bytes``.
+    With ``legacy_dir`` set (opt-in), expired files matching
+    ``LEGACY_PATTERNS`` there are removed too; nothing else outside
+    ``root`` is touched.
+    """
+
+    # Files written straight into DOWNLOADS_FOLDER by older versions
+    LEGACY_PATTERNS = ("Resume_Analysis_Report_*.pdf", "improved_resume_*")
+
+    def __init__(self, root, ttl=7 * 86400, max_bytes=1024 ** 3, legacy_dir=None):
+        self.root = root
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self.legacy_dir = legacy_dir
+        self._stop = threading.Event()
+        self._sweeper = None
+        self.last_sweep = None
+        os.makedirs(root, exist_ok=True)
+
+    @staticmethod
+    def is_valid_id(artifact_id):
+        return bool(ARTIFACT_ID_RE.match(artifact_id or ""))
+
+    def path_for(self, artifact_id):
+        return os.path.join(self.root, artifact_id[:2], artifact_id[2:4], artifact_id)
+
+    def put(self, data, ext):
+        """
+        Store ``data`` and return its artifact ID (``<sha256>.<ext>``).
+
+        Writing the same bytes again only refreshes the existing file's mtime.
+        """
+        artifact_id = f"{hashlib.sha256(data).hexdigest()}.{ext.lower().lstrip('.')}"
+        path = self.path_for(artifact_id)
+        if self._touch(path):
+            return artifact_id
+
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+        return artifact_id
+
+    def open_path(self, artifact_id):
+        """
+        Resolve an artifact for download and mark it as recently used.
+
+        Returns:
+            str or None: Path of the stored file, None if unknown or evicted
+        """
+        if not self.is_valid_id(artifact_id):
+            return None
+        path = self.path_for(artifact_id)
+        return path if self._touch(path) else None
+
+    def sweep(self):
+        """
+        Evict expired artifacts, then least recently used ones over the size quota.
+
+        Returns:
+            dict: Files removed and bytes kept
+        """
+        now = time.time()
+        files = []
+        for dirpath, _, filenames in os.walk(self.root):
+            for name in filenames:
+                path = os.path.join(dirpath, name)
+                try:
+                    st = os.stat(path)
+                except FileNotFoundError:
+                    continue
+                # Leftovers of interrupted writes are dropped after a minute
+                if name.endswith(".tmp") and now - st.st_mtime > 60:
+                    self._remove(path)
+                elif not name.endswith(".tmp"):
+                    files.append((st.st_mtime, st.st_size, path))
+
+        expired = [f for f in files if now - f[0] > self.ttl]
+        removed = sum(self._remove(path) for _, _, path in expired)
+        live = sorted(f for f in files if now - f[0] <= self.ttl)
+
+        total = sum(size for _, size, _ in live)
+        for _, size, path in live:
+            if total <= self.max_bytes:
+                break
+            removed += self._remove(path)
+            total -= size
+
+        removed += self._sweep_legacy(now)
+        self.last_sweep = now
+        if removed:
+            logger.info(f"Artifact sweep removed {removed} files; {total} bytes kept")
+        return {"removed": removed, "bytes": total}
+
+    def start_sweeper(self, interval=600):
+        """Run ``sweep`` every ``interval`` seconds on a daemon thread."""
+        if self._sweeper is not None or interval <= 0:
+            return
+
+        def loop():
+            # First sweep runs right away, off the startup path
+            while True:
+                try:
+                    self.sweep()
+                except Exception as e:
+                    logger.warning(f"Artifact sweep failed: {e}")
+                if self._stop.wait(interval):
+                    return
+
+        self._sweeper = threading.Thread(target=loop, name="artifact-sweeper", daemon=True)
+        self._sweeper.start()
+
+    def stop_sweeper(self):
+        self._stop.set()
+
+    def stats(self):
+        count = size = 0
+        for dirpath, _, filenames in os.walk(self.root):
+            for name in filenames:
+                try:
+                    size += os.path.getsize(os.path.join(dirpath, name))
+                    count += 1
+                except FileNotFoundError:
+                    pass
+        return {
+            "files": count,
+            "bytes": size,
+            "max_bytes": self.max_bytes,
+            "ttl": self.ttl,
+            "last_sweep": self.last_sweep,
+        }
+
+    def _sweep_legacy(self, now):
+        if not self.legacy_dir or not os.path.isdir(self.legacy_dir):
+            return 0
+        removed = 0
+        for entry in os.scandir(self.legacy_dir):
+            if entry.is_file() and any(fnmatch.fnmatch(entry.name, p) for p in self.LEGACY_PATTERNS):
+                try:
+                    if now - entry.stat().st_mtime > self.ttl:
+                        removed += self._remove(entry.path)
+                except FileNotFoundError:
+                    pass
+        return removed
+
+    @staticmethod
+    def _touch(path):
+        try:
+            os.utime(path)
+            return True
+        except FileNotFoundError:
+            return False
+
+    @staticmethod
+    def _remove(path):
+        try:
+            os.remove(path)
+            return 1
+        except FileNotFoundError:
+            return 0
@@ -1,3 +1,9 @@
+import logging
+from pymongo import MongoClient
+from pymongo.errors import ConnectionFailure
+
+logger = logging.getLogger(__name__)
+
 class Database:
     def __init__(self, config):
         self.config = config
@@ -7,11 +13,20 @@ class Database:
     def connect(self):
         try:
             self.client = MongoClient(
-                self.config.MONGO_URI,
+                self.config["MONGO_URI"],
                 serverSelectionTimeoutMS=5000
             )
             self.client.admin.command("ping")
-            self.db = self.client[self.config.MONGO_DB]
-            ...
+            self.db = self.client[self.config["MONGO_DB"]]
+            logger.info(f"Connected to MongoDB database: {self.config['MONGO_DB']}")
+            return self.db
         except ConnectionFailure as e:
-            ...
+            logger.error(f"Could not connect to MongoDB: {e}")
+            self.client = None
+            self.db = None
+            return None
+
+    def collection(self, name):
+        if self.db is None and self.connect() is None:
+            return None
+        return self.db[name]
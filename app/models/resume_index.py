@@ -0,0 +1,302 @@
+import heapq
+import json
+import math
+import os
+import re
+import sqlite3
+import threading
+import time
+from collections import Counter, OrderedDict
+from ..analyzers.local_analyzer import tokenize, with_bigrams
+
+QUERY_RE = re.compile(r'"([^"]+)"|(\S+)')
+SQL_CHUNK = 900  # stay under SQLite's bound-parameter limit
+SKILL_PREFIX = "skill:"  # postings of canonical taxonomy skills, e.g. skill:kubernetes
+
+
+class ResumeIndex:
+    """
+    Persistent inverted index over extracted resume text.
+
+    Postings (term -> document, term frequency) live in SQLite so the index
+    survives restarts and is shared by all workers; per-document lengths are
+    mirrored in memory, while the corpus size and average length used by
+    BM25 are read from SQLite whenever any worker has written. Terms are the same unigrams and bigrams the
+    local analyzer uses, so quoted two-word phrases match directly. With a
+    skill matcher, each taxonomy skill mentioned is also indexed under its
+    canonical ID, so ``skill:k8s`` finds resumes that say "Kubernetes".
+    """
+
+    K1 = 1.2
+    B = 0.75
+
+    def __init__(self, path, cached_terms=4096, skills=None):
+        self.path = path
+        self.skills = skills
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self._lock = threading.Lock()
+        # Hot postings lists kept in memory; dropped whenever another process
+        # changes the index (detected through the stored generation counter)
+        self.cached_terms = cached_terms
+        self._term_cache = OrderedDict()
+        with self._connect() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS documents ("
+                " doc_id TEXT PRIMARY KEY, length INTEGER NOT NULL,"
+                " metadata TEXT NOT NULL, added_at REAL NOT NULL)"
+            )
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS postings ("
+                " term TEXT NOT NULL, doc_id TEXT NOT NULL, tf INTEGER NOT NULL,"
+                " PRIMARY KEY (term, doc_id)) WITHOUT ROWID"
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS postings_doc ON postings (doc_id)")
+            conn.execute("CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value INTEGER NOT NULL)")
+            conn.execute("INSERT OR IGNORE INTO meta (key, value) VALUES ('generation', 0)")
+            self._lengths = dict(conn.execute("SELECT doc_id, length FROM documents"))
+            self._generation = self._read_generation(conn)
+        # (generation, document count, average length) for BM25, read from SQLite
+        # so every worker scores against the same corpus
+        self._corpus = None
+
+    def _connect(self):
+        return sqlite3.connect(self.path, timeout=10)
+
+    @staticmethod
+    def _read_generation(conn):
+        return conn.execute("SELECT value FROM meta WHERE key = 'generation'").fetchone()[0]
+
+    def _bump_generation(self, conn):
+        """Advance the stored generation inside a write transaction; returns the new value."""
+        conn.execute("UPDATE meta SET value = value + 1 WHERE key = 'generation'")
+        return self._read_generation(conn)
+
+    def _committed(self, generation, apply_to_cache):
+        """Bring the term cache up to date once the write of ``generation`` has committed."""
+        with self._lock:
+            if generation - 1 == self._generation:
+                apply_to_cache()
+            else:
+                # Another process wrote in between; its changes are not in the cache
+                self._term_cache.clear()
+            self._generation = max(self._generation, generation)
+
+    # --- updates ----------------------------------------------------------
+
+    def add(self, doc_id, text, **metadata):
+        """Index ``text`` under ``doc_id``, replacing any previous version of the document."""
+        tokens = tokenize(text)
+        tf = Counter(with_bigrams(tokens))
+        if self.skills is not None:
+            tf.update({SKILL_PREFIX + skill_id: n for skill_id, n in self.skills.extract(text).items()})
+
+        existed = False
+
+        def apply_to_cache():
+            # Cached postings are replaced, never mutated, so concurrent readers stay consistent.
+            # Re-indexing an existing document is rare; just drop the cache then.
+            if existed:
+                self._term_cache.clear()
+                return
+            for term in tf.keys() & self._term_cache.keys():
+                self._term_cache[term] = {**self._term_cache[term], doc_id: tf[term]}
+
+        with self._connect() as conn:
+            generation = self._bump_generation(conn)
+            existed = conn.execute("SELECT 1 FROM documents WHERE doc_id = ?", (doc_id,)).fetchone() is not None
+            conn.execute("DELETE FROM postings WHERE doc_id = ?", (doc_id,))
+            conn.execute(
+                "INSERT OR REPLACE INTO documents (doc_id, length, metadata, added_at) VALUES (?, ?, ?, ?)",
+                (doc_id, len(tokens), json.dumps(metadata), time.time()),
+            )
+            conn.executemany(
+                "INSERT INTO postings (term, doc_id, tf) VALUES (?, ?, ?)",
+                ((term, doc_id, n) for term, n in tf.items()),
+            )
+        self._committed(generation, apply_to_cache)
+        with self._lock:
+            self._lengths[doc_id] = len(tokens)
+
+    def delete(self, doc_id):
+        def apply_to_cache():
+            self._term_cache.clear()
+
+        with self._connect() as conn:
+            generation = self._bump_generation(conn)
+            conn.execute("DELETE FROM postings WHERE doc_id = ?", (doc_id,))
+            removed = conn.execute("DELETE FROM documents WHERE doc_id = ?", (doc_id,)).rowcount
+        self._committed(generation, apply_to_cache)
+        with self._lock:
+            self._lengths.pop(doc_id, None)
+        return removed > 0
+
+    # --- queries ----------------------------------------------------------
+
+    @staticmethod
+    def parse_query(query, skills=None):
+        """
+        Parse a keyword query into AND-ed groups of OR-ed terms plus excluded terms.
+
+        ``kubernetes terraform`` and ``kubernetes AND terraform`` require both
+        terms, ``python OR go`` accepts either, ``NOT java`` / ``-java``
+        excludes, and ``"machine learning"`` matches the phrase. With a skill
+        matcher, ``skill:k8s`` or ``skill:machine-learning`` matches the
+        canonical skill under any of its synonyms.
+
+        Skill postings are written when a resume is added, and the index
+        keeps no resume text to rebuild them from. ``skill:`` terms therefore
+        miss resumes indexed before skill indexing existed or before a skill
+        was added to the taxonomy. Re-add those resumes (or rebuild the
+        index from the source files) to make them findable by skill.
+        """
+        groups, excluded = [], []
+        negate = join_or = False
+        for phrase, word in QUERY_RE.findall(query):
+            if word in ("AND", "&&"):
+                continue
+            if word in ("OR", "||"):
+                join_or = True
+                continue
+            if word == "NOT":
+                negate = True
+                continue
+            if word.startswith("-") and len(word) > 1:
+                negate, word = True, word[1:]
+
+            if skills is not None and word.lower().startswith(SKILL_PREFIX) and len(word) > len(SKILL_PREFIX):
+                name = word[len(SKILL_PREFIX):]
+                terms = [SKILL_PREFIX + (skills.resolve(name) or name.lower())]
+            else:
+                tokens = tokenize(phrase or word)
+                if not tokens:
+                    negate = join_or = False
+                    continue
+                # Longer phrases become consecutive bigrams that must all match
+                terms = with_bigrams(tokens)[len(tokens):] if len(tokens) > 1 else tokens
+
+            if negate:
+                excluded.extend(terms)
+            elif join_or and groups and len(terms) == 1:
+                groups[-1].append(terms[0])
+            else:
+                groups.extend([t] for t in terms)
+            negate = join_or = False
+        return groups, excluded
+
+    def _postings(self, conn, terms):
+        generation = self._read_generation(conn)
+        postings = {}
+        with self._lock:
+            if generation != self._generation:
+                self._term_cache.clear()
+                self._generation = generation
+            for term in set(terms):
+                if term in self._term_cache:
+                    self._term_cache.move_to_end(term)
+                    postings[term] = self._term_cache[term]
+
+        for term in set(terms) - postings.keys():
+            docs = dict(conn.execute("SELECT doc_id, tf FROM postings WHERE term = ?", (term,)))
+            postings[term] = docs
+            with self._lock:
+                if self._generation == generation:
+                    self._term_cache[term] = docs
+                    while len(self._term_cache) > self.cached_terms:
+                        self._term_cache.popitem(last=False)
+        return postings
+
+    def _doc_lengths(self, conn, doc_ids):
+        with self._lock:
+            lengths = {d: self._lengths[d] for d in doc_ids if d in self._lengths}
+        unknown = [d for d in doc_ids if d not in lengths]
+        # Documents added by other workers since this process loaded the index
+        for i in range(0, len(unknown), SQL_CHUNK):
+            chunk = unknown[i:i + SQL_CHUNK]
+            rows = conn.execute(
+                f"SELECT doc_id, length FROM documents WHERE doc_id IN ({','.join('?' * len(chunk))})", chunk
+            ).fetchall()
+            lengths.update(rows)
+            with self._lock:
+                self._lengths.update(rows)
+        return lengths
+
+    def _corpus_stats(self, conn):
+        """Document count and average length of the whole index, refreshed when any worker writes."""
+        generation = self._read_generation(conn)
+        corpus = self._corpus
+        if corpus is None or corpus[0] != generation:
+            count, avg_len = conn.execute("SELECT COUNT(*), AVG(length) FROM documents").fetchone()
+            corpus = self._corpus = (generation, max(count, 1), avg_len or 1)
+        return corpus[1], corpus[2]
+
+    def search(self, query, k=10, mode="ranked"):
+        """
+        Run a keyword query.
+
+        Args:
+            query: Query string (see parse_query)
+            k: Number of results to return
+            mode: "boolean" returns only documents satisfying every group;
+                  "ranked" returns any document matching a query term
+
+        Returns:
+            dict: total match count and the top-k results ordered by BM25 score
+        """
+        groups, excluded = self.parse_query(query, self.skills)
+        terms = [t for group in groups for t in group]
+        if not terms:
+            return {"total": 0, "results": []}
+
+        with self._connect() as conn:
+            postings = self._postings(conn, terms + excluded)
+
+            if mode == "boolean":
+                candidates = None
+                for group in groups:
+                    matched = set().union(*(postings[t].keys() for t in group))
+                    candidates = matched if candidates is None else candidates & matched
+                    if not candidates:
+                        break
+            else:
+                candidates = set().union(*(postings[t].keys() for t in terms))
+            for term in excluded:
+                candidates -= postings[term].keys()
+
+            lengths = self._doc_lengths(conn, list(candidates))
+            n_docs, avg_len = self._corpus_stats(conn)
+
+            idf = {
+                t: math.log(1 + (n_docs - len(postings[t]) + 0.5) / (len(postings[t]) + 0.5))
+                for t in set(terms)
+            }
+
+            def score(doc_id):
+                norm = self.K1 * (1 - self.B + self.B * lengths.get(doc_id, avg_len) / avg_len)
+                total = 0.0
+                for t in idf:
+                    tf = postings[t].get(doc_id)
+                    if tf:
+                        total += idf[t] * tf * (self.K1 + 1) / (tf + norm)
+                return total
+
+            top = heapq.nlargest(k, ((score(d), d) for d in candidates))
+            metadata = {}
+            if top:
+                ids = [d for _, d in top]
+                rows = conn.execute(
+                    f"SELECT doc_id, metadata, added_at FROM documents WHERE doc_id IN ({','.join('?' * len(ids))})", ids
+                ).fetchall()
+                metadata = {d: (json.loads(m), added) for d, m, added in rows}
+
+        results = []
+        for s, d in top:
+            meta, added_at = metadata.get(d, ({}, None))
+            results.append({"doc_id": d, "score": round(s, 4), "added_at": added_at, **meta})
+        return {"total": len(candidates), "results": results}
+
+    def stats(self):
+        with self._connect() as conn:
+            terms = conn.execute("SELECT COUNT(DISTINCT term) FROM postings").fetchone()[0]
+            documents = conn.execute("SELECT COUNT(*) FROM documents").fetchone()[0]
+        return {"documents": documents, "terms": terms}
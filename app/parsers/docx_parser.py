@@ -1,10 +1,97 @@
-from docx import Document
+from io import BytesIO
 import re
+import zipfile
+import logging
+from xml.etree.ElementTree import iterparse, ParseError
+
+logger = logging.getLogger(__name__)
+
+W = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+P, T, TAB, BR, CR = W + "p", W + "t", W + "tab", W + "br", W + "cr"
+TC, VMERGE, VAL = W + "tc", W + "vMerge", W + "val"
 
 class DOCXParser:
+    # Bump when extraction output changes so cached text is not reused
+    VERSION = 2
+
+    @classmethod
+    def extract_text(cls, path):
+        return cls._extract(path)
+
+    @classmethod
+    def extract_text_from_bytes(cls, data):
+        return cls._extract(BytesIO(data))
+
+    @classmethod
+    def _extract(cls, source):
+        try:
+            return cls._extract_streaming(source)
+        except (KeyError, ParseError) as e:
+            logger.warning(f"Streaming DOCX extraction failed ({e}); falling back to python-docx")
+            if hasattr(source, "seek"):
+                source.seek(0)
+            from docx import Document
+            return cls._extract_document(Document(source))
+
+    @staticmethod
+    def _extract_streaming(source):
+        """
+        Stream word/document.xml and collect text in document order.
+
+        Body paragraphs and table cells are emitted as they close, so tables
+        stay where they appear in the document. Horizontally merged cells
+        exist once in the XML, and vertically merged continuation cells are
+        skipped, so merged text is not repeated per grid position.
+        """
+        parts = []
+        paragraphs = []  # stack of run-text lists, one per open <w:p>
+        cells = []       # stack of open <w:tc>: {"paras": [...], "skip": bool}
+
+        with zipfile.ZipFile(source) as zf, zf.open("word/document.xml") as xml:
+            for event, elem in iterparse(xml, events=("start", "end")):
+                tag = elem.tag
+                if event == "start":
+                    if tag == P:
+                        paragraphs.append([])
+                    elif tag == TC:
+                        cells.append({"paras": [], "skip": False})
+                    continue
+
+                if tag == T:
+                    if paragraphs and elem.text:
+                        paragraphs[-1].append(elem.text)
+                elif tag == TAB:
+                    if paragraphs:
+                        paragraphs[-1].append("\t")
+                elif tag in (BR, CR):
+                    if paragraphs:
+                        paragraphs[-1].append("\n")
+                elif tag == VMERGE:
+                    # <w:vMerge/> without val="restart" continues the cell above
+                    if cells and elem.get(VAL, "continue") == "continue":
+                        cells[-1]["skip"] = True
+                elif tag == P:
+                    text = "".join(paragraphs.pop())
+                    if cells:
+                        cells[-1]["paras"].append(text)
+                    elif text.strip():
+                        parts.append(text)
+                    elem.clear()
+                elif tag == TC:
+                    cell = cells.pop()
+                    text = "\n".join(cell["paras"])
+                    if not cell["skip"] and text.strip():
+                        if cells:
+                            cells[-1]["paras"].append(text)
+                        else:
+                            parts.append(text)
+                    elem.clear()
+
+        text = "\n".join(parts)
+        return text.strip()
+
     @staticmethod
-    def extract_text(path):
-        doc = Document(path)
+    def _extract_document(doc):
         parts = []
         for p in doc.paragraphs:
             if p.text.strip():
@@ -0,0 +1,133 @@
+import logging
+import os
+import threading
+from collections import OrderedDict
+
+logger = logging.getLogger(__name__)
+
+
+class ExtractionCache:
+    """
+    Content-addressed cache for extracted document text.
+
+    Entries are keyed by the SHA-256 of the uploaded bytes plus the parser
+    name and version, so re-uploading the same file skips fitz/python-docx
+    entirely. A bounded in-memory LRU tier is always used; an on-disk tier
+    is enabled when ``cache_dir`` is given and survives restarts.
+    """
+
+    def __init__(self, max_entries=256, cache_dir=None):
+        self.max_entries = max_entries
+        self.cache_dir = cache_dir
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+
+        if self.cache_dir:
+            os.makedirs(self.cache_dir, exist_ok=True)
+
+    @staticmethod
+    def make_key(digest, parser, variant=""):
+        """
+        Build the cache key for a file's SHA-256 digest and the parser class that reads it.
+
+        ``variant`` distinguishes extraction options that change the output
+        (e.g. a page cap), so text extracted under other settings is not reused.
+        """
+        key = f"{parser.__name__.lower()}-v{parser.VERSION}-{digest}"
+        return f"{key}-{variant}" if variant else key
+
+    def get(self, key):
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return self._entries[key]
+
+        text = self._read_disk(key)
+        with self._lock:
+            if text is None:
+                self.misses += 1
+                return None
+            self.disk_hits += 1
+            self._remember(key, text)
+        return text
+
+    def put(self, key, text):
+        with self._lock:
+            self._remember(key, text)
+        self._write_disk(key, text)
+
+    def get_or_extract(self, digest, parser, extract, variant=""):
+        """
+        Return cached text for a file or run ``extract()`` and store its result.
+
+        Args:
+            digest: SHA-256 hex digest of the uploaded file's bytes
+            parser: Parser class (PDFParser / DOCXParser) used for extraction
+            extract: Zero-argument callable performing the real extraction
+            variant: Optional tag for output-affecting extraction options
+
+        Returns:
+            str: Extracted text
+        """
+        key = self.make_key(digest, parser, variant)
+        text = self.get(key)
+        if text is None:
+            text = extract()
+            self.put(key, text)
+        return text
+
+    def stats(self):
+        with self._lock:
+            lookups = self.hits + self.disk_hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "hits": self.hits,
+                "disk_hits": self.disk_hits,
+                "misses": self.misses,
+                "hit_rate": round((self.hits + self.disk_hits) / lookups, 4) if lookups else 0.0,
+                "disk_enabled": bool(self.cache_dir),
+            }
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.disk_hits = self.misses = 0
+
+    def _remember(self, key, text):
+        # Caller must hold self._lock
+        self._entries[key] = text
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def _disk_path(self, key):
+        return os.path.join(self.cache_dir, f"{key}.txt")
+
+    def _read_disk(self, key):
+        if not self.cache_dir:
+            return None
+        try:
+            with open(self._disk_path(key), "r", encoding="utf-8") as f:
+                return f.read()
+        except FileNotFoundError:
+            return None
+        except OSError as e:
+            logger.warning(f"Could not read extraction cache entry {key}: {e}")
+            return None
+
+    def _write_disk(self, key, text):
+        if not self.cache_dir:
+            return
+        path = self._disk_path(key)
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                f.write(text)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.warning(f"Could not write extraction cache entry {key}: {e}")
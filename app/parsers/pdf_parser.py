@@ -1,13 +1,139 @@
-import fitz
+import os
 import re
+import tempfile
+import threading
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+
+# Shared pool for page-parallel extraction. fitz is not thread-safe, so work
+# is split across processes; "spawn" avoids forking a threaded server.
+_pool = None
+_pool_workers = 0
+_pool_lock = threading.Lock()
+
+def _get_pool(workers):
+    global _pool, _pool_workers
+    with _pool_lock:
+        if _pool is None or _pool_workers != workers:
+            if _pool is not None:
+                _pool.shutdown(wait=False)
+            # "spawn" keeps workers clear of the threaded server's state, but each
+            # worker re-runs the entry module: entry points that build the app at
+            # import must skip that under __mp_main__ (see app/main.py)
+            _pool = ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn"))
+            _pool_workers = workers
+        return _pool
+
+def _open(source):
+    # PyMuPDF is loaded on the first PDF, not at app import
+    import fitz
+    if isinstance(source, (bytes, bytearray)):
+        return fitz.open(stream=source, filetype="pdf")
+    return fitz.open(source)
+
+def _read_pages(doc, start, stop, max_chars=0):
+    parts = []
+    total = 0
+    for i in range(start, stop):
+        page_text = doc[i].get_text()
+        parts.append(page_text)
+        parts.append("\n")
+        total += len(page_text) + 1
+        if max_chars and total >= max_chars:
+            break
+    return "".join(parts)
+
+def _extract_page_range(source, start, stop, max_chars):
+    # Runs in a worker process, which opens its own copy of the document
+    doc = _open(source)
+    try:
+        return _read_pages(doc, start, stop, max_chars)
+    finally:
+        doc.close()
 
 class PDFParser:
+    # Bump when extraction output changes so cached text is not reused
+    VERSION = 1
+
     @classmethod
-    def extract_text(cls, path):
-        doc = fitz.open(path)
-        text = ""
-        for page in doc:
-            text += page.get_text() + "\n"
-        doc.close()
+    def extract_text(cls, path, **options):
+        return cls._extract(path, **options)
+
+    @classmethod
+    def extract_text_from_bytes(cls, data, **options):
+        return cls._extract(data, **options)
+
+    @classmethod
+    def _extract(cls, source, max_pages=0, max_chars=0, workers=0, parallel_min_pages=16):
+        """
+        Extract text from a PDF path or bytes.
+
+        Args:
+            source: File path or raw PDF bytes
+            max_pages: Only read the first N pages (0 = all pages)
+            max_chars: Stop reading further pages once this many characters were collected and
+                return exactly the first max_chars of them (0 = no limit)
+            workers: Process pool size for page-parallel extraction (0 or 1 = serial)
+            parallel_min_pages: Documents shorter than this are always read serially
+
+        Returns:
+            str: Extracted text
+        """
+        doc = _open(source)
+        try:
+            page_count = doc.page_count
+            if max_pages:
+                page_count = min(page_count, max_pages)
+            if workers > 1 and page_count >= parallel_min_pages:
+                doc.close()
+                doc = None
+                text = cls._extract_parallel(source, page_count, max_chars, workers)
+            else:
+                text = _read_pages(doc, 0, page_count, max_chars)
+        finally:
+            if doc is not None:
+                doc.close()
+        # Serial and parallel reads stop at different page boundaries; the
+        # exact cut makes both return the same text (and share a cache entry)
+        if max_chars:
+            text = text[:max_chars]
         # Removed re.sub that was flattening text into a single line
         return text.strip()
+
+    @staticmethod
+    def _extract_parallel(source, page_count, max_chars, workers):
+        pool = _get_pool(workers)
+        chunk_size = max(4, -(-page_count // (workers * 2)))
+
+        # Workers get a file path, not a pickled copy of the whole PDF per chunk
+        spooled = None
+        if isinstance(source, (bytes, bytearray)):
+            fd, spooled = tempfile.mkstemp(suffix=".pdf")
+            with os.fdopen(fd, "wb") as f:
+                f.write(source)
+            source = spooled
+
+        futures = [
+            pool.submit(_extract_page_range, source, start, min(start + chunk_size, page_count), max_chars)
+            for start in range(0, page_count, chunk_size)
+        ]
+        try:
+            # Join chunks in page order, dropping later ones once max_chars is reached
+            parts = []
+            total = 0
+            for i, future in enumerate(futures):
+                chunk = future.result()
+                parts.append(chunk)
+                total += len(chunk)
+                if max_chars and total >= max_chars:
+                    break
+            return "".join(parts)
+        finally:
+            for pending in futures:
+                pending.cancel()
+            if spooled is not None:
+                # Chunks already running must finish before their input goes away
+                for pending in futures:
+                    if not pending.cancelled():
+                        pending.exception()
+                os.remove(spooled)
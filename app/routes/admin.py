@@ -0,0 +1,58 @@
+import hmac
+import os
+from flask import Blueprint, Response, current_app, jsonify, request, send_file, abort
+from ..utils.profiler import PSTATS_SORT_KEYS, pstats_text
+
+admin_bp = Blueprint("admin", __name__, url_prefix="/admin")
+
+@admin_bp.before_request
+def require_admin():
+    """
+    Admin endpoints need the ADMIN_TOKEN (X-Admin-Token header or ?token=).
+    Without a configured token they are closed: behind a reverse proxy on the
+    same host every request looks local, so the peer address proves nothing.
+    """
+    token = current_app.config.get("ADMIN_TOKEN", "")
+    if not token:
+        abort(403, description="Set ADMIN_TOKEN to use the admin endpoints")
+    given = request.headers.get("X-Admin-Token") or request.args.get("token", "")
+    if not hmac.compare_digest(given.encode("utf-8"), token.encode("utf-8")):
+        abort(403)
+
+def _store():
+    profiler = current_app.extensions.get("profiler")
+    if profiler is None:
+        abort(404, description="Profiling is disabled (PROFILE_ENABLED=false)")
+    return profiler.store
+
+@admin_bp.route("/profiles", methods=["GET"])
+def list_profiles():
+    """Captured profiles, newest first, with download links."""
+    profiles = _store().list()
+    for profile in profiles:
+        profile["downloads"] = {
+            kind: f"/admin/profiles/{profile['id']}/{kind}"
+            for kind in profile.get("files", []) + (["txt"] if "pstats" in profile.get("files", []) else [])
+        }
+    return jsonify({"profiles": profiles})
+
+@admin_bp.route("/profiles/<profile_id>/<kind>", methods=["GET"])
+def download_profile(profile_id, kind):
+    """
+    Download one profile: ``pstats`` (load with pstats/snakeviz), ``collapsed``
+    (flamegraph.pl / speedscope input) or ``txt`` (pstats report, ?sort=time).
+    """
+    store = _store()
+    if kind == "txt":
+        sort = request.args.get("sort", "cumulative")
+        if sort not in PSTATS_SORT_KEYS:
+            abort(400, description=f"Unknown sort; use one of: {', '.join(sorted(PSTATS_SORT_KEYS))}")
+        path = store.path_for(profile_id, "pstats")
+        if path is None or not os.path.exists(path):
+            abort(404)
+        return Response(pstats_text(path, sort=sort), mimetype="text/plain")
+
+    path = store.path_for(profile_id, kind)
+    if path is None or not os.path.exists(path):
+        abort(404)
+    return send_file(path, as_attachment=True, download_name=f"{profile_id}.{kind}")
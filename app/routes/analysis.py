@@ -1,6 +1,11 @@
-from flask import Blueprint, render_template, current_app
+from flask import Blueprint, render_template, current_app, jsonify, request
+import copy
+import time
 from ..analyzers.ai_engine import AIEngine
-from ..analyzers.scoring_engine import ScoringEngine
+from ..analyzers.scoring_engine import (
+    ScoringEngine, normalize_weights, recommendation_for, rescore_matrix, weight_profiles,
+)
+from ..utils.metrics import stage_timer
 
 analysis_bp = Blueprint("analysis", __name__)
 
@@ -8,13 +13,152 @@ analysis_bp = Blueprint("analysis", __name__)
 def analysis_dummy():
     return "OK"
 
-def run_analysis(resume_text, jd_text):
+@analysis_bp.route("/api/cache-stats", methods=["GET"])
+def cache_stats():
+    cache = current_app.extensions.get("extraction_cache")
+    llm_cache = current_app.extensions.get("llm_cache")
+    return jsonify({
+        "extraction_cache": cache.stats() if cache else None,
+        "llm_cache": llm_cache.stats() if llm_cache else None,
+    })
+
+def run_analysis(resume_text, jd_text, on_parameter=None):
+    """
+    Analyze and score a resume against a job description.
+
+    ``on_parameter(name, parameter)`` is called with each weighted parameter
+    as soon as the AI engine produces it, before the full analysis is ready.
+    """
     cfg = current_app.config
-    ai = AIEngine(cfg)
+    ai = AIEngine(
+        cfg,
+        cache=current_app.extensions.get("llm_cache"),
+        client=current_app.extensions.get("openai_client"),
+    )
     scorer = ScoringEngine(cfg)
 
-    raw = ai.analyze(resume_text, jd_text)
-    scored = scorer.apply_weights(raw)
-    matrix = scorer.to_matrix(scored)
+    def scored_parameter(name, param):
+        scorer.score_parameter(name, param)
+        if on_parameter is not None:
+            on_parameter(name, param)
+
+    with stage_timer("analyze"):
+        raw = ai.analyze(resume_text, jd_text, on_parameter=scored_parameter)
+    with stage_timer("apply_weights"):
+        scored = scorer.apply_weights(raw)
+        matrix = scorer.to_matrix(scored)
 
     return scored, matrix
+
+@analysis_bp.route("/api/weight-profiles", methods=["GET"])
+def list_weight_profiles():
+    return jsonify({"profiles": weight_profiles(current_app.config)})
+
+@analysis_bp.route("/api/rescore", methods=["POST"])
+def rescore():
+    """
+    Re-score finished analyses under other weight profiles, without calling the LLM.
+
+    Expected JSON body:
+        analysis_ids: IDs of stored analyses (from /compare and the jobs API), and/or
+        scores: raw parameter scores, e.g. the "scores" of /api/batch-rank results
+        profiles: profile names to score under (default: all, see /api/weight-profiles)
+        weights: optional ad-hoc {parameter: weight} profile, reported as "custom"
+        include_matrix: add each stored analysis's re-weighted matrix
+            (default: only when re-scoring a single analysis)
+
+    All analyses are scored under all profiles in one scores x weights
+    product. Returns one result per analysis, in request order, with
+    overall_score and recommendation per profile.
+    """
+    cfg = current_app.config
+    data = request.get_json(silent=True) or {}
+    analysis_ids = data.get("analysis_ids") or []
+    raw_scores = data.get("scores") or []
+    if not isinstance(analysis_ids, list) or not isinstance(raw_scores, list):
+        return jsonify({"error": "analysis_ids and scores must be lists"}), 400
+    if not analysis_ids and not raw_scores:
+        return jsonify({"error": "Provide analysis_ids and/or scores"}), 400
+    if len(analysis_ids) + len(raw_scores) > cfg["RESCORE_MAX_ANALYSES"]:
+        return jsonify({"error": f"At most {cfg['RESCORE_MAX_ANALYSES']} analyses per request."}), 400
+
+    available = weight_profiles(cfg)
+    names = data.get("profiles") or list(available)
+    if not isinstance(names, list) or not all(isinstance(name, str) for name in names):
+        return jsonify({"error": "profiles must be a list of profile names"}), 400
+    unknown = [name for name in names if name not in available]
+    if unknown:
+        return jsonify({"error": f"Unknown weight profiles: {', '.join(map(str, unknown))}"}), 400
+    profiles = {name: available[name] for name in names}
+    if data.get("weights"):
+        custom = data["weights"]
+        if not isinstance(custom, dict) or not all(isinstance(w, (int, float)) and w >= 0 for w in custom.values()):
+            return jsonify({"error": "weights must map parameters to non-negative numbers"}), 400
+        extra = set(custom) - set(available["default"])
+        if extra:
+            return jsonify({"error": f"Unknown parameters: {', '.join(sorted(extra))}"}), 400
+        try:
+            profiles["custom"] = normalize_weights(custom)
+        except ValueError as e:
+            return jsonify({"error": str(e)}), 400
+
+    started = time.perf_counter()
+    with stage_timer("rescore"):
+        # Analyses as rows of parameter scores, profiles as rows of weights (same columns)
+        columns = list(available["default"])
+        for weights in profiles.values():
+            columns += [key for key in weights if key not in columns]
+
+        store = current_app.extensions["analysis_store"]
+        results, rows, analyses = [], [], []
+        for analysis_id in analysis_ids:
+            record = store.get(analysis_id) if isinstance(analysis_id, str) else None
+            if record is None:
+                results.append({"analysis_id": analysis_id, "error": "Analysis not found or expired"})
+                continue
+            parameters = record["analysis"].get("parameters", {})
+            try:
+                # Stored scores may be missing, null or strings (LLM output)
+                row = [float(parameters.get(key, {}).get("score") or 0) for key in columns]
+            except (AttributeError, TypeError, ValueError):
+                results.append({"analysis_id": analysis_id, "error": "Stored analysis has non-numeric scores"})
+                continue
+            results.append({"analysis_id": analysis_id})
+            rows.append(row)
+            analyses.append(record["analysis"])
+        for i, scores in enumerate(raw_scores):
+            try:
+                row = [float(scores.get(key) or 0) for key in columns]
+            except (AttributeError, TypeError, ValueError):
+                results.append({"index": i, "error": "scores entries must map parameters to numbers"})
+                continue
+            results.append({"index": i})
+            rows.append(row)
+            analyses.append(None)
+
+        vectors = [[weights.get(key, 0) for key in columns] for weights in profiles.values()]
+        totals = rescore_matrix(rows, vectors)
+
+        include_matrix = data.get("include_matrix", len(rows) == 1)
+        scored = iter(zip(totals, analyses))
+        for result in results:
+            if "error" in result:
+                continue
+            row_totals, analysis = next(scored)
+            result["profiles"] = {}
+            for (name, weights), total in zip(profiles.items(), row_totals):
+                entry = {"overall_score": round(total, 2), "recommendation": recommendation_for(total)}
+                if include_matrix and analysis is not None:
+                    reweighted = {"parameters": copy.deepcopy(analysis.get("parameters", {}))}
+                    for param in reweighted["parameters"].values():
+                        param["score"] = float(param.get("score") or 0)
+                    scorer = ScoringEngine(cfg, weights=weights)
+                    scorer.apply_weights(reweighted)
+                    entry["matrix"] = scorer.to_matrix(reweighted)
+                result["profiles"][name] = entry
+
+    return jsonify({
+        "profiles": profiles,
+        "results": results,
+        "took_ms": round((time.perf_counter() - started) * 1000, 2),
+    })
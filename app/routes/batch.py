@@ -0,0 +1,122 @@
+from flask import Blueprint, request, jsonify, current_app, Response, stream_with_context
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+import json
+from ..utils.helpers import read_zip_uploads
+from .upload import receive_upload, extract_upload, parser_options, index_resume
+from .analysis import run_analysis
+
+batch_bp = Blueprint("batch", __name__)
+
+@batch_bp.route("/api/batch-rank", methods=["POST"])
+def batch_rank():
+    """
+    Rank many resumes against one job description.
+
+    Expected multipart form:
+        job_description: a .pdf/.docx file
+        resumes: one or more .pdf/.docx files, and/or
+        archive: a .zip of .pdf/.docx resumes
+
+    Streams newline-delimited JSON: one {"event": "result"} (or "error")
+    line per candidate as soon as it is scored, then a final
+    {"event": "ranking"} line sorted by overall_score.
+    """
+    cfg = current_app.config
+    allowed = cfg["ALLOWED_EXTENSIONS"]
+    max_resumes = cfg["BATCH_MAX_RESUMES"]
+
+    jd_file = request.files.get("job_description")
+    resume_files = [f for f in request.files.getlist("resumes") if f and f.filename]
+    archive = request.files.get("archive")
+
+    if not jd_file or not (resume_files or archive):
+        return jsonify({"error": "A job description and at least one resume are required."}), 400
+
+    try:
+        jd_upload = receive_upload(jd_file)
+        resumes = [receive_upload(f) for f in resume_files]
+        if archive and archive.filename:
+            resumes += read_zip_uploads(archive, allowed, max_resumes, cfg["UPLOAD_MAX_MEMORY_BYTES"])
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+
+    if not resumes:
+        return jsonify({"error": "No supported resumes found."}), 400
+    if len(resumes) > max_resumes:
+        return jsonify({"error": f"At most {max_resumes} resumes per batch."}), 400
+
+    print(f"[BATCH] Ranking {len(resumes)} resumes against {jd_upload.filename}")
+
+    app = current_app._get_current_object()
+    cache = current_app.extensions.get("extraction_cache")
+    # Options are resolved here because worker threads have no app context
+    jobs = [(upload, parser_options(upload)) for upload in resumes]
+
+    try:
+        jd_text = extract_upload(jd_upload, cache)
+    except Exception as e:
+        return jsonify({"error": f"Could not read job description: {e}"}), 400
+
+    def analyze(upload, resume_text):
+        with app.app_context():
+            analysis, _ = run_analysis(resume_text, jd_text)
+            index_resume(upload, resume_text, analysis)
+        return upload.filename, analysis
+
+    def generate():
+        parse_pool = ThreadPoolExecutor(max_workers=cfg["BATCH_PARSE_WORKERS"])
+        llm_pool = ThreadPoolExecutor(max_workers=cfg["BATCH_LLM_CONCURRENCY"])
+        ranking = []
+        try:
+            parse_futures = {
+                parse_pool.submit(extract_upload, upload, cache, options): upload
+                for upload, options in jobs
+            }
+
+            # Wait on parsing and analysis together: each resume goes to the bounded
+            # LLM pool once parsed, and results stream while others still parse
+            analysis_futures = {}
+            pending = set(parse_futures)
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    if future in parse_futures:
+                        upload = parse_futures[future]
+                        try:
+                            resume_text = future.result()
+                        except Exception as e:
+                            yield json.dumps({"event": "error", "filename": upload.filename, "error": f"Could not parse: {e}"}) + "\n"
+                            continue
+                        analysis_future = llm_pool.submit(analyze, upload, resume_text)
+                        analysis_futures[analysis_future] = upload.filename
+                        pending.add(analysis_future)
+                        continue
+
+                    try:
+                        filename, analysis = future.result()
+                    except Exception as e:
+                        filename = analysis_futures[future]
+                        yield json.dumps({"event": "error", "filename": filename, "error": str(e)}) + "\n"
+                        continue
+
+                    result = {
+                        "filename": filename,
+                        "overall_score": analysis.get("overall_score", 0),
+                        "recommendation": analysis.get("recommendation"),
+                        "summary": analysis.get("summary"),
+                        "scores": {k: p.get("score", 0) for k, p in analysis.get("parameters", {}).items()},
+                        "is_demo": bool(analysis.get("_is_demo")),
+                    }
+                    ranking.append(result)
+                    yield json.dumps({"event": "result", **result}) + "\n"
+
+            ranking.sort(key=lambda r: r["overall_score"], reverse=True)
+            for rank, result in enumerate(ranking, 1):
+                result["rank"] = rank
+            yield json.dumps({"event": "ranking", "total": len(jobs), "ranked": len(ranking), "ranking": ranking}) + "\n"
+        finally:
+            # Also runs when the client disconnects mid-stream
+            parse_pool.shutdown(wait=False, cancel_futures=True)
+            llm_pool.shutdown(wait=False, cancel_futures=True)
+
+    return Response(stream_with_context(generate()), mimetype="application/x-ndjson")
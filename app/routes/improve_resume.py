@@ -1,17 +1,112 @@
 from flask import Blueprint, request, send_file, jsonify, current_app
+import io
+import uuid
 from ..generators.resume_generator import ATSResumeGenerator
-import os
-import json
+from ..utils.metrics import stage_timer
 from datetime import datetime
 
 improve_resume_bp = Blueprint("improve_resume", __name__)
 
+def resolve_payload(data):
+    """
+    Expand an ``analysis_id`` request into the stored texts, analysis and suggestions.
+
+    Payloads that already carry resume_text/jd_text/suggestions are returned as-is.
+
+    Raises:
+        LookupError: If the analysis ID is unknown or has expired
+    """
+    analysis_id = data.get("analysis_id")
+    if not analysis_id:
+        return data
+    record = current_app.extensions["analysis_store"].get(analysis_id)
+    if record is None:
+        raise LookupError("Analysis not found or expired. Please run the comparison again.")
+    return {**record, "format": data.get("format", "docx")}
+
+def build_improved_resume(cfg, data):
+    """
+    Generate the improved resume file described by a request payload.
+
+    Args:
+        cfg: App config
+        data: Payload as accepted by /api/generate-improved-resume
+
+    Returns:
+        dict: data (file bytes), download_name, mimetype and artifact_id (set
+        only when PERSIST_DOWNLOADS also keeps the file in the artifact store)
+
+    Raises:
+        ValueError: If required fields are missing
+    """
+    print(f"[IMPROVE RESUME] Received request for format: {data.get('format', 'docx')}")
+    
+    resume_text = data.get("resume_text")
+    suggestions = data.get("suggestions")
+    analysis = data.get("analysis")
+    jd_text = data.get("jd_text")
+    output_format = data.get("format", "docx")
+    
+    print(f"[IMPROVE RESUME] Resume text length: {len(resume_text) if resume_text else 0}")
+    print(f"[IMPROVE RESUME] Suggestions: {suggestions.get('_is_demo', 'unknown') if suggestions else 'None'}")
+    
+    if not all([resume_text, suggestions, jd_text]):
+        raise ValueError("Missing required fields")
+    
+    generator = ATSResumeGenerator(
+        cfg,
+        client=current_app.extensions.get("openai_client"),
+        artifacts=current_app.extensions.get("artifact_store"),
+    )
+    
+    # Generate improved resume content
+    print(f"[IMPROVE RESUME] Calling generator.generate_improved_resume...")
+    with stage_timer("resume_generation"):
+        resume_data = generator.generate_improved_resume(
+            resume_text, 
+            suggestions, 
+            analysis or {},
+            jd_text
+        )
+    
+    print(f"[IMPROVE RESUME] Resume data generated. Is demo: {resume_data.get('_is_demo', False)}")
+    
+    # Create output filename (the random suffix keeps concurrent requests apart)
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    suffix = uuid.uuid4().hex[:8]
+    buffer = io.BytesIO()
+    
+    if output_format == "pdf":
+        filename = f"improved_resume_{timestamp}_{suffix}.pdf"
+        print("[IMPROVE RESUME] Rendering .pdf in memory")
+        with stage_timer("pdf_build"):
+            generator.create_pdf(resume_data, buffer)
+        mimetype = 'application/pdf'
+    else:
+        filename = f"improved_resume_{timestamp}_{suffix}.docx"
+        print("[IMPROVE RESUME] Rendering .docx in memory")
+        with stage_timer("docx_build"):
+            generator.create_docx(resume_data, buffer)
+        mimetype = 'application/vnd.openxmlformats-officedocument.wordprocessingml.document'
+    
+    artifact_id = None
+    if cfg.get("PERSIST_DOWNLOADS", False):
+        artifact_id = generator.save(buffer.getvalue(), "pdf" if output_format == "pdf" else "docx")
+    
+    return {"data": buffer.getvalue(), "artifact_id": artifact_id, "download_name": filename, "mimetype": mimetype}
+
 @improve_resume_bp.route("/api/generate-improved-resume", methods=["POST"])
 def generate_improved_resume():
     """
     Generate an improved ATS-friendly resume based on suggestions.
     
     Expected JSON payload:
+    {
+        "analysis_id": "ID returned by /compare",
+        "format": "docx" or "pdf"
+    }
+
+    or, without a stored analysis:
     {
         "resume_text": "original resume text",
         "suggestions": {...},
@@ -23,60 +118,22 @@ def generate_improved_resume():
     try:
         data = request.get_json()
         
-        print(f"[IMPROVE RESUME] Received request for format: {data.get('format', 'docx')}")
-        
-        resume_text = data.get("resume_text")
-        suggestions = data.get("suggestions")
-        analysis = data.get("analysis")
-        jd_text = data.get("jd_text")
-        output_format = data.get("format", "docx")
-        
-        print(f"[IMPROVE RESUME] Resume text length: {len(resume_text) if resume_text else 0}")
-        print(f"[IMPROVE RESUME] Suggestions: {suggestions.get('_is_demo', 'unknown') if suggestions else 'None'}")
-        
-        if not all([resume_text, suggestions, jd_text]):
-            return jsonify({"error": "Missing required fields"}), 400
-        
-        cfg = current_app.config
-        generator = ATSResumeGenerator(cfg)
-        
-        # Generate improved resume content
-        print(f"[IMPROVE RESUME] Calling generator.generate_improved_resume...")
-        resume_data = generator.generate_improved_resume(
-            resume_text, 
-            suggestions, 
-            analysis or {},
-            jd_text
-        )
-        
-        print(f"[IMPROVE RESUME] Resume data generated. Is demo: {resume_data.get('_is_demo', False)}")
-        
-        # Create output filename
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        
-        if output_format == "pdf":
-            filename = f"improved_resume_{timestamp}.pdf"
-            file_path = os.path.join(cfg["DOWNLOADS_FOLDER"], filename)
-            print(f"[IMPROVE RESUME] Creating .pdf file at: {file_path}")
-            file_path = generator.create_pdf(resume_data, file_path)
-            mimetype = 'application/pdf'
-            download_name = filename
-        else:
-            filename = f"improved_resume_{timestamp}.docx"
-            file_path = os.path.join(cfg["DOWNLOADS_FOLDER"], filename)
-            print(f"[IMPROVE RESUME] Creating .docx file at: {file_path}")
-            file_path = generator.create_docx(resume_data, file_path)
-            mimetype = 'application/vnd.openxmlformats-officedocument.wordprocessingml.document'
-            download_name = filename
+        try:
+            data = resolve_payload(data)
+            output = build_improved_resume(current_app.config, data)
+        except LookupError as e:
+            return jsonify({"error": str(e)}), 404
+        except ValueError as e:
+            return jsonify({"error": str(e)}), 400
         
-        print(f"[IMPROVE RESUME] Sending file: {file_path} with mimetype: {mimetype}")
+        print(f"[IMPROVE RESUME] Sending {output['download_name']} ({len(output['data'])} bytes) with mimetype: {output['mimetype']}")
         
-        # Return file for download
+        # Return file for download straight from memory
         return send_file(
-            file_path,
+            io.BytesIO(output["data"]),
             as_attachment=True,
-            download_name=download_name,
-            mimetype=mimetype
+            download_name=output["download_name"],
+            mimetype=output["mimetype"]
         )
     
     except Exception as e:
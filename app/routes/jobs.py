@@ -0,0 +1,126 @@
+from flask import Blueprint, request, jsonify, current_app, send_file, url_for
+import io
+from ..utils.helpers import release_upload
+from ..utils.job_queue import Job, QueueFull
+from .upload import receive_upload, compare_pipeline
+from .improve_resume import build_improved_resume, resolve_payload
+
+jobs_bp = Blueprint("jobs", __name__, url_prefix="/api/jobs")
+
+def _queue():
+    return current_app.extensions["job_queue"]
+
+def _accepted(job):
+    """202 response pointing the client at the status and result endpoints."""
+    body = job.to_dict()
+    body["status_url"] = url_for("jobs.job_status", job_id=job.id)
+    body["result_url"] = url_for("jobs.job_result", job_id=job.id)
+    return jsonify(body), 202, {"Location": body["status_url"]}
+
+def _run_compare(app, resume_upload, jd_upload):
+    try:
+        with app.app_context():
+            results = {}
+            for _, data in compare_pipeline(resume_upload, jd_upload):
+                results.update(data)
+            # The texts stay in the analysis store; clients use analysis_id
+            results.pop("resume_text")
+            results.pop("jd_text")
+            return results
+    finally:
+        resume_upload.close()
+        jd_upload.close()
+
+def _run_improve(app, data):
+    with app.app_context():
+        return build_improved_resume(app.config, data)
+
+@jobs_bp.route("", methods=["GET"])
+def queue_stats():
+    return jsonify(_queue().stats())
+
+@jobs_bp.route("/compare", methods=["POST"])
+def submit_compare():
+    """
+    Queue a resume/JD comparison.
+
+    Takes the same multipart form as /compare and returns 202 with a job ID;
+    the result is {analysis, matrix, pdf_report, suggestions, analysis_id}.
+    """
+    resume_file = request.files.get("resume")
+    jd_file = request.files.get("job_description")
+
+    if not resume_file or not jd_file:
+        return jsonify({"error": "Both resume and job description files are required."}), 400
+
+    try:
+        resume_upload = receive_upload(resume_file)
+        jd_upload = receive_upload(jd_file)
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+
+    # The job outlives this request, so it takes over cleanup of any spool files
+    release_upload(resume_upload)
+    release_upload(jd_upload)
+
+    app = current_app._get_current_object()
+    try:
+        job = _queue().submit("compare", _run_compare, app, resume_upload, jd_upload)
+    except QueueFull as e:
+        resume_upload.close()
+        jd_upload.close()
+        return jsonify({"error": str(e)}), 503, {"Retry-After": "5"}
+
+    print(f"[JOBS] Queued compare job {job.id}")
+    return _accepted(job)
+
+@jobs_bp.route("/improve-resume", methods=["POST"])
+def submit_improve_resume():
+    """Queue an improved resume build; takes the /api/generate-improved-resume JSON payload."""
+    try:
+        data = resolve_payload(request.get_json(silent=True) or {})
+    except LookupError as e:
+        return jsonify({"error": str(e)}), 404
+    if not all([data.get("resume_text"), data.get("suggestions"), data.get("jd_text")]):
+        return jsonify({"error": "Missing required fields"}), 400
+
+    app = current_app._get_current_object()
+    try:
+        job = _queue().submit("improve-resume", _run_improve, app, data)
+    except QueueFull as e:
+        return jsonify({"error": str(e)}), 503, {"Retry-After": "5"}
+
+    print(f"[JOBS] Queued improve-resume job {job.id}")
+    return _accepted(job)
+
+@jobs_bp.route("/<job_id>", methods=["GET"])
+def job_status(job_id):
+    job = _queue().get(job_id)
+    if job is None:
+        return jsonify({"error": "Unknown or expired job"}), 404
+    return jsonify(job.to_dict())
+
+@jobs_bp.route("/<job_id>/result", methods=["GET"])
+def job_result(job_id):
+    """
+    Serve a finished job's outcome.
+
+    Returns 202 while the job is queued or running, 500 with the error if it
+    failed, the improved resume file for improve-resume jobs, and JSON otherwise.
+    """
+    job = _queue().get(job_id)
+    if job is None:
+        return jsonify({"error": "Unknown or expired job"}), 404
+    if not job.finished:
+        return jsonify(job.to_dict()), 202
+    if job.status == Job.FAILED:
+        return jsonify(job.to_dict()), 500
+
+    if job.kind == "improve-resume":
+        return send_file(
+            io.BytesIO(job.result["data"]),
+            as_attachment=True,
+            download_name=job.result["download_name"],
+            mimetype=job.result["mimetype"],
+        )
+    return jsonify({**job.to_dict(), "result": job.result})
@@ -0,0 +1,11 @@
+from flask import Blueprint, Response, current_app, abort
+
+metrics_bp = Blueprint("metrics", __name__)
+
+@metrics_bp.route("/metrics", methods=["GET"])
+def metrics():
+    """Stage and request latency histograms in the Prometheus text format."""
+    registry = current_app.extensions.get("metrics")
+    if registry is None:
+        abort(404)
+    return Response(registry.render(), mimetype="text/plain; version=0.0.4")
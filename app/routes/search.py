@@ -0,0 +1,55 @@
+from flask import Blueprint, request, jsonify, current_app
+import time
+
+search_bp = Blueprint("search", __name__, url_prefix="/api/search")
+
+def _index():
+    return current_app.extensions.get("resume_index")
+
+@search_bp.route("", methods=["GET"])
+def search():
+    """
+    Keyword search over analyzed resumes.
+
+    Query parameters:
+        q: query, e.g. kubernetes AND terraform, python OR go, "machine learning" -java
+        k: number of results (default 10, max 100)
+        mode: "ranked" (default, BM25 over any matching term) or "boolean"
+    """
+    index = _index()
+    if index is None:
+        return jsonify({"error": "Search index is disabled"}), 404
+
+    query = request.args.get("q", "").strip()
+    mode = request.args.get("mode", "ranked")
+    if not query:
+        return jsonify({"error": "Missing query parameter 'q'"}), 400
+    if mode not in ("ranked", "boolean"):
+        return jsonify({"error": "mode must be 'ranked' or 'boolean'"}), 400
+    try:
+        k = max(1, min(int(request.args.get("k", 10)), 100))
+    except ValueError:
+        return jsonify({"error": "k must be an integer"}), 400
+
+    start = time.perf_counter()
+    result = index.search(query, k=k, mode=mode)
+    result["took_ms"] = round((time.perf_counter() - start) * 1000, 2)
+    result["query"] = query
+    result["mode"] = mode
+    return jsonify(result)
+
+@search_bp.route("/documents/<doc_id>", methods=["DELETE"])
+def delete_document(doc_id):
+    index = _index()
+    if index is None:
+        return jsonify({"error": "Search index is disabled"}), 404
+    if not index.delete(doc_id):
+        return jsonify({"error": "Document not found"}), 404
+    return jsonify({"deleted": doc_id})
+
+@search_bp.route("/stats", methods=["GET"])
+def stats():
+    index = _index()
+    if index is None:
+        return jsonify({"error": "Search index is disabled"}), 404
+    return jsonify(index.stats())
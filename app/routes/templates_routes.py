@@ -1,17 +1,36 @@
-from flask import Blueprint, send_from_directory, current_app
+import io
+from flask import Blueprint, send_from_directory, send_file, current_app, request, abort
+from werkzeug.utils import secure_filename
 
 templates_bp = Blueprint("templates_bp", __name__, url_prefix="/templates")
 
+DOCX_MIMETYPE = "application/vnd.openxmlformats-officedocument.wordprocessingml.document"
+
+def send_template(filename):
+    """Serve a Word template from memory when preloaded, else from DOWNLOADS_FOLDER."""
+    data = current_app.extensions.get("word_templates", {}).get(filename)
+    if data is not None:
+        return send_file(io.BytesIO(data), mimetype=DOCX_MIMETYPE, as_attachment=True, download_name=filename)
+    folder = current_app.config["DOWNLOADS_FOLDER"]
+    return send_from_directory(folder, filename, as_attachment=True)
+
 @templates_bp.route("/resume")
 def download_resume_template():
-    folder = current_app.config["DOWNLOADS_FOLDER"]
-    return send_from_directory(folder, "resume_template.docx", as_attachment=True)
+    return send_template("resume_template.docx")
 
 @templates_bp.route("/job-description")
 def download_jd_template():
-    folder = current_app.config["DOWNLOADS_FOLDER"]
-    return send_from_directory(folder, "job_description_template.docx", as_attachment=True)
+    return send_template("job_description_template.docx")
 @templates_bp.route("/download/<filename>")
 def download_file(filename):
     folder = current_app.config["DOWNLOADS_FOLDER"]
     return send_from_directory(folder, filename, as_attachment=True)
+
+@templates_bp.route("/artifact/<artifact_id>")
+def download_artifact(artifact_id):
+    """Serve a generated report or resume from the artifact store; ``?name=`` sets the download name."""
+    path = current_app.extensions["artifact_store"].open_path(artifact_id)
+    if path is None:
+        abort(404)
+    name = secure_filename(request.args.get("name", "")) or artifact_id
+    return send_file(path, as_attachment=True, download_name=name)
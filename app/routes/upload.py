@@ -1,5 +1,11 @@
-from flask import Blueprint, request, render_template, current_app, flash, redirect, url_for
-from ..utils.helpers import save_uploaded_file
+from flask import Blueprint, request, render_template, current_app, flash, redirect, url_for, Response, stream_with_context, send_file
+import io
+import json
+import queue
+import threading
+from urllib.parse import urlencode
+from ..utils.helpers import save_uploaded_file, read_uploaded_file, UploadedDocument
+from ..utils.metrics import stage_timer
 from ..parsers.pdf_parser import PDFParser
 from ..parsers.docx_parser import DOCXParser
 from .analysis import run_analysis
@@ -8,17 +14,188 @@ from ..analyzers.improvement_engine import ImprovementEngine
 
 upload_bp = Blueprint("upload", __name__)
 
+def receive_upload(file_obj):
+    """Read an upload from memory, or save it to UPLOAD_FOLDER when UPLOAD_IN_MEMORY is off."""
+    cfg = current_app.config
+    allowed = cfg["ALLOWED_EXTENSIONS"]
+    with stage_timer("upload"):
+        if cfg.get("UPLOAD_IN_MEMORY", True):
+            return read_uploaded_file(file_obj, allowed, cfg["UPLOAD_MAX_MEMORY_BYTES"])
+        path = save_uploaded_file(file_obj, cfg["UPLOAD_FOLDER"], allowed)
+        return UploadedDocument.from_path(path)
+
+def parser_options(upload):
+    """Extraction options from config for the parser handling ``upload``."""
+    cfg = current_app.config
+    if upload.ext != "pdf":
+        return {}
+    return {
+        "max_pages": cfg.get("PDF_MAX_PAGES", 0),
+        "max_chars": cfg.get("PDF_MAX_CHARS", 0),
+        "workers": cfg.get("PDF_PARALLEL_WORKERS", 0),
+        "parallel_min_pages": cfg.get("PDF_PARALLEL_MIN_PAGES", 16),
+    }
+
+def extract_upload(upload, cache=None, options=None):
+    """Extract text from an UploadedDocument, going through the extraction cache if given."""
+    parser = PDFParser if upload.ext == "pdf" else DOCXParser
+    options = parser_options(upload) if options is None else options
+    if upload.data is not None:
+        extract = lambda: parser.extract_text_from_bytes(upload.data, **options)
+    else:
+        extract = lambda: parser.extract_text(upload.path, **options)
+    with stage_timer("parse"):
+        if cache is None:
+            return extract()
+        # Only options that change the output are part of the cache key; serial and
+        # page-parallel extraction return identical text, so workers are not
+        variant = "" if not (options.get("max_pages") or options.get("max_chars")) else \
+            f"p{options.get('max_pages', 0)}c{options.get('max_chars', 0)}"
+        return cache.get_or_extract(upload.sha256, parser, extract, variant)
+
+def index_resume(upload, resume_text, analysis=None):
+    """Add an analyzed resume to the keyword search index (non-critical)."""
+    index = current_app.extensions.get("resume_index")
+    if index is None:
+        return
+    try:
+        metadata = {"filename": upload.filename}
+        if analysis:
+            metadata["overall_score"] = analysis.get("overall_score")
+        index.add(upload.sha256, resume_text, **metadata)
+    except Exception as e:
+        print(f"[UPLOAD] Could not index resume: {e}")
+
+def analyze_with_progress(resume_text, jd_text):
+    """
+    Run run_analysis on a worker thread, yielding each weighted parameter as it lands.
+
+    Yields ("parameter", {name, score, weight, weighted_score, replaced})
+    tuples, then ("scored", {analysis, matrix}) once the whole analysis is
+    done. ``replaced`` marks a demo score that supersedes one streamed before
+    the completion failed.
+    """
+    app = current_app._get_current_object()
+    events = queue.Queue()
+    seen = set()
+
+    def on_parameter(name, param):
+        events.put(("parameter", {
+            "name": name,
+            "score": param.get("score", 0),
+            "weight": param.get("weight", 0),
+            "weighted_score": param.get("weighted_score", 0),
+            "replaced": name in seen,
+        }))
+        seen.add(name)
+
+    def work():
+        try:
+            with app.app_context():
+                analysis, matrix = run_analysis(resume_text, jd_text, on_parameter)
+            events.put(("scored", {"analysis": analysis, "matrix": matrix}))
+        except Exception as e:
+            events.put(("error", e))
+
+    threading.Thread(target=work, daemon=True).start()
+    while True:
+        stage, data = events.get()
+        if stage == "error":
+            raise data
+        yield stage, data
+        if stage == "scored":
+            return
+
+def compare_pipeline(resume_upload, jd_upload, stream_parameters=False):
+    """
+    Run the compare stages one at a time, yielding after each finishes.
+
+    Yields (stage, data) tuples in order: "parsed" (resume_text, jd_text),
+    "scored" (analysis, matrix), "saved" (analysis_id of the server-side
+    record used by later steps), "report" (pdf_report, the report's
+    download URL) and "suggestions" (suggestions). /compare, /compare/stream and the jobs API consume this.
+    With ``stream_parameters`` a "parameter" stage is also yielded for each
+    scoring parameter before "scored".
+    """
+    cfg = current_app.config
+
+    # Extract text (repeat uploads are served from the extraction cache)
+    cache = current_app.extensions.get("extraction_cache")
+    resume_text = extract_upload(resume_upload, cache)
+    jd_text = extract_upload(jd_upload, cache)
+    yield "parsed", {"resume_text": resume_text, "jd_text": jd_text}
+
+    # Run analysis
+    if stream_parameters:
+        for stage, data in analyze_with_progress(resume_text, jd_text):
+            if stage == "parameter":
+                yield stage, data
+        analysis, matrix = data["analysis"], data["matrix"]
+    else:
+        analysis, matrix = run_analysis(resume_text, jd_text)
+    index_resume(resume_upload, resume_text, analysis)
+    yield "scored", {"analysis": analysis, "matrix": matrix}
+
+    # Keep the texts server-side; the page only carries the analysis ID
+    store = current_app.extensions["analysis_store"]
+    analysis_id = store.save(resume_text, jd_text, analysis)
+    yield "saved", {"analysis_id": analysis_id}
+
+    # Generate PDF report in memory; it is served from the analysis store,
+    # or from the artifact store on disk when downloads are persisted
+    pdf_gen = PDFReportGenerator(cfg, artifacts=current_app.extensions.get("artifact_store"))
+    with stage_timer("report"):
+        report_pdf = pdf_gen.render_report(analysis, matrix)
+    report_name = pdf_gen.report_filename()
+    if cfg.get("PERSIST_DOWNLOADS", False):
+        artifact_id = pdf_gen.save(report_pdf)
+        pdf_report = f"/templates/artifact/{artifact_id}?{urlencode({'name': report_name})}"
+    else:
+        store.update(analysis_id, report_pdf=report_pdf, report_name=report_name)
+        pdf_report = f"/report/{analysis_id}"
+    yield "report", {"pdf_report": pdf_report}
+
+    # NEW: Generate improvement suggestions (non-intrusive addition)
+    suggestions = None
+    try:
+        print("[UPLOAD] Generating improvement suggestions...")
+        improvement_engine = ImprovementEngine(cfg, client=current_app.extensions.get("openai_client"))
+        with stage_timer("suggestions"):
+            suggestions = improvement_engine.generate_suggestions(analysis, resume_text, jd_text)
+        print(f"[UPLOAD] Suggestions generated. Is demo: {suggestions.get('_is_demo', 'unknown') if suggestions else 'None'}")
+    except Exception as e:
+        print(f"[UPLOAD] Could not generate suggestions: {e}")
+        import traceback
+        traceback.print_exc()
+        # Continue without suggestions - not critical
+    store.update(analysis_id, suggestions=suggestions)
+    yield "suggestions", {"suggestions": suggestions}
+
+def sse(event, data):
+    """Format one Server-Sent Events frame."""
+    return f"event: {event}\ndata: {json.dumps(data)}\n\n"
+
 @upload_bp.route("/", methods=["GET"])
 def index():
     # Render home with no analysis yet
     return render_template("index.html", analysis=None, matrix=None, error=None, suggestions=None)
 
+@upload_bp.route("/report/<analysis_id>", methods=["GET"])
+def download_report(analysis_id):
+    """Serve the PDF report of a stored analysis straight from memory."""
+    record = current_app.extensions["analysis_store"].get(analysis_id)
+    if record is None or record.get("report_pdf") is None:
+        flash("That report was not found or has expired. Please run the comparison again.")
+        return redirect(url_for("upload.index"))
+    return send_file(
+        io.BytesIO(record["report_pdf"]),
+        as_attachment=True,
+        download_name=record["report_name"],
+        mimetype="application/pdf",
+    )
+
 @upload_bp.route("/compare", methods=["POST"])
 def compare():
-    cfg = current_app.config
-    allowed = cfg["ALLOWED_EXTENSIONS"]
-    upload_folder = cfg["UPLOAD_FOLDER"]
-
     resume_file = request.files.get("resume")
     jd_file = request.files.get("job_description")
 
@@ -27,46 +204,68 @@ def compare():
         return render_template("index.html", analysis=None, matrix=None, error=error, suggestions=None)
 
     try:
-        # Save files
-        resume_path = save_uploaded_file(resume_file, upload_folder, allowed)
-        jd_path = save_uploaded_file(jd_file, upload_folder, allowed)
+        # Read files (in memory unless UPLOAD_IN_MEMORY is disabled)
+        resume_upload = receive_upload(resume_file)
+        jd_upload = receive_upload(jd_file)
 
-        # Extract text
-        def extract(path):
-            ext = path.rsplit(".", 1)[1].lower()
-            if ext == "pdf":
-                return PDFParser.extract_text(path)
-            return DOCXParser.extract_text(path)
+        results = {}
+        for _, data in compare_pipeline(resume_upload, jd_upload):
+            results.update(data)
 
-        resume_text = extract(resume_path)
-        jd_text = extract(jd_path)
+        return render_template("index.html", analysis=results["analysis"], matrix=results["matrix"],
+                               pdf_report=results["pdf_report"], suggestions=results["suggestions"],
+                               analysis_id=results["analysis_id"])
 
-        # Run analysis
-        analysis, matrix = run_analysis(resume_text, jd_text)
+    except Exception as e:
+        flash(f"An unexpected error occurred: {str(e)}")
+        return redirect(url_for("upload.index"))
+
+@upload_bp.route("/compare/stream", methods=["POST"])
+def compare_stream():
+    """
+    Same pipeline as /compare, reported as Server-Sent Events.
+
+    Emits "parsed", one "parameter" per scoring parameter, "scored",
+    "report" and "suggestions" as each stage finishes (the rendering stages carry an ``html`` fragment the page
+    swaps in), then "done" with the analysis ID, or "error".
+    """
+    resume_file = request.files.get("resume")
+    jd_file = request.files.get("job_description")
+
+    if not resume_file or not jd_file:
+        return Response(sse("error", {"error": "Both resume and job description files are required."}),
+                        mimetype="text/event-stream")
 
-        # Generate PDF report
-        pdf_gen = PDFReportGenerator(cfg)
-        pdf_filename = pdf_gen.generate_report(analysis, matrix)
+    # Uploads must be read before the response starts streaming
+    try:
+        resume_upload = receive_upload(resume_file)
+        jd_upload = receive_upload(jd_file)
+    except ValueError as e:
+        return Response(sse("error", {"error": str(e)}), mimetype="text/event-stream")
 
-        # NEW: Generate improvement suggestions (non-intrusive addition)
-        suggestions = None
+    def generate():
+        results = {}
         try:
-            print("[UPLOAD] Generating improvement suggestions...")
-            improvement_engine = ImprovementEngine(cfg)
-            suggestions = improvement_engine.generate_suggestions(analysis, resume_text, jd_text)
-            print(f"[UPLOAD] Suggestions generated. Is demo: {suggestions.get('_is_demo', 'unknown') if suggestions else 'None'}")
+            for stage, data in compare_pipeline(resume_upload, jd_upload, stream_parameters=True):
+                if stage == "parameter":
+                    yield sse(stage, data)
+                    continue
+                results.update(data)
+                if stage == "parsed":
+                    yield sse(stage, {})
+                elif stage == "scored":
+                    # The score matrix is on screen before the report and suggestions exist
+                    html = render_template("_analysis_results.html", analysis=data["analysis"],
+                                           matrix=data["matrix"], pdf_report=None)
+                    yield sse(stage, {"html": html})
+                elif stage == "report":
+                    yield sse(stage, {"html": render_template("_report_link.html", **data), **data})
+                elif stage == "suggestions":
+                    yield sse(stage, {"html": render_template("_suggestions.html", **data)})
+            yield sse("done", {"analysis_id": results["analysis_id"]})
         except Exception as e:
-            print(f"[UPLOAD] Could not generate suggestions: {e}")
-            import traceback
-            traceback.print_exc()
-            # Continue without suggestions - not critical
-        
-        # Store text for resume generation
-        analysis["_resume_text"] = resume_text
-        analysis["_jd_text"] = jd_text
-        
-        return render_template("index.html", analysis=analysis, matrix=matrix, pdf_report=pdf_filename, suggestions=suggestions)
+            print(f"[UPLOAD] Streaming compare failed: {e}")
+            yield sse("error", {"error": f"An unexpected error occurred: {str(e)}"})
 
-    except Exception as e:
-        flash(f"An unexpected error occurred: {str(e)}")
-        return redirect(url_for("upload.index"))
+    headers = {"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    return Response(stream_with_context(generate()), mimetype="text/event-stream", headers=headers)
@@ -0,0 +1,150 @@
+"""
+Production server: ``python -m app.serve``.
+
+Runs the app under gunicorn with threaded workers. Every setting comes from
+Config (HOST, PORT, WEB_* environment variables); command-line flags
+override them for one run. With WEB_PRELOAD the app is created once in the
+master (heavy libraries, PDF styles, page and Word templates, API client)
+and workers are forked from it. On SIGTERM/SIGINT workers stop accepting
+connections, finish in-flight requests and queued jobs within
+WEB_GRACEFUL_TIMEOUT seconds, then exit.
+
+One worker is the default. Stored analyses are shared between workers
+through the SQLite or MongoDB analysis store, so running several workers
+with ANALYSIS_STORE_BACKEND=memory is refused. Background jobs stay in the
+worker that accepted them.
+
+Where gunicorn is unavailable (Windows), falls back to Werkzeug's threaded
+server in a single process.
+"""
+import argparse
+import logging
+import os
+
+from . import create_app, shutdown_app
+from .config import Config
+from .utils.metrics import clear_multiproc_dir
+
+logger = logging.getLogger(__name__)
+
+
+def gunicorn_options(config):
+    """
+    Map Config to gunicorn settings.
+
+    Args:
+        config: Config instance
+
+    Returns:
+        dict: gunicorn setting name -> value
+    """
+    return {
+        "bind": f"{config.HOST}:{config.PORT}",
+        "workers": config.WEB_WORKERS,
+        "threads": config.WEB_THREADS,
+        "worker_class": "gthread",
+        "preload_app": config.WEB_PRELOAD,
+        "timeout": config.WEB_TIMEOUT,
+        "graceful_timeout": config.WEB_GRACEFUL_TIMEOUT,
+        "keepalive": config.WEB_KEEPALIVE,
+        "max_requests": config.WEB_MAX_REQUESTS,
+        "max_requests_jitter": config.WEB_MAX_REQUESTS_JITTER,
+        "accesslog": "-",
+        "errorlog": "-",
+    }
+
+
+def serve_gunicorn(options):
+    from gunicorn.app.base import BaseApplication
+
+    class Server(BaseApplication):
+        def __init__(self):
+            self.application = None
+            super().__init__()
+
+        def load_config(self):
+            for key, value in options.items():
+                self.cfg.set(key, value)
+            self.cfg.set("worker_exit", self.worker_exit)
+            self.cfg.set("on_exit", self.on_exit)
+
+        def load(self):
+            # With preload_app this runs once in the master, before fork
+            if self.application is None:
+                self.application = create_app()
+            return self.application
+
+        @staticmethod
+        def worker_exit(server, worker):
+            # Runs in the worker after it stopped accepting requests
+            app = getattr(worker, "wsgi", None)
+            if app is not None:
+                shutdown_app(app, wait=True)
+
+        def on_exit(self, server):
+            # Master's copy (preload) owns the artifact sweeper thread
+            if self.application is not None:
+                shutdown_app(self.application, wait=False)
+
+    Server().run()
+
+
+def serve_werkzeug(config):
+    from werkzeug.serving import run_simple
+
+    app = create_app()
+    try:
+        run_simple(config.HOST, config.PORT, app, threaded=True)
+    finally:
+        shutdown_app(app, wait=True)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Run the app with a production WSGI server.")
+    parser.add_argument("--bind", help="HOST:PORT (default from HOST/PORT)")
+    parser.add_argument("--workers", type=int, help="worker processes (default WEB_WORKERS)")
+    parser.add_argument("--threads", type=int, help="threads per worker (default WEB_THREADS)")
+    parser.add_argument("--no-preload", action="store_true", help="create the app in each worker instead of the master")
+    args = parser.parse_args(argv)
+
+    if args.no_preload:
+        os.environ["WEB_PRELOAD"] = "false"
+    if args.workers:
+        # Settings derived from the worker count (METRICS_MULTIPROC_DIR) must see it too
+        os.environ["WEB_WORKERS"] = str(args.workers)
+    config = Config()
+    if config.WEB_PRELOAD:
+        # create_app in the master also imports the heavy libraries and warms caches
+        os.environ.setdefault("PRELOAD_DEPENDENCIES", "true")
+
+    options = gunicorn_options(config)
+    if args.bind:
+        options["bind"] = args.bind
+    if args.threads:
+        options["threads"] = args.threads
+    if options["workers"] > 1:
+        if config.ANALYSIS_STORE_BACKEND == "memory":
+            # Report downloads and analysis_id lookups would miss on every other worker
+            parser.error("several workers need a shared ANALYSIS_STORE_BACKEND (sqlite or mongo), not memory")
+        logger.warning("Background jobs are kept per worker; /api/jobs status polls may miss with several workers")
+    if config.METRICS_MULTIPROC_DIR:
+        clear_multiproc_dir(config.METRICS_MULTIPROC_DIR)
+
+    try:
+        import gunicorn  # noqa: F401
+    except ImportError:
+        logging.basicConfig(level=logging.INFO)
+        logger.warning("gunicorn is not installed; serving with Werkzeug in a single process")
+        if args.bind:
+            config.HOST, _, port = args.bind.rpartition(":")
+            config.PORT = int(port)
+        serve_werkzeug(config)
+        return
+
+    print(f"Serving on {options['bind']} with {options['workers']} workers x {options['threads']} threads"
+          f" (preload: {options['preload_app']})")
+    serve_gunicorn(options)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,12 @@
 import os
+import hashlib
+import tempfile
+import zipfile
+from flask import g
 from werkzeug.utils import secure_filename
 
+CHUNK_SIZE = 64 * 1024
+
 def allowed_file(filename, allowed_exts):
     return "." in filename and filename.rsplit(".", 1)[1].lower() in allowed_exts
 
@@ -16,3 +22,140 @@ def save_uploaded_file(file_obj, upload_folder, allowed_exts):
     path = os.path.join(upload_folder, filename)
     file_obj.save(path)
     return path
+
+class UploadedDocument:
+    """
+    An uploaded file ready for parsing.
+
+    Small uploads are held in ``data``; large ones live in a private temp
+    file at ``path`` that is removed by ``close()``. ``sha256`` is the digest
+    of the raw bytes and is used as the extraction cache key.
+    """
+
+    def __init__(self, filename, ext, sha256, data=None, path=None, temporary=False):
+        self.filename = filename
+        self.ext = ext
+        self.sha256 = sha256
+        self.data = data
+        self.path = path
+        self.temporary = temporary
+
+    @classmethod
+    def from_path(cls, path):
+        hasher = hashlib.sha256()
+        with open(path, "rb") as f:
+            for chunk in iter(lambda: f.read(CHUNK_SIZE), b""):
+                hasher.update(chunk)
+        filename = os.path.basename(path)
+        return cls(filename, filename.rsplit(".", 1)[1].lower(), hasher.hexdigest(), path=path)
+
+    def read_bytes(self):
+        if self.data is not None:
+            return self.data
+        with open(self.path, "rb") as f:
+            return f.read()
+
+    def close(self):
+        if self.temporary and self.path:
+            try:
+                os.remove(self.path)
+            except FileNotFoundError:
+                pass
+            self.path = None
+
+def read_uploaded_file(file_obj, allowed_exts, max_memory_bytes, spool_dir=None):
+    """
+    Read an upload without writing it under its original name.
+
+    Files up to ``max_memory_bytes`` stay in memory. Larger files are spooled
+    to a uniquely named temp file that is deleted when the request ends.
+    """
+    if not file_obj or file_obj.filename == "":
+        raise ValueError("No file selected")
+
+    if not allowed_file(file_obj.filename, allowed_exts):
+        raise ValueError("Unsupported file type")
+
+    filename = secure_filename(file_obj.filename)
+    ext = file_obj.filename.rsplit(".", 1)[1].lower()
+    hasher = hashlib.sha256()
+    chunks = []
+    size = 0
+    spool = None
+
+    try:
+        for chunk in iter(lambda: file_obj.stream.read(CHUNK_SIZE), b""):
+            hasher.update(chunk)
+            size += len(chunk)
+            if spool is None and size > max_memory_bytes:
+                spool = tempfile.NamedTemporaryFile(suffix=f".{ext}", dir=spool_dir, delete=False)
+                spool.write(b"".join(chunks))
+                chunks = []
+            if spool is None:
+                chunks.append(chunk)
+            else:
+                spool.write(chunk)
+    except Exception:
+        if spool is not None:
+            spool.close()
+            os.remove(spool.name)
+        raise
+
+    if spool is None:
+        upload = UploadedDocument(filename, ext, hasher.hexdigest(), data=b"".join(chunks))
+    else:
+        spool.close()
+        upload = UploadedDocument(filename, ext, hasher.hexdigest(), path=spool.name, temporary=True)
+
+    g.setdefault("uploaded_documents", []).append(upload)
+    return upload
+
+def read_zip_uploads(file_obj, allowed_exts, max_files, max_member_bytes):
+    """
+    Unpack resumes from an uploaded .zip archive into in-memory UploadedDocuments.
+
+    Directories, hidden files and unsupported types are skipped. Archives with
+    more than ``max_files`` documents, or members larger than
+    ``max_member_bytes`` once inflated, are rejected.
+    """
+    if not file_obj or file_obj.filename == "":
+        raise ValueError("No file selected")
+
+    try:
+        archive = zipfile.ZipFile(file_obj.stream)
+    except zipfile.BadZipFile:
+        raise ValueError("Archive is not a valid .zip file")
+
+    uploads = []
+    with archive:
+        for info in archive.infolist():
+            name = os.path.basename(info.filename)
+            if info.is_dir() or not name or name.startswith(".") or not allowed_file(name, allowed_exts):
+                continue
+            if len(uploads) >= max_files:
+                raise ValueError(f"Archive contains more than {max_files} documents")
+            if info.file_size > max_member_bytes:
+                raise ValueError(f"{name} is larger than the per-file limit")
+            data = archive.read(info)
+            uploads.append(UploadedDocument(
+                secure_filename(name),
+                name.rsplit(".", 1)[1].lower(),
+                hashlib.sha256(data).hexdigest(),
+                data=data,
+            ))
+    return uploads
+
+def cleanup_uploaded_files(exc=None):
+    """Teardown hook removing any temp files spooled during the request."""
+    for upload in g.pop("uploaded_documents", []):
+        upload.close()
+
+def release_upload(upload):
+    """
+    Detach an upload from the current request so teardown does not delete its
+    spool file; the caller becomes responsible for calling ``upload.close()``.
+    """
+    uploads = g.get("uploaded_documents", [])
+    if upload in uploads:
+        uploads.remove(upload)
+    return upload
@@ -0,0 +1,144 @@
+import logging
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+logger = logging.getLogger(__name__)
+
+
+class QueueFull(Exception):
+    """Raised when a job is submitted while MAX queued jobs are already waiting."""
+
+
+class Job:
+    """One unit of background work and its outcome."""
+
+    QUEUED = "queued"
+    RUNNING = "running"
+    DONE = "done"
+    FAILED = "failed"
+
+    def __init__(self, kind):
+        self.id = uuid.uuid4().hex
+        self.kind = kind
+        self.status = self.QUEUED
+        self.created_at = time.time()
+        self.started_at = None
+        self.finished_at = None
+        self.result = None
+        self.error = None
+
+    @property
+    def finished(self):
+        return self.status in (self.DONE, self.FAILED)
+
+    def to_dict(self):
+        return {
+            "job_id": self.id,
+            "kind": self.kind,
+            "status": self.status,
+            "created_at": self.created_at,
+            "started_at": self.started_at,
+            "finished_at": self.finished_at,
+            "error": self.error,
+        }
+
+
+class JobQueue:
+    """
+    Bounded background worker pool for slow request pipelines.
+
+    ``submit`` returns a Job immediately; a fixed number of worker threads
+    run the queued callables. At most ``max_queue`` jobs may wait for a
+    worker at once. Finished jobs are kept for ``retention`` seconds and
+    no more than ``max_results`` of them are retained (oldest dropped first).
+    """
+
+    def __init__(self, workers=4, max_queue=100, retention=3600, max_results=1000):
+        self.workers = workers
+        self.max_queue = max_queue
+        self.retention = retention
+        self.max_results = max_results
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="job")
+        self._jobs = {}
+        self._finished = OrderedDict()  # job id -> finish time, oldest first
+        self._lock = threading.Lock()
+        self._queued = 0
+        self._running = 0
+
+    def submit(self, kind, fn, *args, **kwargs):
+        """
+        Queue ``fn(*args, **kwargs)`` to run on a worker thread.
+
+        Args:
+            kind: Short label reported with the job (e.g. "compare")
+            fn: Callable whose return value becomes the job result
+
+        Returns:
+            Job: The queued job
+
+        Raises:
+            QueueFull: If max_queue jobs are already waiting
+        """
+        job = Job(kind)
+        with self._lock:
+            self._prune()
+            if self._queued >= self.max_queue:
+                raise QueueFull(f"Job queue is full ({self.max_queue} waiting)")
+            self._queued += 1
+            self._jobs[job.id] = job
+        self._executor.submit(self._run, job, fn, args, kwargs)
+        return job
+
+    def get(self, job_id):
+        with self._lock:
+            self._prune()
+            return self._jobs.get(job_id)
+
+    def stats(self):
+        with self._lock:
+            self._prune()
+            return {
+                "workers": self.workers,
+                "max_queue": self.max_queue,
+                "queued": self._queued,
+                "running": self._running,
+                "retained_results": len(self._finished),
+                "retention": self.retention,
+                "max_results": self.max_results,
+            }
+
+    def shutdown(self, wait=True):
+        self._executor.shutdown(wait=wait, cancel_futures=not wait)
+
+    def _run(self, job, fn, args, kwargs):
+        with self._lock:
+            self._queued -= 1
+            self._running += 1
+        job.status = Job.RUNNING
+        job.started_at = time.time()
+        try:
+            job.result = fn(*args, **kwargs)
+            job.status = Job.DONE
+        except Exception as e:
+            logger.exception(f"Job {job.id} ({job.kind}) failed")
+            job.error = str(e)
+            job.status = Job.FAILED
+        finally:
+            job.finished_at = time.time()
+            with self._lock:
+                self._running -= 1
+                self._finished[job.id] = job.finished_at
+                self._prune()
+
+    def _prune(self):
+        # Caller must hold self._lock
+        cutoff = time.time() - self.retention
+        while self._finished:
+            job_id, finished_at = next(iter(self._finished.items()))
+            if finished_at > cutoff and len(self._finished) <= self.max_results:
+                break
+            del self._finished[job_id]
+            self._jobs.pop(job_id, None)
@@ -0,0 +1,227 @@
+import glob
+import json
+import logging
+import os
+import threading
+import time
+from contextlib import contextmanager
+
+from flask import current_app, g, has_app_context, has_request_context, request
+
+logger = logging.getLogger(__name__)
+
+# Seconds; covers sub-millisecond scoring up to slow LLM calls
+DEFAULT_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+
+class Histogram:
+    """Prometheus-style cumulative histogram with labels, safe to observe from any thread."""
+
+    def __init__(self, name, documentation, labelnames, buckets=DEFAULT_BUCKETS):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self.buckets = tuple(sorted(buckets))
+        self._series = {}  # label values -> [bucket counts..., sum, count]
+        self._lock = threading.Lock()
+
+    def observe(self, value, *labelvalues):
+        with self._lock:
+            series = self._series.get(labelvalues)
+            if series is None:
+                series = self._series[labelvalues] = [0] * len(self.buckets) + [0.0, 0]
+            for i, bound in enumerate(self.buckets):
+                if value <= bound:
+                    series[i] += 1
+                    break
+            series[-2] += value
+            series[-1] += 1
+
+    def snapshot(self):
+        with self._lock:
+            return {"|".join(k): list(v) for k, v in self._series.items()}
+
+
+def _escape(value):
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _labels(names, values, extra=None):
+    pairs = list(zip(names, values))
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(f'{k}="{_escape(v)}"' for k, v in pairs) + "}"
+
+
+class MetricsRegistry:
+    """
+    Process-wide latency histograms, rendered in the Prometheus text format.
+
+    With ``multiproc_dir`` each worker process also writes its snapshot
+    there every ``flush_interval`` seconds and ``render`` merges the
+    snapshots of all workers (including ones that have since exited, so
+    totals never go backwards), so any worker can answer a scrape.
+    """
+
+    def __init__(self, multiproc_dir="", flush_interval=5.0):
+        self.stages = Histogram(
+            "resumecompare_stage_duration_seconds",
+            "Time spent in each pipeline stage.",
+            ("stage",),
+        )
+        self.requests = Histogram(
+            "resumecompare_http_request_duration_seconds",
+            "HTTP request latency by endpoint, method and status.",
+            ("endpoint", "method", "status"),
+        )
+        self.histograms = (self.stages, self.requests)
+        self.multiproc_dir = multiproc_dir
+        self.flush_interval = flush_interval
+        self._flusher_pid = None
+        self._flusher_lock = threading.Lock()
+        if multiproc_dir:
+            os.makedirs(multiproc_dir, exist_ok=True)
+
+    def observe_stage(self, stage, seconds):
+        self.stages.observe(seconds, stage)
+        self._ensure_flusher()
+
+    def observe_request(self, endpoint, method, status, seconds):
+        self.requests.observe(seconds, endpoint, method, str(status))
+        self._ensure_flusher()
+
+    def snapshot(self):
+        return {h.name: h.snapshot() for h in self.histograms}
+
+    def flush(self):
+        """Write this process's snapshot to the multiprocess directory."""
+        if not self.multiproc_dir:
+            return
+        path = os.path.join(self.multiproc_dir, f"metrics_{os.getpid()}.json")
+        tmp_path = f"{path}.{threading.get_ident()}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(self.snapshot(), f)
+        os.replace(tmp_path, path)
+
+    def collect(self):
+        """Snapshot of every histogram, merged across worker processes when configured."""
+        if not self.multiproc_dir:
+            return self.snapshot()
+        self.flush()
+        merged = {h.name: {} for h in self.histograms}
+        for path in glob.glob(os.path.join(self.multiproc_dir, "metrics_*.json")):
+            try:
+                with open(path) as f:
+                    data = json.load(f)
+            except (OSError, ValueError):
+                continue
+            for name, series in data.items():
+                target = merged.setdefault(name, {})
+                for key, values in series.items():
+                    if key in target:
+                        target[key] = [a + b for a, b in zip(target[key], values)]
+                    else:
+                        target[key] = list(values)
+        return merged
+
+    def render(self):
+        """Prometheus text exposition format (version 0.0.4)."""
+        collected = self.collect()
+        lines = []
+        for h in self.histograms:
+            lines.append(f"# HELP {h.name} {h.documentation}")
+            lines.append(f"# TYPE {h.name} histogram")
+            for key, values in sorted(collected.get(h.name, {}).items()):
+                labelvalues = key.split("|")
+                cumulative = 0
+                for bound, count in zip(h.buckets, values):
+                    cumulative += count
+                    lines.append(f"{h.name}_bucket{_labels(h.labelnames, labelvalues, ('le', repr(bound)))} {cumulative}")
+                lines.append(f"{h.name}_bucket{_labels(h.labelnames, labelvalues, ('le', '+Inf'))} {values[-1]}")
+                lines.append(f"{h.name}_sum{_labels(h.labelnames, labelvalues)} {values[-2]}")
+                lines.append(f"{h.name}_count{_labels(h.labelnames, labelvalues)} {values[-1]}")
+        return "\n".join(lines) + "\n"
+
+    def _ensure_flusher(self):
+        # One flusher per process; workers forked from a preloaded master start their own
+        if not self.multiproc_dir or self._flusher_pid == os.getpid():
+            return
+        with self._flusher_lock:
+            if self._flusher_pid == os.getpid():
+                return
+            self._flusher_pid = os.getpid()
+
+            def loop():
+                while True:
+                    time.sleep(self.flush_interval)
+                    try:
+                        self.flush()
+                    except OSError as e:
+                        logger.warning(f"Could not write metrics snapshot: {e}")
+
+            threading.Thread(target=loop, name="metrics-flusher", daemon=True).start()
+
+
+def clear_multiproc_dir(path):
+    """
+    Remove worker snapshots left by an earlier server run.
+
+    Totals otherwise carry over across restarts, and old PIDs can collide
+    with new workers. Call once in the server master before forking.
+    """
+    removed = 0
+    for name in glob.glob(os.path.join(path, "metrics_*.json*")):
+        try:
+            os.remove(name)
+            removed += 1
+        except FileNotFoundError:
+            pass
+    return removed
+
+
+@contextmanager
+def stage_timer(stage):
+    """
+    Time a pipeline stage.
+
+    The duration goes to the stage histogram and, on a request thread, into
+    that response's Server-Timing header (repeated stages are summed).
+    Outside an app context the block runs untimed.
+    """
+    registry = current_app.extensions.get("metrics") if has_app_context() else None
+    if registry is None:
+        yield
+        return
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        elapsed = time.perf_counter() - started
+        registry.observe_stage(stage, elapsed)
+        if has_request_context():
+            timings = g.setdefault("server_timing", {})
+            timings[stage] = timings.get(stage, 0.0) + elapsed
+
+
+def init_metrics(app, registry):
+    """Record request latency and add a Server-Timing header to every response."""
+    app.extensions["metrics"] = registry
+
+    @app.before_request
+    def start_timer():
+        g.request_started = time.perf_counter()
+
+    @app.after_request
+    def record_request(response):
+        started = g.pop("request_started", None)
+        if started is None:
+            return response
+        elapsed = time.perf_counter() - started
+        endpoint = request.url_rule.rule if request.url_rule is not None else "unmatched"
+        registry.observe_request(endpoint, request.method, response.status_code, elapsed)
+
+        # Streamed bodies are still running, so only stages done so far are listed
+        entries = [f"{name};dur={seconds * 1000:.1f}" for name, seconds in g.get("server_timing", {}).items()]
+        entries.append(f"total;dur={elapsed * 1000:.1f}")
+        response.headers["Server-Timing"] = ", ".join(entries)
+        return response
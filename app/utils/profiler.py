@@ -0,0 +1,270 @@
+import cProfile
+import io
+import json
+import logging
+import os
+import pstats
+import random
+import re
+import sys
+import threading
+import time
+import uuid
+from collections import Counter
+
+from flask import g, request
+
+logger = logging.getLogger(__name__)
+
+PROFILE_ID_RE = re.compile(r"^[0-9]{8}T[0-9]{6}-[0-9a-f]{8}$")
+# Installed packages and the stdlib are labelled relative to their root
+LIBRARY_PATH_RE = re.compile(r"/(?:site|dist)-packages/|/lib/python\d+(?:\.\d+)?/")
+
+
+# code object -> frame label, filled as the sampler meets new functions
+_labels = {}
+
+
+def _frame_label(code):
+    """Short, stable frame name: ``package/module.py:function``."""
+    label = _labels.get(code)
+    if label is None:
+        path = code.co_filename.replace("\\", "/")
+        match = LIBRARY_PATH_RE.search(path)
+        if match:
+            path = path[match.end():]
+        elif "/app/" in path:
+            path = "app/" + path.rsplit("/app/", 1)[1]
+        else:
+            path = os.path.basename(path)
+        label = _labels[code] = f"{path}:{code.co_name}"
+    return label
+
+
+class StackSampler:
+    """
+    Statistical profiler for selected threads.
+
+    A daemon thread wakes every ``interval`` seconds, reads the current stack
+    of each registered thread and counts it in collapsed form
+    (``root;caller;callee``), the input format of flame graph tools. Cost
+    per sample is a stack walk, independent of how much code runs, so it is
+    cheap enough to leave on for every request.
+    """
+
+    def __init__(self, interval=0.005):
+        self.interval = interval
+        self._threads = {}  # thread ident -> Counter of collapsed stacks
+        self._lock = threading.Lock()
+        self._thread = None
+
+    def start(self, ident):
+        with self._lock:
+            self._threads[ident] = Counter()
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, name="stack-sampler", daemon=True)
+                self._thread.start()
+
+    def stop(self, ident):
+        """Stop sampling a thread; returns its Counter of collapsed stacks."""
+        with self._lock:
+            return self._threads.pop(ident, Counter())
+
+    def _run(self):
+        while True:
+            time.sleep(self.interval)
+            with self._lock:
+                if not self._threads:
+                    continue
+                frames = sys._current_frames()
+                for ident, stacks in self._threads.items():
+                    frame = frames.get(ident)
+                    names = []
+                    while frame is not None:
+                        names.append(_frame_label(frame.f_code))
+                        frame = frame.f_back
+                    if names:
+                        stacks[";".join(reversed(names))] += 1
+
+
+class ProfileStore:
+    """
+    Bounded directory of captured profiles.
+
+    Each profile is ``<id>.json`` (metadata) plus ``<id>.pstats`` and/or
+    ``<id>.collapsed``. The oldest profiles are deleted once there are more
+    than ``max_profiles`` or they take more than ``max_bytes``.
+    """
+
+    def __init__(self, root, max_profiles=100, max_bytes=200 * 1024 * 1024):
+        self.root = root
+        self.max_profiles = max_profiles
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        os.makedirs(root, exist_ok=True)
+
+    @staticmethod
+    def new_id():
+        return f"{time.strftime('%Y%m%dT%H%M%S')}-{uuid.uuid4().hex[:8]}"
+
+    def path_for(self, profile_id, kind):
+        if not PROFILE_ID_RE.match(profile_id or "") or kind not in ("json", "pstats", "collapsed"):
+            return None
+        return os.path.join(self.root, f"{profile_id}.{kind}")
+
+    def save(self, meta, profile=None, stacks=None):
+        """
+        Write one profile and enforce the bounds.
+
+        Args:
+            meta: JSON-serializable request details
+            profile: cProfile.Profile, optional
+            stacks: Counter of collapsed stacks, optional
+
+        Returns:
+            str: The profile ID
+        """
+        profile_id = self.new_id()
+        files = []
+        if profile is not None:
+            profile.dump_stats(self.path_for(profile_id, "pstats"))
+            files.append("pstats")
+        if stacks:
+            with open(self.path_for(profile_id, "collapsed"), "w", encoding="utf-8") as f:
+                for stack, count in stacks.most_common():
+                    f.write(f"{stack} {count}\n")
+            files.append("collapsed")
+        # Metadata last: a profile is listed only once its data is on disk
+        with open(self.path_for(profile_id, "json"), "w", encoding="utf-8") as f:
+            json.dump({**meta, "id": profile_id, "files": files}, f)
+        self._enforce_bounds()
+        return profile_id
+
+    def list(self):
+        """Metadata of every stored profile, newest first."""
+        profiles = []
+        for name in os.listdir(self.root):
+            if name.endswith(".json"):
+                try:
+                    with open(os.path.join(self.root, name), encoding="utf-8") as f:
+                        profiles.append(json.load(f))
+                except (OSError, ValueError):
+                    continue
+        profiles.sort(key=lambda p: p["id"], reverse=True)
+        return profiles
+
+    def _enforce_bounds(self):
+        with self._lock:
+            groups = {}
+            for entry in os.scandir(self.root):
+                profile_id = entry.name.rsplit(".", 1)[0]
+                groups.setdefault(profile_id, []).append(entry)
+            ordered = sorted(groups)  # IDs start with a timestamp
+            total = sum(e.stat().st_size for entries in groups.values() for e in entries)
+            while ordered and (len(ordered) > self.max_profiles or total > self.max_bytes):
+                for entry in groups[ordered.pop(0)]:
+                    try:
+                        total -= entry.stat().st_size
+                        os.remove(entry.path)
+                    except FileNotFoundError:
+                        pass
+
+
+class RequestProfiler:
+    """
+    Opt-in request profiling.
+
+    A ``sample_rate`` share of matching requests is profiled with cProfile
+    (deterministic, pstats output) plus the stack sampler. With
+    ``slow_ms`` every matching request is stack-sampled, and the profile is
+    kept only if the request took at least that long. Only one request at a
+    time can hold cProfile; others overlapping it get stack samples only.
+    """
+
+    def __init__(self, store, sample_rate=0.0, slow_ms=0, paths=(), interval=0.005):
+        self.store = store
+        self.sample_rate = sample_rate
+        self.slow_ms = slow_ms
+        self.paths = tuple(paths)
+        self.sampler = StackSampler(interval)
+        self._cprofile_lock = threading.Lock()
+
+    def matches(self, path):
+        return not self.paths or path.startswith(self.paths)
+
+    def begin(self):
+        if not self.matches(request.path):
+            return
+        sampled = self.sample_rate > 0 and random.random() < self.sample_rate
+        if not sampled and not self.slow_ms:
+            return
+
+        state = {"started": time.perf_counter(), "sampled": sampled, "ident": threading.get_ident(), "profile": None}
+        self.sampler.start(state["ident"])
+        if sampled and self._cprofile_lock.acquire(blocking=False):
+            state["profile"] = cProfile.Profile()
+            state["profile"].enable()
+        g.profiling = state
+
+    def end(self, exc=None):
+        state = g.pop("profiling", None)
+        if state is None:
+            return
+        profile = state["profile"]
+        if profile is not None:
+            profile.disable()
+            self._cprofile_lock.release()
+        stacks = self.sampler.stop(state["ident"])
+        elapsed_ms = (time.perf_counter() - state["started"]) * 1000
+
+        slow = self.slow_ms and elapsed_ms >= self.slow_ms
+        if not (state["sampled"] or slow):
+            return
+        meta = {
+            "method": request.method,
+            "path": request.path,
+            "duration_ms": round(elapsed_ms, 1),
+            "reason": "slow" if slow else "sampled",
+            "error": repr(exc) if exc is not None else None,
+            "created": time.time(),
+            "samples": sum(stacks.values()),
+        }
+        try:
+            profile_id = self.store.save(meta, profile, stacks)
+            print(f"[PROFILE] Saved {meta['reason']} profile {profile_id} for {request.path} ({elapsed_ms:.0f} ms)")
+        except OSError as e:
+            logger.warning(f"Could not save profile: {e}")
+
+
+# Accepted ?sort= values for pstats reports
+PSTATS_SORT_KEYS = frozenset(key.value for key in pstats.SortKey)
+
+
+def pstats_text(path, sort="cumulative", limit=60):
+    """Human-readable pstats report for a stored profile."""
+    out = io.StringIO()
+    stats = pstats.Stats(path, stream=out)
+    stats.strip_dirs().sort_stats(sort).print_stats(limit)
+    return out.getvalue()
+
+
+def init_profiler(app, config):
+    """Attach the request profiler when PROFILE_ENABLED is set."""
+    store = ProfileStore(
+        config.PROFILE_DIR,
+        max_profiles=config.PROFILE_MAX_PROFILES,
+        max_bytes=config.PROFILE_MAX_BYTES,
+    )
+    profiler = RequestProfiler(
+        store,
+        sample_rate=config.PROFILE_SAMPLE_RATE,
+        slow_ms=config.PROFILE_SLOW_MS,
+        paths=[p.strip() for p in config.PROFILE_PATHS.split(",") if p.strip()],
+        interval=config.PROFILE_INTERVAL_MS / 1000.0,
+    )
+    app.extensions["profiler"] = profiler
+    if not config.ADMIN_TOKEN:
+        logger.warning("PROFILE_ENABLED without ADMIN_TOKEN: profiles are recorded but /admin stays closed")
+    app.before_request(profiler.begin)
+    # Teardown runs after streamed bodies finish, so the whole response is covered
+    app.teardown_request(profiler.end)
@@ -0,0 +1,9 @@
+"""
+WSGI entry point for production servers, e.g. ``gunicorn app.wsgi:app``.
+
+``python -m app.serve`` runs gunicorn with the worker, thread and shutdown
+settings from Config.
+"""
+from . import create_app
+
+app = create_app()
@@ -0,0 +1,101 @@
+"""
+Micro-benchmark for PDF rendering throughput.
+
+Renders the analysis report and the improved-resume PDF repeatedly and
+prints renders per second. Pieces that only exist in newer trees (the local
+analyzer, in-memory rendering) fall back or are skipped when missing, so
+the same script can be run against an older checkout to compare before
+and after:
+
+    python benchmarks/bench_pdf_render.py [--iterations 200]
+"""
+import argparse
+import io
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.analyzers.ai_engine import AIEngine
+from app.analyzers.scoring_engine import ScoringEngine
+from app.config import Config
+from app.generators.pdf_generator import PDFReportGenerator
+from app.generators.resume_generator import ATSResumeGenerator
+
+RESUME = """Jane Doe
+jane.doe@example.com | +1 (555) 010-2030
+Summary
+Senior backend engineer with 8 years building payment platforms.
+Experience
+Senior Software Engineer, Acme Corp, Jan 2019 - Present
+- Led migration of 40 services to Kubernetes, cutting infra cost by 30%
+- Built event-driven settlement pipeline on Kafka handling 2M events/day
+Software Engineer, Globex, Jun 2015 - Dec 2018
+- Designed PostgreSQL sharding for 500M rows
+Skills
+Python, Go, SQL, PostgreSQL, AWS, Kubernetes, Terraform, Kafka
+Education
+B.S. Computer Science, State University, 2015
+"""
+
+JD = """Senior Backend Engineer
+Requirements:
+- 5+ years of backend engineering with Python and SQL
+- AWS, Kubernetes and Terraform
+- Kafka or other event streaming
+Responsibilities:
+- Design and operate high-throughput payment services
+"""
+
+
+def bench(label, fn, iterations):
+    fn()  # warm-up (fonts, style registries)
+    started = time.perf_counter()
+    for _ in range(iterations):
+        fn()
+    elapsed = time.perf_counter() - started
+    print(f"{label:<40} {iterations / elapsed:8.1f} renders/s  {elapsed / iterations * 1000:7.2f} ms/render")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--iterations", type=int, default=200)
+    args = parser.parse_args()
+
+    config = vars(Config())
+    out_dir = tempfile.mkdtemp(prefix="bench_pdf_")
+    config["DOWNLOADS_FOLDER"] = out_dir
+
+    scorer = ScoringEngine(config)
+    try:
+        from app.analyzers.local_analyzer import LocalAnalyzer
+    except ImportError:
+        # Older checkouts have no local analyzer; the demo analysis renders the same report
+        raw = AIEngine(config).generate_mock_analysis(RESUME, JD)
+    else:
+        raw = LocalAnalyzer().analyze(RESUME, JD)
+    analysis = scorer.apply_weights(raw)
+    matrix = scorer.to_matrix(analysis)
+
+    report = PDFReportGenerator(config)
+    generator = ATSResumeGenerator(config)
+    resume_data = generator._generate_template_resume(RESUME, {"suggestions": []})
+
+    bench("report: generate_report (disk)", lambda: report.generate_report(analysis, matrix), args.iterations)
+    if hasattr(report, "render_report"):
+        bench("report: render_report (memory)", lambda: report.render_report(analysis, matrix), args.iterations)
+
+    resume_path = os.path.join(out_dir, "resume.pdf")
+    bench("resume: create_pdf (disk)", lambda: generator.create_pdf(resume_data, resume_path), args.iterations)
+    try:
+        generator.create_pdf(resume_data, io.BytesIO())
+    except Exception:
+        pass
+    else:
+        bench("resume: create_pdf (memory)", lambda: generator.create_pdf(resume_data, io.BytesIO()), args.iterations)
+
+
+if __name__ == "__main__":
+    main()
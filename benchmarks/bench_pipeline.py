@@ -0,0 +1,204 @@
+"""
+Benchmark suite for every pipeline stage.
+
+Times the parsers, offline analysis, scoring, report rendering and resume
+building over a synthetic corpus (see corpus.py) at several page counts,
+and writes JSON results tagged with the git commit. Stages that do not
+exist in the checkout being measured are skipped, and parsers without the
+bytes API read a temporary file instead, so the suite can be run on an
+older commit and the two result files compared:
+
+    python benchmarks/bench_pipeline.py --output before.json
+    (checkout another commit)
+    python benchmarks/bench_pipeline.py --output after.json --compare before.json
+
+Options: --pages 1 5 15 30, --min-time 0.5 (seconds per case),
+--min-runs 5, --only parse_pdf,create_pdf
+"""
+import argparse
+import copy
+import io
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from corpus import build_corpus  # noqa: E402
+
+from app.analyzers.ai_engine import AIEngine  # noqa: E402
+from app.analyzers.scoring_engine import ScoringEngine  # noqa: E402
+from app.config import Config  # noqa: E402
+from app.generators.pdf_generator import PDFReportGenerator  # noqa: E402
+from app.generators.resume_generator import ATSResumeGenerator  # noqa: E402
+from app.parsers.docx_parser import DOCXParser  # noqa: E402
+from app.parsers.pdf_parser import PDFParser  # noqa: E402
+
+# Results whose median moved by more than this fraction are flagged by --compare
+THRESHOLD = 0.10
+
+
+def measure(fn, min_time, min_runs):
+    """
+    Time ``fn`` after one warm-up call until both min_time and min_runs are reached.
+
+    Returns:
+        dict: Run count and latency statistics in milliseconds
+    """
+    fn()
+    samples = []
+    started = time.perf_counter()
+    while len(samples) < min_runs or time.perf_counter() - started < min_time:
+        t0 = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - t0) * 1000)
+    samples.sort()
+    return {
+        "runs": len(samples),
+        "median_ms": round(statistics.median(samples), 4),
+        "mean_ms": round(statistics.fmean(samples), 4),
+        "p95_ms": round(samples[min(len(samples) - 1, int(len(samples) * 0.95))], 4),
+        "min_ms": round(samples[0], 4),
+        "stdev_ms": round(statistics.stdev(samples), 4) if len(samples) > 1 else 0.0,
+    }
+
+
+def parse_case(parser_cls, data, path):
+    """
+    Parse ``data`` from memory, or from a file at ``path`` on trees without
+    the bytes API (older checkouts only have ``extract_text(path)``).
+    """
+    if hasattr(parser_cls, "extract_text_from_bytes"):
+        return lambda: parser_cls.extract_text_from_bytes(data)
+    with open(path, "wb") as f:
+        f.write(data)
+    return lambda: parser_cls.extract_text(path)
+
+
+def cases(corpus, config):
+    """
+    Yield (name, callable) for every stage and page count.
+
+    Stage names are stable across commits; the page count is part of the name.
+    """
+    engine = AIEngine(config)
+    scorer = ScoringEngine(config)
+    report = PDFReportGenerator(config)
+    generator = ATSResumeGenerator(config)
+    spool_dir = config["DOWNLOADS_FOLDER"]
+
+    for pages, docs in corpus.items():
+        resume, jd = docs["resume"], docs["jd"]
+        tag = f"pages={pages}"
+
+        yield f"parse_pdf/{tag}", parse_case(PDFParser, resume["pdf"], os.path.join(spool_dir, f"resume_{pages}.pdf"))
+        yield f"parse_docx/{tag}", parse_case(DOCXParser, resume["docx"], os.path.join(spool_dir, f"resume_{pages}.docx"))
+        if hasattr(engine, "skills"):
+            yield f"extract_skills/{tag}", lambda text=resume["text"]: engine.skills.extract(text)
+        yield f"generate_mock_analysis/{tag}", (
+            lambda text=resume["text"]: engine.generate_mock_analysis(text, corpus[min(corpus)]["jd"]["text"])
+        )
+
+        analysis = scorer.apply_weights(engine.generate_mock_analysis(resume["text"], jd["text"]))
+        matrix = scorer.to_matrix(analysis)
+        if pages == min(corpus):
+            # Scoring does not depend on document size; measure it once
+            fresh = copy.deepcopy(analysis)
+            yield "apply_weights", lambda a=fresh: scorer.apply_weights(a)
+            yield "to_matrix", lambda a=analysis: scorer.to_matrix(a)
+            yield "generate_report", lambda a=analysis, m=matrix: report.generate_report(a, m)
+            if hasattr(report, "render_report"):
+                yield "render_report", lambda a=analysis, m=matrix: report.render_report(a, m)
+
+        resume_data = generator._generate_template_resume(resume["text"], {"suggestions": []})
+        yield f"create_docx/{tag}", lambda d=resume_data: generator.create_docx(d, io.BytesIO())
+        yield f"create_pdf/{tag}", lambda d=resume_data: generator.create_pdf(d, io.BytesIO())
+
+
+def git_info():
+    def git(*args):
+        try:
+            return subprocess.run(["git", *args], cwd=ROOT, capture_output=True, text=True).stdout.strip()
+        except OSError:
+            return ""
+    return {"commit": git("rev-parse", "HEAD"), "dirty": bool(git("status", "--porcelain", "--", "app"))}
+
+
+def compare(baseline, results):
+    """Print median changes against a previous result file (to stderr); returns the regressed cases."""
+    regressions = []
+    print(f"\n{'case':<36}{'before ms':>12}{'after ms':>12}{'change':>10}", file=sys.stderr)
+    for name, result in results.items():
+        before = baseline["results"].get(name)
+        if before is None:
+            print(f"{name:<36}{'-':>12}{result['median_ms']:>12.3f}{'new':>10}", file=sys.stderr)
+            continue
+        change = result["median_ms"] / before["median_ms"] - 1 if before["median_ms"] else 0.0
+        flag = ""
+        if change > THRESHOLD:
+            flag = "  slower"
+            regressions.append(name)
+        elif change < -THRESHOLD:
+            flag = "  faster"
+        print(f"{name:<36}{before['median_ms']:>12.3f}{result['median_ms']:>12.3f}{change:>+10.1%}{flag}", file=sys.stderr)
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--pages", type=int, nargs="+", default=[1, 5, 15, 30])
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--min-time", type=float, default=0.5, help="seconds to spend per case")
+    parser.add_argument("--min-runs", type=int, default=5)
+    parser.add_argument("--only", help="comma-separated stage names (e.g. parse_pdf,create_pdf)")
+    parser.add_argument("--output", help="write JSON results here (default: stdout)")
+    parser.add_argument("--compare", help="previous JSON result file to compare against")
+    args = parser.parse_args()
+
+    only = set(args.only.split(",")) if args.only else None
+    corpus = build_corpus(sorted(args.pages), args.seed)
+    results = {}
+    with tempfile.TemporaryDirectory(prefix="bench_pipeline_") as out_dir:
+        config = vars(Config())
+        config["DOWNLOADS_FOLDER"] = out_dir
+        for name, fn in cases(corpus, config):
+            if only and name.split("/")[0] not in only:
+                continue
+            results[name] = measure(fn, args.min_time, args.min_runs)
+            print(f"{name:<36}{results[name]['median_ms']:>10.3f} ms  (p95 {results[name]['p95_ms']:.3f}, "
+                  f"{results[name]['runs']} runs)", file=sys.stderr)
+
+    output = {
+        "meta": {
+            "git": git_info(),
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "pages": sorted(args.pages),
+            "seed": args.seed,
+            "min_time": args.min_time,
+        },
+        "results": results,
+    }
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(output, f, indent=2)
+    else:
+        print(json.dumps(output, indent=2))
+
+    if args.compare:
+        with open(args.compare) as f:
+            regressions = compare(json.load(f), results)
+        if regressions:
+            print(f"\n{len(regressions)} case(s) slower by more than {THRESHOLD:.0%}", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
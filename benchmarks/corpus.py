@@ -0,0 +1,177 @@
+"""
+Synthetic resume / job-description corpus for the benchmarks.
+
+Generates deterministic documents of a given page count as plain text,
+PDF (reportlab, one text page per PDF page) and DOCX (python-docx, a page
+break between pages). The same seed always yields the same corpus, so
+timings from different commits are comparable:
+
+    python benchmarks/corpus.py OUT_DIR [--pages 1 5 15 30] [--seed 7]
+"""
+import argparse
+import io
+import os
+import random
+import textwrap
+
+LINES_PER_PAGE = 48
+LINE_WIDTH = 95
+
+SKILLS = [
+    "Python", "Go", "Java", "SQL", "PostgreSQL", "MySQL", "Redis", "Kafka", "AWS", "GCP", "Azure",
+    "Kubernetes", "Docker", "Terraform", "Ansible", "Linux", "React", "TypeScript", "GraphQL",
+    "REST APIs", "gRPC", "Spark", "Airflow", "dbt", "Snowflake", "machine learning", "PyTorch",
+    "TensorFlow", "CI/CD", "Jenkins", "GitHub Actions", "Prometheus", "Grafana", "Elasticsearch",
+]
+TITLES = ["Software Engineer", "Senior Software Engineer", "Backend Engineer", "Data Engineer",
+          "Platform Engineer", "Site Reliability Engineer", "Staff Engineer", "Engineering Manager"]
+COMPANIES = ["Acme Corp", "Globex", "Initech", "Umbrella", "Hooli", "Stark Industries", "Wayne Enterprises",
+             "Cyberdyne", "Soylent", "Tyrell Corp", "Vandelay Industries", "Massive Dynamic"]
+VERBS = ["Led", "Built", "Designed", "Migrated", "Automated", "Reduced", "Scaled", "Launched",
+         "Optimized", "Mentored", "Owned", "Rebuilt"]
+OBJECTS = ["the payments platform", "an event-driven settlement pipeline", "the CI/CD system",
+           "a multi-region Kubernetes cluster", "the customer data warehouse", "internal developer tooling",
+           "the search ranking service", "a real-time fraud detection model", "the observability stack"]
+OUTCOMES = ["cutting infrastructure cost by {n}%", "serving {n}M requests per day",
+            "improving p99 latency by {n}%", "reducing deploy time from hours to {n} minutes",
+            "supporting {n} product teams", "raising test coverage to {n}%"]
+
+
+def _wrap(lines):
+    wrapped = []
+    for line in lines:
+        wrapped.extend(textwrap.wrap(line, LINE_WIDTH) or [""])
+    return wrapped
+
+
+def _paginate(lines, pages):
+    """Cut ``lines`` into exactly ``pages`` pages of LINES_PER_PAGE lines."""
+    lines = lines[:pages * LINES_PER_PAGE]
+    return [lines[i:i + LINES_PER_PAGE] for i in range(0, len(lines), LINES_PER_PAGE)]
+
+
+def resume_pages(pages, seed=7):
+    """
+    Build a synthetic resume spanning ``pages`` pages.
+
+    Returns:
+        list: One list of text lines per page
+    """
+    rng = random.Random(f"resume-{seed}-{pages}")
+    lines = [
+        "Jordan Example",
+        "jordan.example@example.com | +1 (555) 010-2030 | Austin, TX",
+        "",
+        "Summary",
+        f"{rng.choice(TITLES)} with {rng.randint(3, 20)} years of experience in "
+        f"{', '.join(rng.sample(SKILLS, 5))}.",
+        "",
+        "Skills",
+        ", ".join(rng.sample(SKILLS, 15)),
+        "",
+        "Experience",
+    ]
+    year = 2026
+    while len(_wrap(lines)) < pages * LINES_PER_PAGE:
+        start = year - rng.randint(1, 4)
+        lines.append(f"{rng.choice(TITLES)}, {rng.choice(COMPANIES)}, Jan {start} - Dec {year}")
+        for _ in range(rng.randint(4, 7)):
+            outcome = rng.choice(OUTCOMES).format(n=rng.randint(5, 90))
+            tools = " and ".join(rng.sample(SKILLS, 2))
+            lines.append(f"- {rng.choice(VERBS)} {rng.choice(OBJECTS)} with {tools}, {outcome}")
+        lines.append("")
+        year = start
+    lines += ["Education", "B.S. Computer Science, State University, 2012"]
+    return _paginate(_wrap(lines), pages)
+
+
+def jd_pages(pages, seed=7):
+    """Build a synthetic job description spanning ``pages`` pages (one list of lines per page)."""
+    rng = random.Random(f"jd-{seed}-{pages}")
+    title = rng.choice(TITLES)
+    lines = [title, "", "About the role",
+             f"We are hiring a {title} to work on {rng.choice(OBJECTS)}.", "", "Requirements:"]
+    lines += [f"- {rng.randint(2, 8)}+ years with {skill}" for skill in rng.sample(SKILLS, 8)]
+    lines += ["", "Responsibilities:"]
+    while len(_wrap(lines)) < pages * LINES_PER_PAGE:
+        lines.append(f"- {rng.choice(VERBS)} {rng.choice(OBJECTS)} using {rng.choice(SKILLS)}")
+    return _paginate(_wrap(lines), pages)
+
+
+def to_text(pages):
+    return "\n".join("\n".join(page) for page in pages)
+
+
+def to_pdf(pages):
+    """Render pages of text lines to PDF bytes, one PDF page per page."""
+    from reportlab.lib.pagesizes import letter
+    from reportlab.pdfgen import canvas
+
+    buffer = io.BytesIO()
+    pdf = canvas.Canvas(buffer, pagesize=letter)
+    _, height = letter
+    for page in pages:
+        text = pdf.beginText(50, height - 50)
+        text.setFont("Helvetica", 9)
+        for line in page:
+            text.textLine(line)
+        pdf.drawText(text)
+        pdf.showPage()
+    pdf.save()
+    return buffer.getvalue()
+
+
+def to_docx(pages):
+    """Render pages of text lines to DOCX bytes, with section headings and page breaks."""
+    from docx import Document
+
+    doc = Document()
+    headings = {"Summary", "Skills", "Experience", "Education", "About the role", "Requirements:", "Responsibilities:"}
+    for number, page in enumerate(pages):
+        if number:
+            doc.add_page_break()
+        for line in page:
+            if line in headings:
+                doc.add_heading(line, level=2)
+            else:
+                doc.add_paragraph(line)
+    buffer = io.BytesIO()
+    doc.save(buffer)
+    return buffer.getvalue()
+
+
+def build_corpus(page_counts, seed=7):
+    """
+    Generate the corpus in memory.
+
+    Returns:
+        dict: pages -> {"resume"|"jd": {"text": str, "pdf": bytes, "docx": bytes}}
+    """
+    corpus = {}
+    for pages in page_counts:
+        corpus[pages] = {}
+        for kind, builder in (("resume", resume_pages), ("jd", jd_pages)):
+            content = builder(pages, seed)
+            corpus[pages][kind] = {"text": to_text(content), "pdf": to_pdf(content), "docx": to_docx(content)}
+    return corpus
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("out_dir")
+    parser.add_argument("--pages", type=int, nargs="+", default=[1, 5, 15, 30])
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    os.makedirs(args.out_dir, exist_ok=True)
+    for pages, docs in build_corpus(args.pages, args.seed).items():
+        for kind, formats in docs.items():
+            for ext, data in formats.items():
+                path = os.path.join(args.out_dir, f"{kind}_{pages}p.{'txt' if ext == 'text' else ext}")
+                with open(path, "w" if ext == "text" else "wb") as f:
+                    f.write(data)
+                print(path)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+"""
+Import-time report for the app (``python -X importtime`` style).
+
+Runs each stage in a fresh interpreter with ``-X importtime``, then prints
+the total import time and the cumulative time of the heavy third-party
+packages (PyMuPDF, reportlab, python-docx, openai, ...). Works against any
+checkout, so it can be run before and after a change to compare:
+
+    python benchmarks/import_report.py [--repeat 3] [--top 15] [--json]
+
+Stages run in a temporary working directory without OPENAI_API_KEY, so
+create_app() does not touch the real uploads/downloads folders.
+"""
+import argparse
+import json
+import os
+import re
+import subprocess
+import sys
+import tempfile
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+STAGES = {
+    "import app": "import app",
+    "create_app()": "from app import create_app; create_app()",
+}
+
+HEAVY = ("pymupdf", "reportlab", "docx", "openai", "pydantic", "httpx", "pymongo", "flask")
+# Import names that belong to another distribution's package
+ALIASES = {"fitz": "pymupdf"}
+
+LINE_RE = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)$")
+
+
+def run_stage(statement, workdir):
+    """
+    Import ``statement`` once with -X importtime.
+
+    Returns:
+        list: (module, self_us, cumulative_us, depth) tuples in report order
+    """
+    env = dict(os.environ, PYTHONPATH=ROOT, OPENAI_API_KEY="")
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        cwd=workdir, env=env, capture_output=True, text=True,
+    )
+    if proc.returncode != 0:
+        raise RuntimeError(f"{statement!r} failed:\n{proc.stderr[-2000:]}")
+
+    rows = []
+    for line in proc.stderr.splitlines():
+        match = LINE_RE.match(line)
+        if match:
+            self_us, cumulative_us, indent, module = match.groups()
+            rows.append((module, int(self_us), int(cumulative_us), len(indent) // 2))
+    return rows
+
+
+def summarize(rows, top):
+    """Total time, self time summed per heavy package, and the slowest modules."""
+    heavy = {}
+    for module, self_us, _, _ in rows:
+        package = module.split(".")[0]
+        package = ALIASES.get(package, package)
+        if package in HEAVY:
+            heavy[package] = heavy.get(package, 0) + self_us
+    slowest = sorted(rows, key=lambda r: r[1], reverse=True)[:top]
+    return {
+        "total_ms": round(sum(r[1] for r in rows) / 1000, 1),
+        "modules": len(rows),
+        "heavy_ms": {name: round(us / 1000, 1) for name, us in sorted(heavy.items())},
+        "slowest_self_ms": [(module, round(self_us / 1000, 1)) for module, self_us, _, _ in slowest],
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--repeat", type=int, default=3, help="runs per stage; the fastest is reported")
+    parser.add_argument("--top", type=int, default=10, help="slowest modules to list")
+    parser.add_argument("--json", action="store_true", help="print machine-readable output")
+    args = parser.parse_args()
+
+    report = {}
+    with tempfile.TemporaryDirectory(prefix="import_report_") as workdir:
+        for stage, statement in STAGES.items():
+            runs = [summarize(run_stage(statement, workdir), args.top) for _ in range(args.repeat)]
+            report[stage] = min(runs, key=lambda r: r["total_ms"])
+
+    if args.json:
+        print(json.dumps(report, indent=2))
+        return
+
+    for stage, summary in report.items():
+        print(f"== {stage}: {summary['total_ms']} ms across {summary['modules']} modules")
+        loaded = summary["heavy_ms"]
+        for name in HEAVY:
+            status = f"{loaded[name]:8.1f} ms" if name in loaded else "  not loaded"
+            print(f"   {name:<12}{status}")
+        print("   slowest (self time):")
+        for module, ms in summary["slowest_self_ms"]:
+            print(f"     {ms:8.1f} ms  {module}")
+
+
+if __name__ == "__main__":
+    main()
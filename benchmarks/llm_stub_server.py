@@ -0,0 +1,286 @@
+"""
+OpenAI-compatible stub server for offline load tests.
+
+Answers POST .../chat/completions (streamed or not) with schema-valid JSON
+for the analysis, suggestions and resume prompts, after a latency drawn
+from a configurable distribution. It can inject server errors and 429 rate
+limits (randomly and/or above a requests-per-minute budget) so retries and
+fallbacks are exercised. Point the app at it:
+
+    python benchmarks/llm_stub_server.py --port 8900 --latency lognormal:900,0.4 \\
+        --error-rate 0.01 --rate-limit-rate 0.02 --rpm 600
+    OPENAI_API_KEY=stub OPENAI_BASE_URL=http://127.0.0.1:8900/v1 LLM_CACHE_ENABLED=false python -m app.serve
+
+Latency specs (milliseconds): fixed:MS, uniform:LOW,HIGH, normal:MEAN,STDDEV,
+lognormal:MEDIAN,SIGMA, exp:MEAN. GET /stats returns request counters and
+latency percentiles. With --seed the injected latencies, errors and
+answers are reproducible.
+"""
+import argparse
+import json
+import math
+import random
+import re
+import sys
+import threading
+import time
+import uuid
+from collections import deque
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+PARAMETER_RE = re.compile(r'"(\w+)": \{"score"')
+
+
+def parse_latency(spec):
+    """
+    Parse a latency spec into a sampler.
+
+    Returns:
+        callable: rng -> latency in seconds
+    """
+    kind, _, args = spec.partition(":")
+    values = [float(v) for v in args.split(",") if v]
+    samplers = {
+        "fixed": lambda rng: values[0],
+        "uniform": lambda rng: rng.uniform(values[0], values[1]),
+        "normal": lambda rng: max(0.0, rng.gauss(values[0], values[1])),
+        "lognormal": lambda rng: rng.lognormvariate(math.log(values[0]), values[1]),
+        "exp": lambda rng: rng.expovariate(1.0 / values[0]),
+    }
+    if kind not in samplers:
+        raise argparse.ArgumentTypeError(f"unknown latency distribution {kind!r}")
+    sampler = samplers[kind]
+    return lambda rng: sampler(rng) / 1000.0
+
+
+def canned_content(prompt, rng):
+    """Build a plausible JSON answer for whichever app prompt this is."""
+    if '"parameters"' in prompt:
+        names = PARAMETER_RE.findall(prompt) or ["skills_match"]
+        return json.dumps({
+            "parameters": {
+                name: {
+                    "score": rng.randint(40, 95),
+                    "rationale": f"Stub rationale for {name.replace('_', ' ')}.",
+                    "examples": ["Python", "SQL"],
+                }
+                for name in names
+            },
+            "strengths": ["Relevant experience", "Strong technical skills", "Clear formatting"],
+            "improvements": ["Quantify achievements", "Add missing keywords", "Tighten summary"],
+            "missing_elements": ["Kubernetes", "Terraform"],
+            "summary": "Stub analysis: solid overall fit with a few gaps.",
+        })
+    if '"suggestions": [' in prompt:
+        return json.dumps({
+            "suggestions": [
+                {
+                    "area": area,
+                    "what_to_change": f"Strengthen {area.lower()}.",
+                    "before": "Not currently present",
+                    "after": f"Improved {area.lower()} with measurable results.",
+                    "rationale": "Recruiters and ATS filters look for it.",
+                }
+                for area in ("Achievements", "Keywords", "Summary")
+            ],
+            "_is_demo": False,
+        })
+    if '"contact"' in prompt:
+        return json.dumps({
+            "contact": {"name": "Jordan Example", "email": "jordan@example.com", "phone": "+1 555 010 2030",
+                        "location": "Austin, TX"},
+            "summary": "Backend engineer with a record of shipping reliable, measurable improvements.",
+            "experience": [{
+                "title": "Senior Software Engineer", "company": "Acme Corp", "location": "Remote",
+                "dates": "2019 - Present",
+                "achievements": ["Cut infrastructure cost by 30%", "Scaled settlement pipeline to 2M events/day"],
+            }],
+            "skills": {"Technical": ["Python", "SQL", "AWS"], "Competencies": ["Mentoring", "System design"]},
+            "education": [{"degree": "B.S. Computer Science", "institution": "State University", "year": "2012"}],
+            "certifications": [],
+        })
+    return json.dumps({"message": "stub response"})
+
+
+class StubState:
+    def __init__(self, args):
+        self.args = args
+        self.latency = parse_latency(args.latency)
+        self.rng = random.Random(args.seed)
+        self.lock = threading.Lock()
+        self.window = deque()  # request times inside the last minute, for --rpm
+        self.counts = {"requests": 0, "ok": 0, "rate_limited": 0, "errors": 0}
+        self.latencies = deque(maxlen=10000)
+
+    def decide(self):
+        """Pick the outcome of one request: ("ok", latency, rng) / ("429", ...) / ("500", ...)."""
+        with self.lock:
+            self.counts["requests"] += 1
+            now = time.monotonic()
+            while self.window and now - self.window[0] > 60:
+                self.window.popleft()
+            over_budget = self.args.rpm and len(self.window) >= self.args.rpm
+            if not over_budget:
+                self.window.append(now)
+
+            roll = self.rng.random()
+            if over_budget or roll < self.args.rate_limit_rate:
+                self.counts["rate_limited"] += 1
+                return "429", 0.0, None
+            if roll < self.args.rate_limit_rate + self.args.error_rate:
+                self.counts["errors"] += 1
+                return "500", self.latency(self.rng), None
+            self.counts["ok"] += 1
+            # Each answer gets its own generator so concurrent requests stay reproducible
+            return "ok", self.latency(self.rng), random.Random(self.rng.random())
+
+    def stats(self):
+        with self.lock:
+            samples = sorted(self.latencies)
+            counts = dict(self.counts)
+        pct = lambda q: round(samples[min(len(samples) - 1, int(len(samples) * q))] * 1000, 1) if samples else None
+        return {**counts, "latency_ms": {"p50": pct(0.5), "p95": pct(0.95), "p99": pct(0.99)}}
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    state = None
+
+    def log_message(self, fmt, *args):
+        if not self.state.args.quiet:
+            super().log_message(fmt, *args)
+
+    def do_GET(self):
+        if self.path.rstrip("/").endswith("/models"):
+            self._json(200, {"object": "list", "data": [{"id": "gpt-4o-mini", "object": "model"}]})
+        elif self.path == "/stats":
+            self._json(200, self.state.stats())
+        else:
+            self._json(404, {"error": {"message": "not found"}})
+
+    def do_POST(self):
+        body = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        if not self.path.rstrip("/").endswith("/chat/completions"):
+            self._json(404, {"error": {"message": "not found"}})
+            return
+        try:
+            payload = json.loads(body)
+        except ValueError:
+            self._json(400, {"error": {"message": "invalid JSON", "type": "invalid_request_error"}})
+            return
+
+        outcome, latency, rng = self.state.decide()
+        if outcome == "429":
+            self._json(429, {"error": {"message": "Rate limit reached (stub)", "type": "requests",
+                                       "code": "rate_limit_exceeded"}},
+                       headers={"Retry-After": str(self.state.args.retry_after)})
+            return
+        if outcome == "500":
+            time.sleep(latency)
+            self._json(500, {"error": {"message": "Injected server error (stub)", "type": "server_error"}})
+            return
+
+        started = time.monotonic()
+        prompt = "\n".join(str(m.get("content", "")) for m in payload.get("messages", []))
+        content = canned_content(prompt, rng)
+        model = payload.get("model", "gpt-4o-mini")
+        if payload.get("stream"):
+            self._stream(content, model, latency)
+        else:
+            time.sleep(latency)
+            self._json(200, {
+                "id": f"chatcmpl-{uuid.uuid4().hex}",
+                "object": "chat.completion",
+                "created": int(time.time()),
+                "model": model,
+                "choices": [{"index": 0, "message": {"role": "assistant", "content": content},
+                             "finish_reason": "stop"}],
+                "usage": {"prompt_tokens": len(prompt) // 4, "completion_tokens": len(content) // 4,
+                          "total_tokens": (len(prompt) + len(content)) // 4},
+            })
+        with self.state.lock:
+            self.state.latencies.append(time.monotonic() - started)
+
+    def _stream(self, content, model, latency):
+        """Send the answer as SSE chunks: the first after a share of the latency, the rest spread evenly."""
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Transfer-Encoding", "chunked")
+        self.end_headers()
+
+        size = self.state.args.chunk_chars
+        pieces = [content[i:i + size] for i in range(0, len(content), size)]
+        first = latency * self.state.args.ttft_share
+        gap = (latency - first) / max(1, len(pieces))
+        chunk_id = f"chatcmpl-{uuid.uuid4().hex}"
+
+        def event(delta, finish=None):
+            return {"id": chunk_id, "object": "chat.completion.chunk", "created": int(time.time()), "model": model,
+                    "choices": [{"index": 0, "delta": delta, "finish_reason": finish}]}
+
+        time.sleep(first)
+        self._chunk(event({"role": "assistant", "content": ""}))
+        for piece in pieces:
+            time.sleep(gap)
+            self._chunk(event({"content": piece}))
+        self._chunk(event({}, "stop"))
+        self._write_chunk(b"data: [DONE]\n\n")
+        self._write_chunk(b"")
+
+    def _chunk(self, data):
+        self._write_chunk(f"data: {json.dumps(data)}\n\n".encode("utf-8"))
+
+    def _write_chunk(self, data):
+        self.wfile.write(f"{len(data):x}\r\n".encode("ascii") + data + b"\r\n")
+        self.wfile.flush()
+
+    def _json(self, status, data, headers=None):
+        body = json.dumps(data).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        for key, value in (headers or {}).items():
+            self.send_header(key, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+
+class StubServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def handle_error(self, request, client_address):
+        # Clients giving up mid-response (timeouts, worker restarts) are expected under load
+        if isinstance(sys.exc_info()[1], (ConnectionResetError, BrokenPipeError)):
+            return
+        super().handle_error(request, client_address)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8900)
+    parser.add_argument("--latency", default="lognormal:900,0.4", help="completion latency distribution (ms)")
+    parser.add_argument("--ttft-share", type=float, default=0.2, help="share of the latency before the first streamed chunk")
+    parser.add_argument("--chunk-chars", type=int, default=40, help="characters per streamed chunk")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="fraction of requests answered with HTTP 500")
+    parser.add_argument("--rate-limit-rate", type=float, default=0.0, help="fraction of requests answered with HTTP 429")
+    parser.add_argument("--rpm", type=int, default=0, help="answer 429 above this many requests per minute (0 = off)")
+    parser.add_argument("--retry-after", type=int, default=1, help="Retry-After seconds sent with 429s")
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--quiet", action="store_true", help="no per-request log lines")
+    args = parser.parse_args()
+    parse_latency(args.latency)
+
+    StubHandler.state = StubState(args)
+    server = StubServer((args.host, args.port), StubHandler)
+    print(f"OpenAI stub listening on http://{args.host}:{args.port}/v1 (latency {args.latency})")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
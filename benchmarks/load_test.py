@@ -0,0 +1,137 @@
+"""
+Closed-loop load test of the full /compare pipeline against a running server.
+
+Run the app against the LLM stub (llm_stub_server.py) or in replay mode
+(LLM_TRANSPORT_MODE=replay), then:
+
+    python benchmarks/load_test.py --url http://127.0.0.1:8081 --concurrency 8 --requests 200
+
+Each worker thread posts a resume/JD pair to /compare as soon as its
+previous request finished. Throughput, latency percentiles and status
+counts are printed as JSON. Without --resume/--jd the documents come from
+the synthetic corpus (corpus.py), so runs are reproducible.
+
+The LLM response cache and the extraction cache answer a repeated document
+pair without doing the work, so by default every request gets its own
+corpus variant (seeds --seed, --seed + 1, ...). With fixed --resume/--jd
+files or --variants below --requests, start the server with
+LLM_CACHE_ENABLED=false and EXTRACTION_CACHE_SIZE=0 to measure the full
+pipeline rather than cache hits.
+"""
+import argparse
+import itertools
+import json
+import os
+import statistics
+import sys
+import threading
+import time
+import urllib.error
+import urllib.request
+import uuid
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from corpus import jd_pages, resume_pages, to_docx, to_pdf  # noqa: E402
+
+
+def multipart(files):
+    """Encode {field: (filename, bytes)} as multipart/form-data; returns (body, content type)."""
+    boundary = uuid.uuid4().hex
+    parts = []
+    for field, (filename, data) in files.items():
+        parts.append(
+            f"--{boundary}\r\nContent-Disposition: form-data; name=\"{field}\"; filename=\"{filename}\"\r\n"
+            f"Content-Type: application/octet-stream\r\n\r\n".encode("utf-8") + data + b"\r\n"
+        )
+    parts.append(f"--{boundary}--\r\n".encode("utf-8"))
+    return b"".join(parts), f"multipart/form-data; boundary={boundary}"
+
+
+def percentile(samples, q):
+    return round(samples[min(len(samples) - 1, int(len(samples) * q))], 1) if samples else None
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--url", default="http://127.0.0.1:8081")
+    parser.add_argument("--path", default="/compare")
+    parser.add_argument("--concurrency", type=int, default=4)
+    parser.add_argument("--requests", type=int, default=50)
+    parser.add_argument("--resume", help="resume file (default: synthetic 2-page PDF)")
+    parser.add_argument("--jd", help="job description file (default: synthetic 1-page DOCX)")
+    parser.add_argument("--variants", type=int, help="distinct corpus document pairs (default: --requests)")
+    parser.add_argument("--seed", type=int, default=7, help="seed of the first corpus variant")
+    parser.add_argument("--timeout", type=float, default=300)
+    args = parser.parse_args()
+
+    def load(path):
+        with open(path, "rb") as f:
+            return os.path.basename(path), f.read()
+
+    # Fixed files are sent as-is; otherwise each variant is a fresh corpus pair
+    variants = 1 if args.resume and args.jd else max(1, min(args.variants or args.requests, args.requests))
+    bodies = []
+    for i in range(variants):
+        seed = args.seed + i
+        bodies.append(multipart({
+            "resume": load(args.resume) if args.resume else ("resume.pdf", to_pdf(resume_pages(2, seed))),
+            "job_description": load(args.jd) if args.jd else ("jd.docx", to_docx(jd_pages(1, seed))),
+        }))
+    if variants < args.requests:
+        print(f"Sending {variants} distinct document pair(s) for {args.requests} requests; disable the LLM "
+              f"and extraction caches on the server or repeats are served from cache", file=sys.stderr)
+    next_body = itertools.cycle(bodies).__next__
+
+    latencies = []
+    statuses = Counter()
+    lock = threading.Lock()
+
+    def one(_):
+        with lock:
+            body, content_type = next_body()
+        request = urllib.request.Request(args.url + args.path, data=body, headers={"Content-Type": content_type})
+        started = time.perf_counter()
+        try:
+            with urllib.request.urlopen(request, timeout=args.timeout) as response:
+                response.read()
+                status = response.status
+        except urllib.error.HTTPError as e:
+            status = e.code
+        except (urllib.error.URLError, TimeoutError) as e:
+            status = type(e).__name__
+        elapsed = (time.perf_counter() - started) * 1000
+        with lock:
+            statuses[str(status)] += 1
+            if status == 200:
+                latencies.append(elapsed)
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=args.concurrency) as pool:
+        list(pool.map(one, range(args.requests)))
+    wall = time.perf_counter() - started
+
+    latencies.sort()
+    print(json.dumps({
+        "url": args.url + args.path,
+        "concurrency": args.concurrency,
+        "requests": args.requests,
+        "variants": variants,
+        "wall_s": round(wall, 2),
+        "throughput_rps": round(args.requests / wall, 2),
+        "status": dict(statuses),
+        "latency_ms": {
+            "mean": round(statistics.fmean(latencies), 1) if latencies else None,
+            "p50": percentile(latencies, 0.50),
+            "p90": percentile(latencies, 0.90),
+            "p95": percentile(latencies, 0.95),
+            "p99": percentile(latencies, 0.99),
+            "max": round(latencies[-1], 1) if latencies else None,
+        },
+    }, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,39 @@
+from app.analyzers.prompt_builder import PromptBuilder, strip_boilerplate
+
+
+def test_duties_mentioning_benefits_and_compliance_are_kept():
+    jd = (
+        "Responsibilities:\n"
+        "- Administer 401(k) and PTO programs for 800 employees.\n"
+        "- Run E-Verify and background checks for new hires.\n"
+        "- Publish the salary range for every posted job."
+    )
+    assert strip_boilerplate(jd) == jd
+
+
+def test_boilerplate_statements_are_dropped():
+    jd = (
+        "Requirements:\n"
+        "- 3+ years of payroll experience.\n"
+        "Acme is an equal opportunity employer. We value curiosity.\n"
+        "We offer medical insurance, a 401(k) match and paid time off.\n"
+        "All qualified applicants are considered regardless of race, color, religion, sex or national origin."
+    )
+    assert strip_boilerplate(jd) == (
+        "Requirements:\n"
+        "- 3+ years of payroll experience.\n"
+        "We value curiosity."
+    )
+
+
+def test_compacted_jd_keeps_hr_requirements():
+    jd = (
+        "Benefits Specialist\n\n"
+        "Responsibilities:\n"
+        "- Administer 401(k) enrollment and reasonable accommodation requests.\n\n"
+        "Benefits:\n"
+        "- Dental\n"
+    )
+    compacted = PromptBuilder({}).compact_job_description(jd, 1000)
+    assert "Administer 401(k) enrollment and reasonable accommodation requests." in compacted
+    assert "Dental" not in compacted